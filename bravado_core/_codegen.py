@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers to generate specialized python functions at runtime.
+
+The generated functions are meant to replace, on hot paths, the chain of
+:func:`functools.partial` objects built by the marshaling and unmarshaling modules.
+"""
+import typing
+
+from bravado_core.util import sanitize_name
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core._compat_typing import Func
+
+
+def make_function_name(prefix, name):
+    # type: (typing.Text, typing.Optional[typing.Text]) -> str
+    """
+    Build a valid python identifier to be used as name of a generated function.
+
+    :param prefix: prefix of the function name (ie. unmarshal)
+    :param name: name of the entity handled by the function (ie. model name)
+    """
+    sanitized_name = sanitize_name(name or '')
+    return str('{0}_{1}'.format(prefix, sanitized_name) if sanitized_name else prefix)
+
+
+def compile_function(function_name, arguments, body_lines, namespace):
+    # type: (str, typing.Sequence[typing.Text], typing.Sequence[typing.Text], typing.Dict[str, typing.Any]) -> Func
+    """
+    Compile a function from its source code.
+
+    :param function_name: name of the function to generate
+    :param arguments: names of the positional arguments of the function
+    :param body_lines: lines of the body of the function (indentation is relative to the function body)
+    :param namespace: global names available to the generated function.
+        NOTE: the dictionary is used as globals of the generated function, so it could be modified
+        after compilation in order to inject references to the generated function itself.
+
+    :return: the generated function. The generated source code is available in `__source__` attribute.
+    """
+    source = '\n'.join(
+        ['def {0}({1}):'.format(function_name, ', '.join(arguments))] +
+        ['    {0}'.format(line) for line in body_lines],
+    ) + '\n'
+    code = compile(source, '<bravado-core:{0}>'.format(function_name), 'exec')
+    exec(code, namespace)
+    function = namespace[function_name]
+    function.__source__ = source
+    return function  # type: ignore  # the function has been dynamically generated
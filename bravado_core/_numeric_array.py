@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Conversion of whole arrays of numbers (see the ``numeric_array_type`` config option).
+
+Arrays whose items are numbers or integers, with the default formats, are converted
+at once via :class:`array.array`, that rejects (raising TypeError or OverflowError)
+the items that are not numbers of the expected type. Callers handle the rejected
+arrays item by item, as usual.
+"""
+import array
+
+import typing
+
+from bravado_core import formatter
+from bravado_core import schema
+from bravado_core.schema import get_type_from_schema
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core._compat_typing import JSONDict
+    from bravado_core.spec import Spec
+
+    ArrayFactory = typing.Callable[[str, typing.Iterable[typing.Any]], typing.Any]
+
+
+# array.array type codes by (type, format) of the items. Floats are not stored as
+# single precision numbers, as the float format unmarshals them to python floats.
+_TYPECODES = {
+    ('number', None): 'd',
+    ('number', 'double'): 'd',
+    ('number', 'float'): 'd',
+    ('integer', None): 'q',
+    ('integer', 'int64'): 'q',
+    ('integer', 'int32'): 'i',
+}
+
+# Errors raised by array.array for items that could not be stored
+ARRAY_ERRORS = (TypeError, OverflowError, ValueError)
+
+
+def get_typecode(swagger_spec, item_schema):
+    # type: (Spec, JSONDict) -> typing.Optional[str]
+    """Determine the array.array type code to use for arrays of item_schema.
+
+    :param swagger_spec: Spec object
+    :param item_schema: schema of the array items (dereferenced)
+    :return: the type code, or None if the arrays have to be handled item by item
+        (ie. items that are not numbers or ``numeric_array_type`` is not set)
+    """
+    numeric_array_type = swagger_spec.config['numeric_array_type']
+    if numeric_array_type is None:
+        return None
+
+    format_name = schema.get_format(swagger_spec, item_schema)
+    typecode = _TYPECODES.get((get_type_from_schema(swagger_spec, item_schema), format_name))
+    if typecode is None:
+        return None
+    if format_name is None:
+        # Lists of numbers without format are already returned as they are
+        return None if numeric_array_type == 'list' else typecode
+    if swagger_spec.get_format(format_name) is not formatter.DEFAULT_FORMATS[format_name]:
+        # User-defined formats could convert the items differently
+        return None
+    return typecode
+
+
+def _to_list(typecode, values):
+    # type: (str, typing.Iterable[typing.Any]) -> typing.List[typing.Any]
+    return array.array(typecode, values).tolist()
+
+
+def get_array_factory(swagger_spec):
+    # type: (Spec) -> ArrayFactory
+    """Build the function that converts the items of an array, given the type code
+    returned by :func:`get_typecode`, to the configured ``numeric_array_type``.
+
+    :param swagger_spec: Spec object
+    :raises: ImportError if numeric_array_type is ``'numpy'`` and numpy is not installed
+    """
+    numeric_array_type = swagger_spec.config['numeric_array_type']
+    if numeric_array_type == 'array':
+        return array.array
+    elif numeric_array_type == 'numpy':
+        import numpy  # Optional dependency
+
+        def to_numpy_array(typecode, values):
+            # type: (str, typing.Iterable[typing.Any]) -> typing.Any
+            # NOTE: numpy.array would silently convert None and strings (ie. to nan)
+            return numpy.array(array.array(typecode, values), dtype=typecode)
+        return to_numpy_array
+    else:
+        return _to_list
+
+
+def to_list(typecode, value):
+    # type: (str, typing.Any) -> typing.List[typing.Any]
+    """Convert the items of a list, tuple, :class:`array.array` or 1-dimensional
+    :class:`numpy.ndarray` to the python numbers matching typecode.
+
+    :raises: TypeError, OverflowError or ValueError if an item could not be converted
+    """
+    if not isinstance(value, (list, tuple)):
+        value = value.tolist() if hasattr(value, 'tolist') else None
+        if not isinstance(value, list):
+            raise TypeError('Expected list like value')
+    return array.array(typecode, value).tolist()
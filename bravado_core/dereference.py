@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Full dereferencing of single document specs (ie. flattened specs).
+
+Every $ref object is replaced by the object it references. The result is a graph
+of plain dicts and lists, cyclic if the spec contains recursive references, where
+each referenced object is shared by all the places that reference it.
+"""
+import typing
+from six import iteritems
+from six.moves.urllib.parse import unquote
+
+from bravado_core.exception import SwaggerSchemaError
+from bravado_core.schema import is_dict_like
+from bravado_core.schema import is_list_like
+from bravado_core.schema import is_ref
+
+
+def _unescape_pointer_token(token):
+    # type: (typing.Text) -> typing.Text
+    return unquote(token).replace('~1', '/').replace('~0', '~')
+
+
+def _resolve(spec_dict, reference):
+    # type: (typing.Any, typing.Text) -> typing.Any
+    """Retrieve the object referenced by reference, following the intermediate $refs.
+
+    :param spec_dict: document containing the referenced object
+    :param reference: local reference (ie. ``#/definitions/Pet``)
+    :raises: SwaggerSchemaError if reference could not be resolved
+    """
+    followed_references = set()
+    while True:
+        if not reference.startswith('#'):
+            raise SwaggerSchemaError('Unsupported non local reference {0}'.format(reference))
+        if reference in followed_references:
+            raise SwaggerSchemaError('Circular reference {0}'.format(reference))
+        followed_references.add(reference)
+
+        target = spec_dict
+        pointer = reference[1:].lstrip('/')
+        for token in pointer.split('/') if pointer else ():
+            token = _unescape_pointer_token(token)
+            if is_ref(target):
+                target = _resolve(spec_dict, target['$ref'])
+            try:
+                target = target[int(token) if is_list_like(target) else token]
+            except (KeyError, IndexError, TypeError, ValueError):
+                raise SwaggerSchemaError('Unresolvable reference {0}'.format(reference))
+
+        if not is_ref(target):
+            return target
+        reference = target['$ref']
+
+
+def dereference_refs(spec_dict):
+    # type: (typing.Any) -> typing.Any
+    """Build a copy of spec_dict in which all the $refs are replaced by the referenced objects.
+
+    The traversal is iterative and each object of spec_dict is copied once, so recursive
+    references produce cyclic graphs (and no recursion errors).
+
+    NOTE: spec_dict is not modified. All the references have to be local (ie. ``#/definitions/Pet``).
+
+    :param spec_dict: single document swagger spec in json-like dict form. See
+        :attr:`bravado_core.spec.Spec.flattened_spec`
+    :raises: SwaggerSchemaError if a reference could not be resolved
+    """
+    # (key, value) = (id of an object of spec_dict, its copy)
+    copies = {}  # type: typing.Dict[int, typing.Any]
+    # Objects of spec_dict whose copies need to be filled
+    to_fill = []  # type: typing.List[typing.Any]
+
+    def copy_of(obj):
+        # type: (typing.Any) -> typing.Any
+        if is_ref(obj):
+            obj = _resolve(spec_dict, obj['$ref'])
+
+        if is_dict_like(obj):
+            obj_copy = copies.get(id(obj))
+            if obj_copy is None:
+                obj_copy = copies[id(obj)] = type(obj)()
+                to_fill.append(obj)
+            return obj_copy
+        elif is_list_like(obj):
+            obj_copy = copies.get(id(obj))
+            if obj_copy is None:
+                obj_copy = copies[id(obj)] = []
+                to_fill.append(obj)
+            return obj_copy
+        else:
+            return obj
+
+    result = copy_of(spec_dict)
+    while to_fill:
+        obj = to_fill.pop()
+        obj_copy = copies[id(obj)]
+        if is_dict_like(obj):
+            for key, value in iteritems(obj):
+                obj_copy[key] = copy_of(value)
+        else:
+            obj_copy.extend(copy_of(value) for value in obj)
+
+    return result
@@ -6,9 +6,12 @@ https://github.com/swagger-api/swagger-spec/blob/master/versions/2.0.md#dataType
 from __future__ import unicode_literals
 
 import base64
+import datetime
 import functools
+import re
 
 import dateutil.parser
+import dateutil.tz
 import pytz
 import six
 import typing
@@ -138,6 +141,88 @@ def return_true_wrapper(validate_func):
     return wrapper
 
 
+# RFC3339 full-date, ie. 2018-05-21
+_RFC3339_DATE_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+# RFC3339 date-time, ie. 2018-05-21T12:34:56.789+02:00 (lowercase and space separators are accepted as by dateutil).
+# Fractions of seconds are truncated to microseconds.
+_RFC3339_DATE_TIME_PATTERN = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})\d*)?(?:([Zz])|([+-])(\d{2}):(\d{2}))?$',
+)
+
+# Timezones by UTC offset (in seconds), of the same types returned by dateutil
+_timezones = {0: dateutil.tz.tzutc()}  # type: typing.Dict[int, datetime.tzinfo]
+
+
+def _get_timezone(offset):
+    # type: (int) -> datetime.tzinfo
+    timezone = _timezones.get(offset)
+    if timezone is None:
+        timezone = _timezones.setdefault(offset, dateutil.tz.tzoffset(None, offset))
+    return timezone
+
+
+def parse_date(value):
+    # type: (typing.Text) -> datetime.date
+    """Parse a date string.
+
+    RFC3339 full-dates are parsed natively, other strings are parsed by
+    :func:`dateutil.parser.parse` (so the results are equal in both cases).
+
+    :param value: date string, ie. 2018-05-21
+    :raises: ValueError if value is not a valid date
+    """
+    match = _RFC3339_DATE_PATTERN.match(value)
+    if match is not None:
+        try:
+            return datetime.date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            pass  # ie. 2018-02-30, let dateutil raise its own error
+    return dateutil.parser.parse(value).date()
+
+
+def parse_date_time(value):
+    # type: (typing.Text) -> datetime.datetime
+    """Parse a date-time string.
+
+    RFC3339 date-times are parsed natively, other strings are parsed by
+    :func:`dateutil.parser.parse` (so the results are equal in both cases).
+
+    :param value: date-time string, ie. 2018-05-21T12:34:56.789+02:00
+    :raises: ValueError if value is not a valid date-time
+    """
+    match = _RFC3339_DATE_TIME_PATTERN.match(value)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction, utc, offset_sign, offset_hours, offset_minutes = match.groups()
+        if utc is not None:
+            timezone = _timezones[0]  # type: typing.Optional[datetime.tzinfo]
+        elif offset_sign is not None:
+            offset = int(offset_hours) * 3600 + int(offset_minutes) * 60
+            timezone = _get_timezone(-offset if offset_sign == '-' else offset)
+        else:
+            timezone = None
+        try:
+            return datetime.datetime(
+                int(year), int(month), int(day), int(hour), int(minute), int(second),
+                int(fraction.ljust(6, '0')) if fraction else 0,
+                timezone,
+            )
+        except ValueError:
+            pass  # ie. 2018-05-21T24:00:00, let dateutil handle it
+    return dateutil.parser.parse(value)
+
+
+def date_time_to_wire(value):
+    # type: (datetime.datetime) -> typing.Text
+    """Format a date-time value, naive ones are assumed to be in UTC.
+
+    :param value: datetime to format
+    """
+    if value.tzinfo is None:
+        # Same as pytz.utc.localize(value).isoformat(), without building another datetime
+        return value.isoformat() + '+00:00'
+    return value.isoformat()
+
+
 BASE64_BYTE_FORMAT = SwaggerFormat(
     format='byte',
     # Note: In Python 3, this requires a bytes-like object as input
@@ -158,7 +243,7 @@ DEFAULT_FORMATS = {
     'date': SwaggerFormat(
         format='date',
         to_wire=lambda d: d.isoformat(),
-        to_python=lambda d: dateutil.parser.parse(d).date(),
+        to_python=parse_date,
         validate=NO_OP,  # jsonschema validates date
         description='Converts [wire]string:date <=> python datetime.date',
     ),
@@ -172,8 +257,8 @@ DEFAULT_FORMATS = {
     ),
     'date-time': SwaggerFormat(
         format='date-time',
-        to_wire=lambda dt: (dt if dt.tzinfo else pytz.utc.localize(dt)).isoformat(),
-        to_python=lambda dt: dateutil.parser.parse(dt),
+        to_wire=date_time_to_wire,
+        to_python=parse_date_time,
         validate=NO_OP,  # jsonschema validates date-time
         description=(
             'Converts string:date-time <=> python datetime.datetime'
@@ -201,3 +286,14 @@ DEFAULT_FORMATS = {
         description='Converts [wire]integer:int64 <=> python long',
     ),
 }
+
+# Formats parsing all the values via dateutil, see the use_dateutil_for_dates config option
+DATEUTIL_DATE_FORMATS = {
+    'date': DEFAULT_FORMATS['date']._replace(
+        to_python=lambda d: dateutil.parser.parse(d).date(),
+    ),
+    'date-time': DEFAULT_FORMATS['date-time']._replace(
+        to_wire=lambda dt: (dt if dt.tzinfo else pytz.utc.localize(dt)).isoformat(),
+        to_python=lambda dt: dateutil.parser.parse(dt),
+    ),
+}
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Loading (reading and parsing) of JSON and YAML swagger specs.
+
+YAML documents are parsed by the LibYAML based loader, if PyYAML has been built with
+it, as it is much faster than the pure python one. JSON documents could be parsed by
+alternative decoders (ie. ``orjson.loads``) via the ``json_loads`` arguments.
+"""
+import json
+import os.path
+import sys
+
+import typing
+import yaml
+from six import PY2
+from six.moves.urllib.parse import urljoin
+from six.moves.urllib.parse import urlparse
+from six.moves.urllib.request import pathname2url
+from six.moves.urllib.request import url2pathname
+from six.moves.urllib.request import urlopen
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover  # PyYAML has not been built with LibYAML
+    from yaml import SafeLoader as YamlLoader  # type: ignore
+
+
+# json.loads accepts (UTF-8 encoded) bytes on python 2 and python >= 3.6
+_JSON_LOADS_ACCEPTS_BYTES = PY2 or sys.version_info >= (3, 6)
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    JSONLoads = typing.Callable[[typing.Union[bytes, typing.Text]], typing.Any]
+
+
+def is_yaml(url, content_type=None):
+    yaml_content_types = {'application/yaml', 'application/x-yaml', 'text/yaml'}
+
+    yaml_file_extensions = {'.yaml', '.yml'}
+
+    if content_type in yaml_content_types:
+        return True
+
+    _, ext = os.path.splitext(url)
+    if ext.lower() in yaml_file_extensions:
+        return True
+
+    return False
+
+
+def load_yaml(content):
+    # type: (typing.Any) -> typing.Any
+    """Parse a YAML document.
+
+    :param content: document as bytes, text or file-like object
+    """
+    return yaml.load(content, Loader=YamlLoader)
+
+
+def load_json(content, json_loads=None):
+    # type: (typing.Union[bytes, typing.Text], typing.Optional[JSONLoads]) -> typing.Any
+    """Parse a JSON document.
+
+    :param content: document as bytes or text
+    :param json_loads: callable used to parse the document. It is given content as is,
+        so it needs to accept bytes if content is bytes (ie. ``orjson.loads``).
+        Defaults to :func:`json.loads`
+    """
+    if json_loads is not None:
+        return json_loads(content)
+    if not _JSON_LOADS_ACCEPTS_BYTES and isinstance(content, bytes):
+        content = content.decode('utf-8')
+    return json.loads(content)
+
+
+def load(content, url, content_type=None, json_loads=None):
+    # type: (typing.Any, typing.Text, typing.Optional[typing.Text], typing.Optional[JSONLoads]) -> typing.Any
+    """Parse a JSON or YAML document, depending on its url and content type.
+
+    :param content: document as bytes or text
+    :param url: url (or path) of the document
+    :param content_type: content type of the document, if known
+    :param json_loads: callable used to parse JSON documents, see :func:`load_json`
+    """
+    if is_yaml(url, content_type):
+        return load_yaml(content)
+    return load_json(content, json_loads)
+
+
+def get_file_url(path):
+    # type: (typing.Text) -> typing.Text
+    """Build the file:// url of path.
+
+    :param path: path of a local file
+    """
+    return urljoin('file:', pathname2url(os.path.abspath(path)))
+
+
+def load_file(path_or_url, json_loads=None):
+    # type: (typing.Text, typing.Optional[JSONLoads]) -> typing.Any
+    """Read and parse a local JSON or YAML document.
+
+    :param path_or_url: path of the document or its file:// url
+    :param json_loads: callable used to parse JSON documents, see :func:`load_json`
+    """
+    if urlparse(path_or_url).scheme == 'file':
+        path = url2pathname(urlparse(path_or_url).path)
+    else:
+        path = path_or_url
+
+    with open(path, mode='rb') as fp:
+        return load(fp.read(), path, json_loads=json_loads)
+
+
+def load_url(url, http_client=None, json_loads=None):
+    # type: (typing.Text, typing.Any, typing.Optional[JSONLoads]) -> typing.Any
+    """Retrieve and parse a JSON or YAML document.
+
+    :param url: url of the document. Local files are referred via file:// urls
+    :param http_client: http client used to download remote documents. If None,
+        documents are downloaded via :func:`urllib.request.urlopen`
+    :type http_client: :class:`bravado.http_client.HTTPClient`
+    :param json_loads: callable used to parse JSON documents, see :func:`load_json`
+    """
+    if urlparse(url).scheme == 'file':
+        return load_file(url, json_loads)
+
+    if http_client is None:
+        response = urlopen(url)
+        try:
+            content_type = response.headers.get('content-type', '')
+            content = response.read()
+        finally:
+            response.close()
+    else:
+        response = http_client.request({'method': 'GET', 'url': url}).result()
+        content_type = response.headers.get('content-type', '')
+        content = response.raw_bytes
+
+    return load(content, url, content_type.split(';')[0].strip().lower(), json_loads)
@@ -2,14 +2,24 @@
 import warnings
 from functools import partial
 
+import msgpack
+import simplejson as json
 import typing
 from six import iteritems
+from six import string_types
 
 from bravado_core import _decorators
+from bravado_core import _numeric_array
 from bravado_core import schema
+from bravado_core._codegen import compile_function
+from bravado_core._codegen import make_function_name
+from bravado_core.content_type import APP_JSON
+from bravado_core.content_type import APP_MSGPACK
 from bravado_core.exception import SwaggerMappingError
+from bravado_core.model import LazyModel
 from bravado_core.model import Model
 from bravado_core.model import MODEL_MARKER
+from bravado_core.model import SlottedModel
 from bravado_core.schema import collapsed_properties
 from bravado_core.schema import collapsed_required
 from bravado_core.schema import get_type_from_schema
@@ -54,6 +64,70 @@ def marshal_schema_object(swagger_spec, schema_object_spec, value):
     return marshaling_method(value)
 
 
+def iter_marshal_array_to_bytes(swagger_spec, array_spec, values, content_type=APP_JSON):
+    # type: (Spec, JSONDict, typing.Optional[typing.Iterable[typing.Any]], typing.Text) -> typing.Iterator[bytes]
+    """Marshal the values of an array and serialize them, yielding one chunk of bytes per item.
+
+    Differently from :func:`marshal_schema_object`, values could be any iterable (ie. a generator)
+    and they are marshaled only while iterating the chunks, so the response body could
+    be streamed without holding all the marshaled values in memory.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :param array_spec: spec for an 'array' type in dict form
+    :param values: iterable of python values (ie. Models) to marshal.
+        NOTE: msgpack requires the number of items upfront, so `len(values)` has to be defined
+    :param content_type: serialization format of the chunks (application/json or application/msgpack)
+
+    :return: iterator over the serialized chunks. Their concatenation is the serialized array.
+    :raises: SwaggerMappingError
+    """
+    array_spec = swagger_spec.deref(array_spec)
+    if content_type == APP_JSON:
+        dumps = _dumps_json  # type: typing.Callable[[typing.Any], bytes]
+    elif content_type == APP_MSGPACK:
+        dumps = msgpack.Packer(use_bin_type=True).pack
+    else:
+        raise SwaggerMappingError('Unsupported content-type {0}'.format(content_type))
+
+    if values is None:
+        return iter([dumps(marshal_schema_object(swagger_spec, array_spec, values))])
+    elif is_dict_like(values) or isinstance(values, string_types):
+        raise SwaggerMappingError('Expected iterable type for {0}:{1}'.format(type(values), values))
+
+    item_schema = swagger_spec.deref(array_spec.get('items', _NOT_FOUND))
+    marshal_item = _no_op_marshaling if item_schema is _NOT_FOUND else _get_marshaling_method(
+        swagger_spec=swagger_spec,
+        object_schema=item_schema,
+    )
+
+    if content_type == APP_JSON:
+        return _iter_json_array_chunks(marshal_item, values)
+    else:
+        return _iter_msgpack_array_chunks(marshal_item, values, len(values))  # type: ignore  # values has to be sized
+
+
+def _dumps_json(value):
+    # type: (typing.Any) -> bytes
+    return json.dumps(value).encode('utf-8')
+
+
+def _iter_json_array_chunks(marshal_item, values):
+    # type: (MarshalingMethod, typing.Iterable[typing.Any]) -> typing.Iterator[bytes]
+    separator = b'['
+    for value in values:
+        yield separator + _dumps_json(marshal_item(value))
+        separator = b','
+    yield b'[]' if separator == b'[' else b']'
+
+
+def _iter_msgpack_array_chunks(marshal_item, values, number_of_values):
+    # type: (MarshalingMethod, typing.Iterable[typing.Any], int) -> typing.Iterator[bytes]
+    packer = msgpack.Packer(use_bin_type=True)
+    yield packer.pack_array_header(number_of_values)
+    for value in values:
+        yield packer.pack(marshal_item(value))
+
+
 def marshal_primitive(swagger_spec, primitive_spec, value):
     # type: (Spec, JSONDict, typing.Any) -> typing.Any
     """Marshal a python primitive type into a jsonschema primitive.
@@ -175,6 +249,10 @@ def _get_marshaling_method(swagger_spec, object_schema, required=False):
     elif object_type == 'file':
         return null_decorator(_marshaling_method_file(swagger_spec, object_schema))
     elif object_type == 'object':
+        if swagger_spec.config['marshal_backend'] == 'codegen':
+            compiled_method = _compile_marshaling_method_object(swagger_spec, object_schema, required)
+            if compiled_method is not None:
+                return compiled_method
         return null_decorator(_marshaling_method_object(swagger_spec, object_schema))
     elif object_type in SWAGGER_PRIMITIVES:
         return null_decorator(_marshaling_method_primitive_type(swagger_spec, object_schema))
@@ -225,6 +303,25 @@ def _marshal_array(marshal_array_item_function, value):
     ]
 
 
+def _marshal_numeric_array(typecode, marshal_array_function, value):
+    # type: (str, MarshalingMethod, typing.Any) -> typing.Any
+    """
+    Marshal a python list, tuple, array.array or numpy.ndarray of numbers at once to its
+    JSON list representation (see the numeric_array_type config option).
+
+    :param typecode: array.array type code of the items
+    :param marshal_array_function: Marshaling function of the array, used if not all
+        the items are numbers of the expected type
+    :param value: Python value to marshal as JSON Array
+
+    :raises: SwaggerMappingError
+    """
+    try:
+        return _numeric_array.to_list(typecode, value)
+    except _numeric_array.ARRAY_ERRORS:
+        return marshal_array_function(value)
+
+
 def _marshaling_method_array(swagger_spec, object_schema):
     # type: (Spec, JSONDict) -> MarshalingMethod
     """
@@ -239,10 +336,14 @@ def _marshaling_method_array(swagger_spec, object_schema):
     if item_schema is _NOT_FOUND:
         return _no_op_marshaling
 
-    return partial(
+    marshal_array_function = partial(
         _marshal_array,
         _get_marshaling_method(swagger_spec=swagger_spec, object_schema=item_schema),
     )
+    typecode = _numeric_array.get_typecode(swagger_spec, item_schema)
+    if typecode is not None:
+        return partial(_marshal_numeric_array, typecode, marshal_array_function)
+    return marshal_array_function
 
 
 def _marshaling_method_file(swagger_spec, object_schema):
@@ -423,3 +524,196 @@ def _marshaling_method_primitive_type(swagger_spec, object_schema):
         )
     else:
         return _no_op_marshaling
+
+
+def _compile_marshaling_method_object(swagger_spec, object_schema, required):
+    # type: (Spec, JSONDict, bool) -> typing.Optional[MarshalingMethod]
+    """
+    Generate a specialized marshaling function for a schema of a type object.
+
+    The generated function inlines the marshaling of the properties with primitive types (including
+    :meth:`bravado_core.formatter.SwaggerFormat.to_wire` calls), arrays of such properties and the
+    rules to skip None values. Nested objects are marshaled by the method returned by :func:`_get_marshaling_method`.
+
+    NOTE: the function has to behave exactly as the method determined by :func:`_marshaling_method_object`.
+
+    :param swagger_spec: Spec object
+    :param object_schema: Schema of the object type (dereferenced)
+    :param required: Flag set to `True` if the current schema is required
+
+    :return: the generated function or None if the schema is not supported (ie. polymorphic schemas)
+    """
+    if MODEL_MARKER in object_schema and object_schema[MODEL_MARKER] not in swagger_spec.definitions:
+        return None
+
+    if object_schema.get('discriminator'):
+        return None
+
+    properties = collapsed_properties(object_schema, swagger_spec)
+    required_properties = collapsed_required(object_schema, swagger_spec)
+
+    namespace = {
+        '_MISSING': _NOT_FOUND,
+        '_SwaggerMappingError': SwaggerMappingError,
+        '_Model': Model,
+        '_SlottedModel': SlottedModel,
+        '_LazyModel': LazyModel,
+        '_is_dict_like': is_dict_like,
+        '_list_types': (list, tuple),
+        '_property_names': frozenset(properties),
+    }  # type: typing.Dict[str, typing.Any]
+
+    body = [
+        'if value is None:',
+        '    return _marshal_null_value(value)',
+        'if value.__class__ is not dict:',
+        # NOTE: checking the MRO is equivalent to isinstance(value, Model), but it avoids ModelMeta.__instancecheck__
+        '    if _Model in value.__class__.__mro__:',
+        # NOTE: slotted and lazy models do not keep (all) the values in the _Model__dict attribute
+        '        if _SlottedModel in value.__class__.__mro__ or _LazyModel in value.__class__.__mro__:',
+        '            value = value._as_dict(recursive=False)',
+        '        else:',
+        '            value = value._Model__dict',
+        '    elif not _is_dict_like(value):',
+        '        raise _SwaggerMappingError(',
+        '            "Expected type to be dict or Model to marshal value \'{0}\' to a dict. Was {1} instead.".format(',
+        '                value, type(value),',
+        '            ),',
+        '        )',
+        'result = {}',
+    ]
+    if properties:
+        body.append('get = value.get')
+
+    for index, (prop_name, prop_schema) in enumerate(iteritems(properties)):
+        namespace['_method_{0}'.format(index)] = _get_marshaling_method(
+            swagger_spec=swagger_spec,
+            object_schema=prop_schema,
+            required=prop_name in required_properties,
+        )
+
+        key = repr(prop_name)
+        if prop_name not in required_properties and not schema.is_prop_nullable(swagger_spec, prop_schema):
+            # None values of not required and not nullable properties are not marshaled
+            body.extend([
+                'item = get({0})'.format(key),
+                'if item is not None:',
+            ])
+        else:
+            body.extend([
+                'item = get({0}, _MISSING)'.format(key),
+                'if item is None:',
+                '    result[{0}] = _method_{1}(None)'.format(key, index),
+                'elif item is not _MISSING:',
+            ])
+        body.extend(
+            '    {0}'.format(line)
+            for line in _inline_marshaling_statements(
+                swagger_spec, prop_schema, 'item', 'result[{0}]'.format(key), '_method_{0}'.format(index), namespace,
+            )
+        )
+
+    additional_properties_marshaling_function = _no_op_marshaling
+    if object_schema.get('additionalProperties') is not False:
+        additional_properties_schema = object_schema.get('additionalProperties', {})
+        if additional_properties_schema not in ({}, True):
+            additional_properties_marshaling_function = _get_marshaling_method(
+                swagger_spec=swagger_spec,
+                object_schema=additional_properties_schema,
+            )
+    namespace['_additional_properties_method'] = additional_properties_marshaling_function
+    body.extend([
+        'if not _property_names.issuperset(value):',
+        '    for key in value:',
+        '        if key not in _property_names:',
+        '            result[key] = {0}'.format(
+            'value[key]'
+            if additional_properties_marshaling_function is _no_op_marshaling
+            else '_additional_properties_method(value[key])',
+        ),
+        'return result',
+    ])
+
+    function = compile_function(
+        function_name=make_function_name('marshal', object_schema.get(MODEL_MARKER) or object_schema.get('title')),
+        arguments=['value'],
+        body_lines=body,
+        namespace=namespace,
+    )
+    namespace['_marshal_null_value'] = _handle_null_value(
+        swagger_spec=swagger_spec,
+        object_schema=object_schema,
+        is_nullable=not required,
+    )(function)
+    return function
+
+
+def _inline_marshaling_statements(swagger_spec, object_schema, variable, target, method_name, namespace):
+    # type: (Spec, JSONDict, str, str, str, typing.Dict[str, typing.Any]) -> typing.List[str]
+    """
+    Build the python statements that marshal the (not None) value stored in `variable` into `target`.
+
+    :param swagger_spec: Spec object
+    :param object_schema: Schema of the value
+    :param variable: name of the variable containing the value
+    :param target: assignment target of the marshaled value
+    :param method_name: name of the marshaling method of object_schema
+    :param namespace: namespace of the generated function, eventually extended with the needed objects
+
+    :return: list of python statements
+    """
+    object_schema = swagger_spec.deref(object_schema)
+    object_type = get_type_from_schema(swagger_spec, object_schema)
+
+    if object_type is None or object_type == 'file':
+        return ['{0} = {1}'.format(target, variable)]
+
+    elif object_type in SWAGGER_PRIMITIVES:
+        format_name = schema.get_format(swagger_spec, object_schema)
+        swagger_format = swagger_spec.get_format(format_name) if format_name is not None else None
+        if swagger_format is None:
+            return ['{0} = {1}'.format(target, variable)]
+
+        namespace[method_name + '_to_wire'] = swagger_format.to_wire
+        return [
+            'try:',
+            '    {0} = {1}_to_wire({2})'.format(target, method_name, variable),
+            'except Exception as e:',
+            '    raise _SwaggerMappingError(',
+            '        \'Error while marshalling value={{}} to type={{}}/{{}}.\'.format({0}, {1}, {2}),'.format(
+                variable, repr(str(object_type)), repr(str(swagger_format.format)),
+            ),
+            '        e,',
+            '    )',
+        ]
+
+    elif object_type == 'array':
+        item_schema = object_schema.get('items', _NOT_FOUND)
+        if item_schema is _NOT_FOUND:
+            return ['{0} = {1}'.format(target, variable)]
+
+        item_schema = swagger_spec.deref(item_schema)
+        if _numeric_array.get_typecode(swagger_spec, item_schema) is not None:
+            # The marshaling method converts the whole array at once
+            return ['{0} = {1}({2})'.format(target, method_name, variable)]
+
+        item_type = get_type_from_schema(swagger_spec, item_schema)
+        if item_type is None or (
+            (
+                item_type == 'file' or
+                item_type in SWAGGER_PRIMITIVES and
+                _marshaling_method_primitive_type(swagger_spec, item_schema) is _no_op_marshaling
+            ) and
+            schema.get_default(swagger_spec, item_schema) is None
+        ):
+            item_expression = 'list({0})'.format(variable)
+        else:
+            namespace[method_name + '_item'] = _get_marshaling_method(swagger_spec=swagger_spec, object_schema=item_schema)
+            item_expression = '[{0}_item(element) for element in {1}]'.format(method_name, variable)
+
+        # The marshaling method takes care of raising the expected exception on not list-like values
+        return ['{0} = {1} if isinstance({2}, _list_types) else {3}({2})'.format(
+            target, item_expression, variable, method_name,
+        )]
+
+    return ['{0} = {1}({2})'.format(target, method_name, variable)]
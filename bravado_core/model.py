@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 import abc
-import functools
 import logging
 import re
 from copy import deepcopy
 from warnings import warn
 
 import typing
+from jsonschema.validators import RefResolver
 from six import add_metaclass
 from six import iteritems
+from six import iterkeys
 from six import string_types
 from swagger_spec_validator.ref_validators import attach_scope
 
@@ -33,6 +34,12 @@ log = logging.getLogger(__name__)
 # differentiated from 'object' types.
 MODEL_MARKER = 'x-model'
 
+# JSON Uri of the models defined in the definitions section of a swagger file
+_DEFINITION_REFERENCE_PATTERN = re.compile('^[^#]*#/definitions/[^/]+$')
+
+# Placeholder for the properties of LazyModel instances that have already been unmarshaled
+_NOT_PENDING = object()
+
 
 def _get_model_name(model_dict):
     """Determine model name from model dictionary representation and Swagger Path"""
@@ -103,7 +110,7 @@ def _tag_models(container, json_reference, visited_models, swagger_spec):
     :type visited_models: dict (k,v) == (model_name, path)
     :type swagger_spec: :class:`bravado_core.spec.Spec`
     """
-    if not re.match('^[^#]*#/definitions/[^/]+$', json_reference):
+    if not _DEFINITION_REFERENCE_PATTERN.match(json_reference):
         return
 
     key = json_reference.split('/')[-1]
@@ -180,6 +187,19 @@ def _bless_models(container, json_reference, visited_models, swagger_spec):
     )
 
 
+def _get_model_bases(swagger_spec):
+    """Base classes of the model types of swagger_spec, according to its config.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :rtype: tuple
+    """
+    if swagger_spec.config['lazy_models']:
+        return (LazyModel,)
+    if swagger_spec.config['slotted_models']:
+        return (SlottedModel,)
+    return (Model,)
+
+
 def _collect_models(container, json_reference, models, swagger_spec):
     """
     Callback used during the swagger spec ingestion to collect all the
@@ -206,6 +226,7 @@ def _collect_models(container, json_reference, models, swagger_spec):
                 swagger_spec=swagger_spec,
                 model_name=model_name,
                 model_spec=model_spec,
+                bases=_get_model_bases(swagger_spec),
                 json_reference=re.sub('/{MODEL_MARKER}$'.format(MODEL_MARKER=MODEL_MARKER), '', json_reference),
             )
         elif (
@@ -516,30 +537,7 @@ class Model(object):
         :rtype: dict
         """
 
-        dct = dict()
-        for attr_name, attr_val in iteritems(self.__dict):
-            if attr_name not in self._properties and not additional_properties:
-                continue
-
-            if recursive:
-                is_list = is_list_like(attr_val)
-
-                attribute = attr_val if is_list else [attr_val]
-
-                new_attr_val = []
-                for attr in attribute:
-                    if isinstance(attr, Model):
-                        attr = attr._as_dict(
-                            additional_properties=additional_properties,
-                            recursive=recursive,
-                        )
-                    new_attr_val.append(attr)
-
-                attr_val = new_attr_val if is_list else new_attr_val[0]
-
-            dct[attr_name] = attr_val
-
-        return dct
+        return _values_as_dict(self.__dict, self._properties, additional_properties, recursive)
 
     # provide the same interface as a namedtuple
     _asdict = _as_dict
@@ -611,6 +609,439 @@ class Model(object):
         return isinstance(obj, cls)
 
 
+def _values_as_dict(values, properties, additional_properties, recursive):
+    """Implementation of :meth:`Model._as_dict`.
+
+    :param dict values: property values (including additional) by name
+    :param properties: names of the properties defined in the spec
+    """
+    dct = dict()
+    for attr_name, attr_val in iteritems(values):
+        if attr_name not in properties and not additional_properties:
+            continue
+
+        if recursive:
+            is_list = is_list_like(attr_val)
+
+            attribute = attr_val if is_list else [attr_val]
+
+            new_attr_val = []
+            for attr in attribute:
+                if isinstance(attr, Model):
+                    attr = attr._as_dict(
+                        additional_properties=additional_properties,
+                        recursive=recursive,
+                    )
+                new_attr_val.append(attr)
+
+            attr_val = new_attr_val if is_list else new_attr_val[0]
+
+        dct[attr_name] = attr_val
+
+    return dct
+
+
+class SlottedModel(Model):
+    """Base class for Swagger models storing the property values in slots.
+
+    Model types created with the ``slotted_models`` config option inherit from
+    this class. They have one slot per property (in :attr:`_property_slots`) and
+    a dictionary only for the additional properties, if any, of each instance.
+    So instances are significantly smaller than the ones of :class:`Model`,
+    while exposing exactly the same interface.
+
+    .. attribute:: _property_slots
+
+        Class attribute that must be assigned on subclasses.
+        Dict mapping property names to the descriptors of the slots holding their values.
+    """
+
+    # Implementation details:
+    #
+    # Unset properties are unset slots. The _Model__dict slot, inherited from
+    # Model, is never set.
+
+    __slots__ = (
+        '_SlottedModel__additional',  # Dict of additional properties or None. Note the name mangling!
+    )
+
+    _property_slots = {}  # type: typing.Dict[typing.Text, typing.Any]
+
+    def __init__(self, **kwargs):
+        """Initialize from property values in keyword arguments.
+
+        :param \\**kwargs: Property values by name.
+        """
+        self.__init_from_dict(kwargs)
+
+    def __init_from_dict(self, dct, include_missing_properties=None):
+        """Initialize model from a dictionary of property values.
+
+        :param dict dct: Dictionary of property values by name. They need not
+            actually exist in :attr:`_properties`.
+        """
+        if include_missing_properties is None:
+            include_missing_properties = self._swagger_spec.config['include_missing_properties']
+
+        # Additional property names in dct
+        additional = set(dct).difference(self._property_slots)
+
+        if additional and self._model_spec.get('additionalProperties') is False:
+            raise AttributeError(
+                "Model {0} does not have attributes for: {1}".format(
+                    type(self), list(additional),
+                ),
+            )
+
+        # Assign properties in model_spec, filling in None if missing from dct
+        for attr_name, slot in iteritems(self._property_slots):
+            if include_missing_properties or attr_name in dct:
+                slot.__set__(self, dct.get(attr_name))
+
+        # We need bypass the overloaded __setattr__ method
+        object.__setattr__(
+            self, '_SlottedModel__additional',
+            {attr_name: dct[attr_name] for attr_name in additional} if additional else None,
+        )
+
+    def __values(self):
+        """Property values (including additional) by name.
+
+        :rtype: dict
+        """
+        values = {}
+        for attr_name, slot in iteritems(self._property_slots):
+            try:
+                values[attr_name] = slot.__get__(self, None)
+            except AttributeError:  # unset property
+                pass
+        if self.__additional:
+            values.update(self.__additional)
+        return values
+
+    def __contains__(self, obj):
+        """Has a property set (including additional)."""
+        slot = self._property_slots.get(obj)
+        if slot is None:
+            return self.__additional is not None and obj in self.__additional
+        try:
+            slot.__get__(self, None)
+        except AttributeError:  # unset property
+            return False
+        return True
+
+    def __iter__(self):
+        """Iterate over property names (including additional)."""
+        return iter(self.__values())
+
+    def __getitem__(self, property_name):
+        """Get a property value by name.
+
+        :type property_name: str
+        """
+        slot = self._property_slots.get(property_name)
+        if slot is None:
+            if self.__additional is None:
+                raise KeyError(property_name)
+            return self.__additional[property_name]
+        try:
+            return slot.__get__(self, None)
+        except AttributeError:  # unset property
+            raise KeyError(property_name)
+
+    def __setitem__(self, property_name, val):
+        """Set a property value by name.
+
+        :type property_name: str
+        """
+        slot = self._property_slots.get(property_name)
+        if slot is not None:
+            slot.__set__(self, val)
+        elif self.__additional is None:
+            object.__setattr__(self, '_SlottedModel__additional', {property_name: val})
+        else:
+            self.__additional[property_name] = val
+
+    def __delitem__(self, property_name):
+        """Unset a property by name.
+
+        Properties defined in the spec will be set to ``None``.
+        Additional properties will be completely removed.
+
+        :type property_name: str
+        """
+        slot = self._property_slots.get(property_name)
+        if slot is not None:
+            slot.__set__(self, None)
+        elif self.__additional is None:
+            raise KeyError(property_name)
+        else:
+            del self.__additional[property_name]
+
+    def __eq__(self, other):
+        """Check for equality with another instance.
+
+        Two model instances are equal if they have the same type and the same
+        properties and values (including additional properties).
+        """
+        if not isinstance(other, self.__class__):
+            return False
+
+        # Ignore any '_raw' keys
+        other_values = dict((k, other[k]) for k in other if k != '_raw')
+        values = self.__values()
+        values.pop('_raw', None)
+        return values == other_values
+
+    def __dir__(self):
+        """Return only property names (including additional)."""
+        return sorted(self.__values().keys())
+
+    def __repr__(self):
+        """Return properties (including additional)."""
+        values = self.__values()
+        s = [
+            "{0}={1!r}".format(attr_name, values[attr_name])
+            for attr_name in sorted(values.keys())
+        ]
+        return "{0}({1})".format(self.__class__.__name__, ', '.join(s))
+
+    def __deepcopy__(self, memo=None):
+        """Deep copy all properties, but not metadata like the Swagger or Model spec attributes."""
+        if memo is None:  # pragma: no cover  # This should never happening, but better safe than sorry
+            memo = {}
+        return self.__class__(**deepcopy(self.__values(), memo=memo))
+
+    @property
+    def _additional_props(self):
+        """Names of properties in instance which are not defined in spec."""
+        return set(self.__additional or ())
+
+    def _as_dict(self, additional_properties=True, recursive=True):
+        """Get property values as dictionary.
+
+        :param bool additional_properties: Whether to include additional properties
+            set on the instance but not defined in the spec.
+        :param bool recursive: Whether to convert all property values which
+            are themselves models to dicts as well.
+
+        :rtype: dict
+        """
+        return _values_as_dict(self.__values(), self._property_slots, additional_properties, recursive)
+
+    # provide the same interface as a namedtuple
+    _asdict = _as_dict
+
+    @classmethod
+    def _from_dict(cls, dct):
+        """Create a model instance from dictionary of property values.
+
+        The only advantage of this over ``__init__(**dct)`` is that using
+        the property name ``self`` will not result in an error.
+
+        :param dict dct: Property values by name.
+        :rtype: .SlottedModel
+        """
+        model = object.__new__(cls)
+        model.__init_from_dict(
+            dct=dct,
+            include_missing_properties=cls._swagger_spec.config['include_missing_properties'],
+        )
+        return model
+
+
+class LazyModel(Model):
+    """Base class for Swagger models unmarshaling the property values on first access.
+
+    Model types created with the ``lazy_models`` config option inherit from this
+    class. Unmarshaled instances wrap the raw (JSON) values of the properties and
+    unmarshal each of them (nested models, formats conversion, etc.) only when it
+    is accessed for the first time. The unmarshaled values are cached.
+
+    Methods that need all the values (ie. :meth:`_as_dict`, equality and repr)
+    unmarshal the remaining properties first. Methods that need only the
+    property names (ie. iteration and ``in``) don't unmarshal any property.
+
+    NOTE: errors in the raw values (ie. invalid date-time strings) are raised
+    when the properties are accessed, not while unmarshaling the instances.
+    Values are eagerly unmarshaled if they are validated while unmarshaling
+    (see the ``validate_while_unmarshaling`` config option).
+    """
+
+    # Implementation details:
+    #
+    # Unmarshaled property values are stored in the __dict attribute, as for
+    # Model. Raw values move from the __pending dictionary to __dict once
+    # unmarshaled.
+
+    __slots__ = (
+        '_LazyModel__pending',  # Raw values of the properties not unmarshaled yet, or None
+        '_LazyModel__unmarshalers',  # Tuple (unmarshaling functions by property name, additional properties one)
+    )
+
+    def __init__(self, **kwargs):
+        """Initialize from property values in keyword arguments.
+
+        :param \\**kwargs: Property values by name.
+        """
+        object.__setattr__(self, '_LazyModel__pending', None)
+        object.__setattr__(self, '_LazyModel__unmarshalers', None)
+        super(LazyModel, self).__init__(**kwargs)
+
+    @classmethod
+    def __from_raw_values(cls, raw_values, unmarshalers, include_missing_properties):
+        """Create an instance wrapping the raw values of its properties.
+
+        :param dict raw_values: raw property values (including additional) by name
+        :param unmarshalers: tuple (unmarshaling functions by property name,
+            unmarshaling function of the additional properties)
+        :param bool include_missing_properties: whether properties missing from
+            raw_values have to be set to None
+        :rtype: .LazyModel
+        """
+        model = object.__new__(cls)
+        values = {}
+        if include_missing_properties:
+            for attr_name in cls._properties:
+                if attr_name not in raw_values:
+                    values[attr_name] = None
+        object.__setattr__(model, '_Model__dict', values)
+        object.__setattr__(model, '_LazyModel__pending', dict(raw_values) if raw_values else None)
+        object.__setattr__(model, '_LazyModel__unmarshalers', unmarshalers)
+        return model
+
+    def __unmarshal_pending(self):
+        """Unmarshal all the properties that have not been accessed yet."""
+        pending = self.__pending
+        if pending:
+            properties_to_unmarshaling_function, additional_properties_unmarshaling_function = self.__unmarshalers
+            values = self._Model__dict
+            for attr_name, raw_value in list(iteritems(pending)):
+                values[attr_name] = properties_to_unmarshaling_function.get(
+                    attr_name, additional_properties_unmarshaling_function,
+                )(raw_value)
+            object.__setattr__(self, '_LazyModel__pending', None)
+
+    def __contains__(self, obj):
+        """Has a property set (including additional)."""
+        return obj in self._Model__dict or bool(self.__pending) and obj in self.__pending
+
+    def __iter__(self):
+        """Iterate over property names (including additional)."""
+        if not self.__pending:
+            return iter(self._Model__dict)
+        return iter(list(self._Model__dict) + list(self.__pending))
+
+    def __getitem__(self, property_name):
+        """Get a property value by name, unmarshaling it on first access.
+
+        :type property_name: str
+        """
+        pending = self.__pending
+        if pending:
+            raw_value = pending.get(property_name, _NOT_PENDING)
+            if raw_value is not _NOT_PENDING:
+                properties_to_unmarshaling_function, additional_properties_unmarshaling_function = self.__unmarshalers
+                value = properties_to_unmarshaling_function.get(
+                    property_name, additional_properties_unmarshaling_function,
+                )(raw_value)
+                self._Model__dict[property_name] = value
+                pending.pop(property_name, None)
+                return value
+        return self._Model__dict[property_name]
+
+    def __setitem__(self, property_name, val):
+        """Set a property value by name.
+
+        :type property_name: str
+        """
+        if self.__pending:
+            self.__pending.pop(property_name, None)
+        self._Model__dict[property_name] = val
+
+    def __delitem__(self, property_name):
+        """Unset a property by name.
+
+        Properties defined in the spec will be set to ``None``.
+        Additional properties will be completely removed.
+
+        :type property_name: str
+        """
+        if self.__pending and self.__pending.pop(property_name, _NOT_PENDING) is not _NOT_PENDING:
+            if property_name in self._properties:
+                self._Model__dict[property_name] = None
+            return
+        super(LazyModel, self).__delitem__(property_name)
+
+    def __eq__(self, other):
+        """Check for equality with another instance.
+
+        Two model instances are equal if they have the same type and the same
+        properties and values (including additional properties).
+        """
+        if not isinstance(other, self.__class__):
+            return False
+
+        self.__unmarshal_pending()
+        if isinstance(other, LazyModel):
+            other.__unmarshal_pending()
+        return super(LazyModel, self).__eq__(other)
+
+    def __dir__(self):
+        """Return only property names (including additional)."""
+        return sorted(self)
+
+    def __repr__(self):
+        """Return properties (including additional)."""
+        self.__unmarshal_pending()
+        return super(LazyModel, self).__repr__()
+
+    def __deepcopy__(self, memo=None):
+        """Deep copy all properties, but not metadata like the Swagger or Model spec attributes."""
+        self.__unmarshal_pending()
+        return super(LazyModel, self).__deepcopy__(memo)
+
+    @property
+    def _additional_props(self):
+        """Names of properties in instance which are not defined in spec."""
+        return set(self).difference(self._properties)
+
+    def _as_dict(self, additional_properties=True, recursive=True):
+        """Get property values as dictionary.
+
+        :param bool additional_properties: Whether to include additional properties
+            set on the instance but not defined in the spec.
+        :param bool recursive: Whether to convert all property values which
+            are themselves models to dicts as well.
+
+        :rtype: dict
+        """
+        self.__unmarshal_pending()
+        return super(LazyModel, self)._as_dict(additional_properties=additional_properties, recursive=recursive)
+
+    # provide the same interface as a namedtuple
+    _asdict = _as_dict
+
+    @classmethod
+    def _from_dict(cls, dct):
+        """Create a model instance from dictionary of property values.
+
+        The only advantage of this over ``__init__(**dct)`` is that using
+        the property name ``self`` will not result in an error.
+
+        :param dict dct: Property values by name.
+        :rtype: .LazyModel
+        """
+        model = object.__new__(cls)
+        object.__setattr__(model, '_LazyModel__pending', None)
+        object.__setattr__(model, '_LazyModel__unmarshalers', None)
+        model._Model__init_from_dict(
+            dct=dct,
+            include_missing_properties=cls._swagger_spec.config['include_missing_properties'],
+        )
+        return model
+
+
 class ModelDocstring(object):
     """Descriptor for model classes that dynamically generates docstrings.
 
@@ -637,7 +1068,9 @@ class ModelDocstring(object):
         return cls.__docstring__
 
 
-def create_model_type(swagger_spec, model_name, model_spec, bases=(Model,), json_reference=None):
+def create_model_type(
+    swagger_spec, model_name, model_spec, bases=(Model,), json_reference=None, property_names=None,
+):
     """Create a dynamic class from the model data defined in the swagger
     spec.
 
@@ -649,22 +1082,41 @@ def create_model_type(swagger_spec, model_name, model_spec, bases=(Model,), json
     :param model_name: model name
     :param model_spec: json-like dict that describes a model.
     :param tuple bases: Base classes for type. At least one should be
-        :class:`.Model` or a subclass of it.
+        :class:`.Model` or a subclass of it. If one is :class:`.SlottedModel`
+        (or a subclass of it) the type has one slot per property.
     :returns: dynamic type inheriting from ``bases``.
     :param json_reference: JSON Uri where model spec could be found
     :type json_reference: str
+    :param property_names: names of the properties of the model, used only to
+        define the slots of types inheriting from :class:`.SlottedModel`. If None
+        they are determined from model_spec.
     :rtype: type
     """
+    is_slotted = any(SlottedModel in base.__mro__ for base in bases)
+    if is_slotted and property_names is None:
+        property_names = list(collapsed_properties(model_spec, swagger_spec))
+    # NOTE: property names might not be valid identifiers (or could shadow the Model methods),
+    # so slots have private names and are mapped to the properties via _property_slots
+    slot_names = tuple(
+        '_SlottedModel__property_{0}'.format(index)
+        for index in range(len(property_names) if is_slotted else 0)
+    )
 
-    return type(
+    model_type = type(
         str(model_name), bases, dict(
-            __slots__=(),  # More memory-efficient
+            __slots__=slot_names,  # More memory-efficient
             __doc__=ModelDocstring(),
             _swagger_spec=swagger_spec,
             _model_spec=model_spec,
             _json_reference=json_reference,
         ),
     )
+    if is_slotted:
+        model_type._property_slots = {
+            property_name: model_type.__dict__[slot_name]
+            for property_name, slot_name in zip(property_names, slot_names)
+        }
+    return model_type
 
 
 def is_model(swagger_spec, schema_object_spec):
@@ -747,6 +1199,84 @@ def create_model_docstring(swagger_spec, model_spec):
     return s
 
 
+def _walk_spec(spec_dict, spec_resolver, on_entry):
+    """Traverse, depth-first, the containers (list or dict) of spec_dict.
+
+    For each entry of the traversed containers on_entry is called with arguments
+    (container, key, json_reference), where json_reference is the JSON Uri of the
+    container, before traversing the entry value.
+
+    $refs are followed (with the RefResolver scope set to the referenced document)
+    and annotated with an 'x-scope' key. Fragments are traversed once.
+
+    The traversal is iterative, so the depth of spec_dict is not limited by the
+    interpreter recursion limit, and the JSON Uri of each entry is built only if
+    needed (ie. by on_entry or if the entry value is a container).
+
+    :param on_entry: callback invoked on each entry of the traversed containers.
+        NOTE: the callback should not mutate the current container
+    """
+    visited_ids = set()
+    # Containers being traversed: (container, iterator over its keys, JSON Uri of the container, $ref resolution context)
+    stack = []  # type: typing.List[typing.Tuple[typing.Any, typing.Iterator[typing.Any], typing.Text, typing.Any]]
+
+    def push_fragment(fragment, json_reference):
+        resolution_context = None
+        if is_ref(fragment):
+            attach_scope(fragment, spec_resolver)
+            # The context is exited once the referenced fragment has been traversed
+            resolution_context = spec_resolver.resolving(fragment['$ref'])
+            target = resolution_context.__enter__()
+            # Referenced fragments are not marked as visited, only their children are
+            if id(target) in visited_ids:
+                log.debug('Already visited %s', fragment['$ref'])
+                resolution_context.__exit__(None, None, None)
+                return
+
+            fragment = target
+            json_reference = spec_resolver.resolution_scope
+            if '#' not in json_reference:
+                # If $ref points to a file make sure that the fragment sign is present
+                json_reference = '{}#'.format(json_reference)
+
+        elif id(fragment) in visited_ids:
+            log.debug('Already visited id %d', id(fragment))
+            return
+
+        else:
+            visited_ids.add(id(fragment))
+
+        if is_dict_like(fragment):
+            stack.append((fragment, iter(sorted(iterkeys(fragment))), json_reference, resolution_context))
+        elif is_list_like(fragment):
+            stack.append((fragment, iter(range(len(fragment))), json_reference, resolution_context))
+        elif resolution_context is not None:
+            resolution_context.__exit__(None, None, None)
+
+    try:
+        push_fragment(spec_dict, '{}#'.format(spec_resolver.resolution_scope))
+        while stack:
+            container, keys, json_reference, resolution_context = stack[-1]
+            for key in keys:
+                on_entry(container, key, json_reference)
+                value = container[key]
+                if is_dict_like(value) or is_list_like(value):
+                    stack_size = len(stack)
+                    push_fragment(value, '{}/{}'.format(json_reference or '', key))
+                    if len(stack) > stack_size:
+                        # Traverse value before the next entries of container
+                        break
+            else:
+                stack.pop()
+                if resolution_context is not None:
+                    resolution_context.__exit__(None, None, None)
+    finally:
+        while stack:
+            resolution_context = stack.pop()[3]
+            if resolution_context is not None:
+                resolution_context.__exit__(None, None, None)
+
+
 def _post_process_spec(spec_dict, spec_resolver, on_container_callbacks):
     """Post-process the passed in swagger_spec.spec_dict.
 
@@ -770,142 +1300,91 @@ def _post_process_spec(spec_dict, spec_resolver, on_container_callbacks):
         NOTE: the individual callbacks should not mutate the current container
     """
 
-    def fire_callbacks(container, json_reference):
+    def fire_callbacks(container, key, json_reference):
+        json_ref = '{}/{}'.format(json_reference or '', key)
         for callback in on_container_callbacks:
-            callback(container, json_reference)
-
-    def skip_already_visited_fragments(func):
-        func.cache = cache = set()
-
-        @functools.wraps(func)
-        def wrapper(fragment, json_reference=None):
-            if json_reference is None:
-                json_reference = '{}#'.format(spec_resolver.resolution_scope)
-
-            is_reference = is_ref(fragment)
-            if is_reference:
-                ref = fragment['$ref']
-                attach_scope(fragment, spec_resolver)
-                with spec_resolver.resolving(ref) as target:
-                    if id(target) in cache:
-                        log.debug('Already visited %s', ref)
-                        return
-
-                    json_reference = spec_resolver.resolution_scope
-                    if '#' not in json_reference:
-                        # If $ref points to a file make sure that the fragment sign is present
-                        json_reference = '{}#'.format(json_reference)
-
-                    func(
-                        fragment=target,
-                        json_reference=json_reference,
-                    )
-                    return
+            callback(container, json_ref)
 
-            # fragment is guaranteed not to be a ref from this point onwards
-            fragment_id = id(fragment)
+    _walk_spec(spec_dict, spec_resolver, fire_callbacks)
 
-            if fragment_id in cache:
-                log.debug('Already visited id %d', fragment_id)
-                return
 
-            cache.add(id(fragment))
-            func(
-                fragment=fragment,
-                json_reference=json_reference,
-            )
-        return wrapper
+def _build_model_discoverer(spec, models):
+    """Build the on_entry callback of :func:`_walk_spec` that discovers the models of spec.
 
-    @skip_already_visited_fragments
-    def descend(fragment, json_reference=None):
-        """
-        :param fragment: node in spec_dict
-        :param json_reference: JSON Uri where the current fragment could be found
-        :type json_reference: str
+    :type spec: :class:`bravado_core.spec.Spec`
+    :param models: discovered model types are placed here
+    """
+    visited_models = {}
+
+    def discover_models(container, key, json_reference):
+        """Equivalent of firing _tag_models, _bless_models and _collect_models callbacks.
+
+        The callbacks (and the JSON Uri of the entry) are invoked only if cheap
+        pre-conditions, that are necessary for the callbacks to take any action, are met.
         """
-        if is_dict_like(fragment):
-            for key, value in sorted(iteritems(fragment)):
-                json_ref = '{}/{}'.format(json_reference or '', key)
-                fire_callbacks(fragment, json_ref)
-                descend(
-                    fragment=fragment[key],
-                    json_reference=json_ref,
-                )
+        if isinstance(key, string_types) and '/' in key:
+            # The callbacks determine key from the JSON Uri, it won't be the entry key
+            is_tag_candidate = is_bless_candidate = is_collect_candidate = True
+        else:
+            is_tag_candidate = json_reference.endswith('#/definitions')
+            is_collect_candidate = key == MODEL_MARKER
+            is_bless_candidate = False
+            if is_dict_like(container):
+                value = container[key]
+                # Blessed models take their name from the title attribute
+                is_bless_candidate = is_ref(value) or (is_dict_like(value) and bool(value.get('title')))
 
-        elif is_list_like(fragment):
-            for index in range(len(fragment)):
-                json_ref = '{}/{}'.format(json_reference or '', index)
-                fire_callbacks(fragment, json_ref)
-                descend(
-                    fragment=fragment[index],
-                    json_reference=json_ref,
-                )
+        if not (is_tag_candidate or is_bless_candidate or is_collect_candidate):
+            return
 
-    try:
-        descend(spec_dict)
-    finally:
-        descend.cache.clear()
+        json_ref = '{}/{}'.format(json_reference or '', key)
+        if is_tag_candidate:
+            _tag_models(container, json_ref, visited_models=visited_models, swagger_spec=spec)
+        if is_bless_candidate:
+            _bless_models(container, json_ref, visited_models=visited_models, swagger_spec=spec)
+        if is_collect_candidate:
+            _collect_models(container, json_ref, models=models, swagger_spec=spec)
 
+    return discover_models
 
-def _run_post_processing(spec):
-    visited_models = {}
 
-    def _call_post_process_spec(spec_dict):
-        # Discover all the models in spec_dict
-        _post_process_spec(
-            spec_dict=spec_dict,
-            spec_resolver=spec.resolver,
-            on_container_callbacks=[
-                functools.partial(
-                    _tag_models,
-                    visited_models=visited_models,
-                    swagger_spec=spec,
-                ),
-                functools.partial(
-                    _bless_models,
-                    visited_models=visited_models,
-                    swagger_spec=spec,
-                ),
-                functools.partial(
-                    _collect_models,
-                    models=spec.definitions,
-                    swagger_spec=spec,
-                ),
-            ],
-        )
+def _run_post_processing(spec):
+    discover_models = _build_model_discoverer(spec, spec.definitions)
 
     # Post process specs to identify models
-    _call_post_process_spec(spec.spec_dict)
+    _walk_spec(spec.spec_dict, spec.resolver, discover_models)
 
     processed_uris = {
         uri
         for uri in spec.resolver.store
         if uri == spec.origin_url or re.match(r'http://json-schema.org/draft-\d+/schema', uri)
     }
-    additional_uri = _get_unprocessed_uri(spec, processed_uris)
-    while additional_uri is not None:
-        # Post process each referenced specs to identify models in definitions of linked files
-        with spec.resolver.in_scope(additional_uri):
-            _call_post_process_spec(
-                spec.resolver.store[additional_uri],
-            )
+    additional_uris = _get_unprocessed_uris(spec, processed_uris)
+    while additional_uris:
+        for additional_uri in additional_uris:
+            # Post process each referenced specs to identify models in definitions of linked files
+            with spec.resolver.in_scope(additional_uri):
+                _walk_spec(spec.resolver.store[additional_uri], spec.resolver, discover_models)
+            processed_uris.add(additional_uri)
 
-        processed_uris.add(additional_uri)
-        additional_uri = _get_unprocessed_uri(spec, processed_uris)
+        # Post processing could have loaded new referenced specs
+        additional_uris = _get_unprocessed_uris(spec, processed_uris)
 
 
-def _get_unprocessed_uri(swagger_spec, processed_uris):
+def _get_unprocessed_uris(swagger_spec, processed_uris):
     """
-    Retrieve an un-process URI from swagger spec referred URIs
+    Retrieve the un-processed URIs from swagger spec referred URIs
 
     :type swagger_spec: bravado_core.spec.Spec
     :param processed_uris: URIs of the already processed URIs
 
-    :rtype: str
+    :rtype: list of str
     """
-    for uri in swagger_spec.resolver.store:
-        if uri not in processed_uris:
-            return uri
+    return [
+        uri
+        for uri in swagger_spec.resolver.store
+        if uri not in processed_uris
+    ]
 
 
 def model_discovery(swagger_spec):
@@ -915,14 +1394,18 @@ def model_discovery(swagger_spec):
     _run_post_processing(swagger_spec)
 
     if swagger_spec.config['internally_dereference_refs']:
-        from bravado_core.spec import Spec  # Local import to avoid circular import
         deref_flattened_spec = swagger_spec.deref_flattened_spec
-        tmp_spec = Spec(deref_flattened_spec, swagger_spec.origin_url, swagger_spec.http_client, swagger_spec.config)
 
         # Rebuild definitions using dereferences specs as base
         # this ensures that the generated models have no references
-        _run_post_processing(tmp_spec)
-        swagger_spec.definitions = tmp_spec.definitions
+        definitions = {}  # type: typing.Dict[typing.Text, typing.Type[Model]]
+        _walk_spec(
+            spec_dict=deref_flattened_spec,
+            # The dereferenced specs have no $refs, the resolver only provides the JSON Uri of the specs
+            spec_resolver=RefResolver(base_uri=swagger_spec.origin_url or '', referrer=deref_flattened_spec),
+            on_entry=_build_model_discoverer(swagger_spec, definitions),
+        )
+        swagger_spec.definitions = definitions
 
 
 def _to_pickleable_representation(model_name, model_type):
@@ -944,6 +1427,8 @@ def _to_pickleable_representation(model_name, model_type):
         'model_spec': model_type._model_spec,
         'bases': model_type.__bases__,
         'json_reference': model_type._json_reference,
+        # The spec is not usable while being unpickled, slotted types need to know their properties
+        'property_names': list(model_type._property_slots) if SlottedModel in model_type.__mro__ else None,
     }
 
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
+from collections import namedtuple
 
 import typing
 from six import iteritems
@@ -7,6 +8,7 @@ from six import PY2
 
 from bravado_core.exception import SwaggerSchemaError
 from bravado_core.param import Param
+from bravado_core.schema import is_dict_like
 from bravado_core.security_requirement import SecurityRequirement
 from bravado_core.util import AliasKeyDict
 from bravado_core.util import cached_property
@@ -21,6 +23,11 @@ if getattr(typing, 'TYPE_CHECKING', False):
 log = logging.getLogger(__name__)
 
 
+# Response specification of an operation, with the $refs of the response, of its
+# schema and of its headers resolved.
+ResolvedResponse = namedtuple('ResolvedResponse', ['response_spec', 'schema', 'headers'])
+
+
 def _sanitize_operation_id(operation_id, http_method, path_name):
     # type: (typing.Optional[typing.Text], typing.Text, typing.Text) -> typing.Text
     sanitized_operation_id = sanitize_name(operation_id or '')
@@ -160,6 +167,37 @@ class Operation(object):
             return deref(self.swagger_spec._internal_spec_dict.get('produces', []))
         return result
 
+    @cached_property
+    def resolved_responses(self):
+        # type: () -> typing.Dict[typing.Union[int, typing.Text], ResolvedResponse]
+        """Response specifications of the operation by status code, resolved once so
+        that responses are matched to their specification by a dict lookup.
+
+        Status codes are mapped both as int and as str (ie. 200 and '200'), the
+        `default` response specification is mapped as 'default'.
+
+        :rtype: dict
+        """
+        deref = self.swagger_spec.deref
+        result = {}  # type: typing.Dict[typing.Union[int, typing.Text], ResolvedResponse]
+        for status_code, response_spec in iteritems(deref(self.op_spec.get('responses')) or {}):
+            response_spec = deref(response_spec)
+            if not is_dict_like(response_spec):
+                continue
+            resolved_response = ResolvedResponse(
+                response_spec=response_spec,
+                schema=deref(response_spec.get('schema')),
+                headers={
+                    header_name: deref(header_spec)
+                    for header_name, header_spec in iteritems(deref(response_spec.get('headers')) or {})
+                },
+            )
+            status_code = str(status_code)
+            result[status_code] = resolved_response
+            if status_code.isdigit():
+                result[int(status_code)] = resolved_response
+        return result
+
     @classmethod
     def from_spec(cls, swagger_spec, path_name, http_method, op_spec):
         # type: (Spec, typing.Text, typing.Text, JSONDict) -> 'Operation'
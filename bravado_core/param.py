@@ -11,7 +11,8 @@ from bravado_core import schema
 from bravado_core.content_type import APP_JSON
 from bravado_core.exception import SwaggerMappingError
 from bravado_core.marshal import marshal_schema_object
-from bravado_core.unmarshal import unmarshal_schema_object
+from bravado_core.unmarshal import _get_unmarshaling_method
+from bravado_core.unmarshal import validate_and_unmarshal_schema_object
 from bravado_core.validate import validate_schema_object
 
 
@@ -166,60 +167,94 @@ def unmarshal_param(param, request):
     :type request: :class:`bravado_core.request.IncomingRequest`
     :return: value of parameter
     """
+    config = param.swagger_spec.config
+    request_attribute, param_unmarshaler = build_param_unmarshaler(
+        param,
+        validate=config['validate_requests'],
+        validate_while_unmarshaling=config['validate_while_unmarshaling'],
+    )
+    if request_attribute is None:
+        return param_unmarshaler(request)
+    return param_unmarshaler(getattr(request, request_attribute))
+
+
+def build_param_unmarshaler(param, validate=False, validate_while_unmarshaling=False):
+    """Build the function unmarshaling the given parameter.
+
+    Everything that depends only on the parameter specification (the type spec,
+    the default value, the casting and unmarshaling methods, etc.) is determined
+    once, so the function only extracts, casts, validates and unmarshals values.
+
+    The function accepts the attribute of the request like object holding the
+    values of the parameters in the location of param (ie. ``request.query``),
+    or the whole request like object for body parameters.
+
+    :type param: :class:`bravado_core.param.Param`
+    :param validate: whether the values have to be validated
+    :param validate_while_unmarshaling: whether the values have to be validated
+        while unmarshaling them, see :func:`bravado_core.unmarshal.validate_and_unmarshal_schema_object`
+    :return: tuple (name of the request attribute provided to the function, or None
+        if the function needs to be provided the request like object, function)
+    :raises: SwaggerMappingError when param location is not valid
+    """
     swagger_spec = param.swagger_spec
     deref = swagger_spec.deref
     param_spec = deref(get_param_type_spec(param))
     location = param.location
+    name = param.name
+    required = param.required
     param_type = deref(param_spec.get('type'))
-    cast_param = partial(cast_request_param, param_type, param.name)
-
+    cast_param = partial(cast_request_param, param_type, name)
     default_value = schema.get_default(swagger_spec, param_spec)
+    is_collection = param_type == 'array' and location != 'body'
+    unmarshaling_method = _get_unmarshaling_method(swagger_spec=swagger_spec, object_schema=param_spec)
+
+    def unmarshal_raw_value(raw_value):
+        if raw_value is None and not required:
+            return None
+
+        if is_collection:
+            raw_value = unmarshal_collection_format(swagger_spec, param_spec, raw_value)
+
+        if validate:
+            if validate_while_unmarshaling:
+                return validate_and_unmarshal_schema_object(swagger_spec, param_spec, raw_value)
+            validate_schema_object(swagger_spec, param_spec, raw_value)
+
+        return unmarshaling_method(raw_value)
 
     if location == 'path':
-        raw_value = cast_param(request.path.get(param.name, None))
+        return 'path', lambda path: unmarshal_raw_value(cast_param(path.get(name, None)))
     elif location == 'query':
-        raw_value = cast_param(request.query.get(param.name, default_value))
+        return 'query', lambda query: unmarshal_raw_value(cast_param(query.get(name, default_value)))
     elif location == 'header':
-        raw_value = cast_param(request.headers.get(param.name, default_value))
+        return 'headers', lambda headers: unmarshal_raw_value(cast_param(headers.get(name, default_value)))
     elif location == 'formData':
         if param_type == 'file':
-            raw_value = request.files.get(param.name, None)
-        else:
-            raw_value = cast_param(request.form.get(param.name, default_value))
+            return 'files', lambda files: unmarshal_raw_value(files.get(name, None))
+        return 'form', lambda form: unmarshal_raw_value(cast_param(form.get(name, default_value)))
     elif location == 'body':
-        try:
-            # TODO: verify content-type header
-            raw_value = request.json()
-        except ValueError as json_error:
-            # If the body parameter is required then we should make sure that an exception
-            # is thrown, instead if the body parameter is optional is OK-ish to assume that
-            # raw_value is the default_value
-            if param.required:
-                raise SwaggerMappingError(
-                    "Error reading request body JSON: {0}".format(str(json_error)),
-                )
-            else:
-                raw_value = default_value
+        def unmarshal_body(request):
+            try:
+                # TODO: verify content-type header
+                raw_value = request.json()
+            except ValueError as json_error:
+                # If the body parameter is required then we should make sure that an exception
+                # is thrown, instead if the body parameter is optional is OK-ish to assume that
+                # raw_value is the default_value
+                if required:
+                    raise SwaggerMappingError(
+                        "Error reading request body JSON: {0}".format(str(json_error)),
+                    )
+                else:
+                    raw_value = default_value
+            return unmarshal_raw_value(raw_value)
+        return None, unmarshal_body
     else:
         raise SwaggerMappingError(
             "Don't know how to unmarshal_param with location {0}".format(location),
         )
 
-    if raw_value is None and not param.required:
-        return None
-
-    if param_type == 'array' and location != 'body':
-        raw_value = unmarshal_collection_format(
-            swagger_spec, param_spec,
-            raw_value,
-        )
-
-    if swagger_spec.config['validate_requests']:
-        validate_schema_object(swagger_spec, param_spec, raw_value)
-
-    value = unmarshal_schema_object(swagger_spec, param_spec, raw_value)
-    return value
-
 
 def string_to_boolean(value):
     """Coerce the provided value into its Python boolean value if it's a string
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Eager evaluation of the structures that bravado-core otherwise builds lazily
+(while marshaling, unmarshaling and validating the first values).
+
+Prebuilding them in the parent process of a prefork server (gunicorn, uwsgi, etc.)
+allows the workers to share them, via copy-on-write memory pages, and ensures that
+the first requests served by each worker are not slower than the following ones.
+"""
+import logging
+from timeit import default_timer
+
+import typing
+from six import iteritems
+from six import itervalues
+from six import string_types
+
+from bravado_core.marshal import _get_marshaling_method
+from bravado_core.model import is_object
+from bravado_core.param import get_param_type_spec
+from bravado_core.request import _get_request_unmarshaler
+from bravado_core.schema import SWAGGER_PRIMITIVES
+from bravado_core.unmarshal import _get_unmarshaling_method
+from bravado_core.unmarshal import _get_validating_unmarshaling_method
+from bravado_core.validate import _get_validation_closure
+from bravado_core.validate import _get_validator
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core._compat_typing import JSONDict
+    from bravado_core.model import Model
+    from bravado_core.operation import Operation
+    from bravado_core.spec import Spec
+
+
+log = logging.getLogger(__name__)
+
+
+def _prebuild_validation(swagger_spec, schema):
+    # type: (Spec, JSONDict) -> None
+    # Mirrors the schemas used by bravado_core.validate.validate_schema_object
+    deref = swagger_spec.deref
+    schema = deref(schema)
+    default_type = 'object' if swagger_spec.config['default_type_to_object'] else None
+    schema_type = deref(schema.get('type', default_type))
+    if not schema_type:
+        return
+    if schema_type in SWAGGER_PRIMITIVES or schema_type == 'array' or is_object(swagger_spec, schema):
+        _get_validator(swagger_spec, schema)
+        if swagger_spec.config['validate_backend'] == 'compiled':
+            _get_validation_closure(swagger_spec, schema)
+
+
+def prebuild_schema(swagger_spec, schema):
+    # type: (Spec, JSONDict) -> None
+    """Build the marshaling, unmarshaling and (if enabled) validation methods of schema.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :param schema: schema in dict form, as provided to :func:`bravado_core.unmarshal.unmarshal_schema_object`
+    """
+    _get_unmarshaling_method(swagger_spec=swagger_spec, object_schema=schema)
+    _get_marshaling_method(swagger_spec=swagger_spec, object_schema=schema)
+
+    config = swagger_spec.config
+    if config['validate_requests'] or config['validate_responses']:
+        _prebuild_validation(swagger_spec, schema)
+        if config['validate_while_unmarshaling']:
+            _get_validating_unmarshaling_method(swagger_spec=swagger_spec, object_schema=schema)
+
+
+def prebuild_operation(op):
+    # type: (Operation) -> None
+    """Build the lazily evaluated attributes of op and the methods needed to
+    handle its parameters and responses.
+
+    :type op: :class:`bravado_core.operation.Operation`
+    """
+    swagger_spec = op.swagger_spec
+    deref = swagger_spec.deref
+
+    for cached_property_name in ('operation_id', 'consumes', 'produces', 'security_requirements', 'resolved_responses'):
+        getattr(op, cached_property_name)
+
+    for param in list(itervalues(op.params)) + op.security_parameters:
+        param_type_spec = get_param_type_spec(param)
+        if param_type_spec is not None:
+            prebuild_schema(swagger_spec, deref(param_type_spec))
+
+    config = swagger_spec.config
+    _get_request_unmarshaler(swagger_spec, op, config['validate_requests'], config['validate_while_unmarshaling'])
+
+    # Responses are mapped both by int and str status code, str keys cover all of them
+    for status_code, resolved_response in iteritems(op.resolved_responses):
+        if not isinstance(status_code, string_types):
+            continue
+        if resolved_response.schema is not None:
+            prebuild_schema(swagger_spec, resolved_response.schema)
+        for header_spec in itervalues(resolved_response.headers):
+            _prebuild_validation(swagger_spec, header_spec)
+
+
+def prebuild_model(model_type):
+    # type: (typing.Type[Model]) -> None
+    """Build the lazily evaluated class attributes of model_type and the methods
+    needed to handle its instances.
+
+    :type model_type: type
+    """
+    for lazy_class_attribute_name in ('_properties', '_inherits_from'):
+        getattr(model_type, lazy_class_attribute_name)
+    prebuild_schema(model_type._swagger_spec, model_type._model_spec)
+
+
+def prebuild_spec(swagger_spec):
+    # type: (Spec) -> typing.Dict[Operation, float]
+    """Build all the lazily evaluated structures of swagger_spec.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :returns: seconds spent building the structures of each operation. Structures shared
+        by multiple operations (ie. models) are accounted to the first operation using them.
+    :rtype: dict
+    """
+    for cached_property_name in ('resolver', 'security_definitions'):
+        getattr(swagger_spec, cached_property_name)
+    swagger_spec._build_request_to_op_map()
+
+    timings = {}
+    for resource in itervalues(swagger_spec.resources):
+        for op in itervalues(resource.operations):
+            start = default_timer()
+            prebuild_operation(op)
+            timings[op] = default_timer() - start
+            log.debug('Prebuilt %s in %.6f seconds', op, timings[op])
+
+    for model_type in itervalues(swagger_spec.definitions):
+        prebuild_model(model_type)
+
+    return timings
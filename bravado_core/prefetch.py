@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Concurrent loading of the documents referenced by multi-file specs.
+
+The RefResolver loads (downloads or reads, and parses) the referenced documents
+one at a time, while the spec is traversed by the validator and by model discovery.
+For specs split across many files loading the documents dominates the build time.
+
+Prefetching discovers all the documents referenced, directly or transitively, by
+the spec and loads them concurrently in a pool of threads. The RefResolver is then
+served the already loaded documents.
+"""
+import logging
+from multiprocessing.pool import ThreadPool
+
+import typing
+from six import iteritems
+from six import itervalues
+from six import string_types
+from six.moves.urllib.parse import urldefrag
+from six.moves.urllib.parse import urljoin
+from six.moves.urllib.parse import urlparse
+
+from bravado_core.schema import is_dict_like
+from bravado_core.schema import is_list_like
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    Handler = typing.Callable[[typing.Text], typing.Any]
+
+
+log = logging.getLogger(__name__)
+
+
+# Maximum number of documents loaded concurrently
+DEFAULT_MAX_WORKERS = 8
+
+
+def referenced_urls(document, document_url):
+    # type: (typing.Any, typing.Text) -> typing.Set[typing.Text]
+    """Absolute urls, without fragment, of the other documents referenced by document.
+
+    :param document: json-like document (ie. a spec dict)
+    :param document_url: url of the document, used to resolve relative $refs
+    """
+    urls = set()
+    visited_ids = set()
+    stack = [document]
+    while stack:
+        fragment = stack.pop()
+        if id(fragment) in visited_ids:
+            continue
+        visited_ids.add(id(fragment))
+
+        if is_dict_like(fragment):
+            ref = fragment.get('$ref')
+            if isinstance(ref, string_types):
+                urls.add(urldefrag(urljoin(document_url, ref))[0])
+            stack.extend(
+                value for value in itervalues(fragment)
+                if is_dict_like(value) or is_list_like(value)
+            )
+        elif is_list_like(fragment):
+            stack.extend(
+                value for value in fragment
+                if is_dict_like(value) or is_list_like(value)
+            )
+
+    urls.discard('')
+    urls.discard(urldefrag(document_url)[0])
+    return urls
+
+
+def prefetch_documents(spec_dict, origin_url, handlers, max_workers=DEFAULT_MAX_WORKERS):
+    # type: (typing.Any, typing.Text, typing.Mapping[typing.Text, Handler], int) -> typing.Dict[typing.Text, typing.Any]
+    """Load, concurrently, all the documents referenced directly or transitively by spec_dict.
+
+    Documents that could not be loaded are skipped (and logged), so that the usual
+    errors are raised while resolving their references.
+
+    :param spec_dict: swagger spec in json-like dict form
+    :param origin_url: the url used to retrieve the spec, if any
+    :param handlers: mapping from URI schemes to callables that load the document
+        at a given URI. See :meth:`bravado_core.spec.Spec.get_ref_handlers`
+    :param max_workers: maximum number of documents loaded concurrently
+    :returns: loaded documents by url
+    """
+    def load(url):
+        # type: (typing.Text) -> typing.Any
+        try:
+            return handlers[urlparse(url).scheme](url)
+        except Exception:
+            log.debug('Unable to prefetch %s', url, exc_info=True)
+            return None
+
+    documents = {}  # type: typing.Dict[typing.Text, typing.Any]
+    seen_urls = {urldefrag(origin_url)[0]}
+    urls_to_load = [
+        url
+        for url in sorted(referenced_urls(spec_dict, origin_url))
+        if urlparse(url).scheme in handlers
+    ]
+    if not urls_to_load:
+        return documents
+
+    pool = ThreadPool(processes=min(max_workers, len(urls_to_load)))
+    try:
+        while urls_to_load:
+            seen_urls.update(urls_to_load)
+            log.debug('Prefetching %d documents', len(urls_to_load))
+            loaded_documents = dict(
+                (url, document)
+                for url, document in zip(urls_to_load, pool.map(load, urls_to_load))
+                if document is not None
+            )
+            documents.update(loaded_documents)
+
+            # Documents referenced by the just loaded documents
+            urls_to_load = sorted({
+                url
+                for document_url, document in iteritems(loaded_documents)
+                for url in referenced_urls(document, document_url)
+                if url not in seen_urls and urlparse(url).scheme in handlers
+            })
+    finally:
+        pool.close()
+        pool.join()
+
+    return documents
+
+
+def build_prefetching_handlers(spec_dict, origin_url, handlers, max_workers=DEFAULT_MAX_WORKERS):
+    # type: (typing.Any, typing.Text, typing.Mapping[typing.Text, Handler], int) -> typing.Dict[typing.Text, Handler]
+    """Prefetch the documents referenced by spec_dict and build handlers serving them.
+
+    Documents that have not been prefetched are loaded by the original handlers.
+
+    :param spec_dict: swagger spec in json-like dict form
+    :param origin_url: the url used to retrieve the spec, if any
+    :param handlers: mapping from URI schemes to callables that load the document at a given URI
+    :param max_workers: maximum number of documents loaded concurrently
+    :returns: dict like {'http': callable, 'https': callable, 'file': callable}
+    """
+    documents = prefetch_documents(spec_dict, origin_url, handlers, max_workers)
+
+    def build_handler(handler):
+        # type: (Handler) -> Handler
+        def prefetched_handler(uri):
+            # type: (typing.Text) -> typing.Any
+            document = documents.get(uri)
+            if document is None:
+                return handler(uri)
+            return document
+        return prefetched_handler
+
+    return {
+        scheme: build_handler(handler)
+        for scheme, handler in iteritems(handlers)
+    }
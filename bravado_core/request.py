@@ -1,11 +1,23 @@
 # -*- coding: utf-8 -*-
+import typing
 from six import itervalues
 
 from bravado_core.operation import log
-from bravado_core.param import unmarshal_param
+from bravado_core.param import build_param_unmarshaler
+from bravado_core.util import memoize_by_id
 from bravado_core.validate import validate_security_object
 
 
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core.operation import Operation
+    from bravado_core.spec import Spec
+
+    ParamUnmarshaler = typing.Callable[[typing.Any], typing.Any]
+    RequestUnmarshaler = typing.List[
+        typing.Tuple[typing.Optional[typing.Text], typing.List[typing.Tuple[typing.Text, ParamUnmarshaler]]]
+    ]
+
+
 class IncomingRequest(object):
     """
     Common interface for server side request objects.
@@ -63,13 +75,53 @@ def unmarshal_request(request, op):
     :type op: :class:`bravado_core.operation.Operation`
     :returns: dict where (key, value) = (param_name, param_value)
     """
+    swagger_spec = op.swagger_spec
+    request_unmarshaler = _get_request_unmarshaler(
+        swagger_spec,
+        op,
+        swagger_spec.config['validate_requests'],
+        swagger_spec.config['validate_while_unmarshaling'],
+    )
+
     request_data = {}
-    for param in itervalues(op.params):
-        param_value = unmarshal_param(param, request)
-        request_data[param.name] = param_value
+    for request_attribute, param_unmarshalers in request_unmarshaler:
+        values = request if request_attribute is None else getattr(request, request_attribute)
+        for param_name, param_unmarshaler in param_unmarshalers:
+            request_data[param_name] = param_unmarshaler(values)
 
-    if op.swagger_spec.config['validate_requests']:
+    if swagger_spec.config['validate_requests']:
         validate_security_object(op, request_data)
 
     log.debug('Swagger request_data: %s', request_data)
     return request_data
+
+
+@memoize_by_id
+def _get_request_unmarshaler(swagger_spec, op, validate, validate_while_unmarshaling):
+    # type: (Spec, Operation, bool, bool) -> RequestUnmarshaler
+    """Build the unmarshalers of the parameters of op, see :func:`bravado_core.param.build_param_unmarshaler`.
+
+    The unmarshalers are grouped by the request attribute holding the values of their
+    parameters, so that each attribute is retrieved once per request.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :type op: :class:`bravado_core.operation.Operation`
+    :param validate: whether the parameters have to be validated
+    :param validate_while_unmarshaling: whether the parameters have to be validated while unmarshaling them
+    :returns: list of tuples (request attribute, or None for the whole request,
+        list of tuples (param name, param unmarshaler))
+    """
+    request_unmarshaler = []  # type: RequestUnmarshaler
+    param_unmarshalers_by_attribute = {}  # type: typing.Dict[typing.Optional[typing.Text], typing.List[typing.Tuple[typing.Text, ParamUnmarshaler]]]  # noqa: E501
+    for param in itervalues(op.params):
+        request_attribute, param_unmarshaler = build_param_unmarshaler(
+            param,
+            validate=validate,
+            validate_while_unmarshaling=validate_while_unmarshaling,
+        )
+        param_unmarshalers = param_unmarshalers_by_attribute.get(request_attribute)
+        if param_unmarshalers is None:
+            param_unmarshalers = param_unmarshalers_by_attribute[request_attribute] = []
+            request_unmarshaler.append((request_attribute, param_unmarshalers))
+        param_unmarshalers.append((param.name, param_unmarshaler))
+    return request_unmarshaler
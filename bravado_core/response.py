@@ -1,18 +1,26 @@
 # -*- coding: utf-8 -*-
+import re
+
 import msgpack
+import simplejson as json
 from jsonschema import ValidationError
 from six import iteritems
+from six import itervalues
 
 from bravado_core.content_type import APP_JSON
 from bravado_core.content_type import APP_MSGPACK
 from bravado_core.exception import MatchingResponseNotFound
 from bravado_core.exception import SwaggerMappingError
+from bravado_core.operation import ResolvedResponse
 from bravado_core.unmarshal import unmarshal_schema_object
+from bravado_core.unmarshal import validate_and_unmarshal_schema_object
 from bravado_core.validate import validate_schema_object
 
 # Response bodies considered to be empty
 EMPTY_BODIES = (None, '', '{}', 'null')
 
+_JSON_WHITESPACE_MATCHER = re.compile(r'[ \t\n\r]*').match
+
 
 class IncomingResponse(object):
     """Interface for incoming client-side response objects.
@@ -101,30 +109,123 @@ def unmarshal_response(response, op):
     :returns: value where type(value) matches response_spec['schema']['type']
         if it exists, None otherwise.
     """
-    deref = op.swagger_spec.deref
-    response_spec = get_response_spec(response.status_code, op)
+    resolved_response = get_resolved_response(response.status_code, op)
 
-    if 'schema' not in response_spec:
+    if 'schema' not in resolved_response.response_spec:
         # If response spec does not define schema
         return None
 
     content_type = response.headers.get('content-type', '').lower()
 
     if content_type.startswith(APP_JSON) or content_type.startswith(APP_MSGPACK):
-        content_spec = deref(response_spec['schema'])
+        content_spec = resolved_response.schema
         if content_type.startswith(APP_JSON):
             content_value = response.json()
         else:
             content_value = msgpack.loads(response.raw_bytes, raw=False)
-        if op.swagger_spec.config['validate_responses']:
-            validate_schema_object(op.swagger_spec, content_spec, content_value)
-
-        return unmarshal_schema_object(op.swagger_spec, content_spec, content_value)
+        return _unmarshal_content(op.swagger_spec, content_spec, content_value)
 
     # TODO: Non-json response contents
     return response.text
 
 
+def iter_unmarshal_response(response, op):
+    """Unmarshal incoming http response, whose specification defines an array,
+    yielding one unmarshaled item at a time.
+
+    Differently from :func:`unmarshal_response`, the body (`raw_bytes`) is decoded
+    incrementally, so neither the decoded list nor the list of unmarshaled items
+    are ever fully loaded in memory.
+
+    NOTE: if `validate_responses` is enabled every item is validated against the
+    items specification, but keywords of the array itself (ie. `maxItems`) are ignored.
+
+    :type response: :class:`bravado_core.response.IncomingResponse`
+    :type op: :class:`bravado_core.operation.Operation`
+    :returns: iterator of the unmarshaled items
+    :raises: SwaggerMappingError if the response specification does not define an
+        array or if the response content-type is not supported.
+    """
+    swagger_spec = op.swagger_spec
+    deref = swagger_spec.deref
+    content_spec = get_resolved_response(response.status_code, op).schema
+    if content_spec is None or deref(content_spec.get('type')) != 'array':
+        raise SwaggerMappingError(
+            "Response specification of {0} does not define an array".format(op.operation_id),
+        )
+
+    content_type = response.headers.get('content-type', '').lower()
+    if content_type.startswith(APP_JSON):
+        content_text = response.raw_bytes.decode('utf-8')
+        index = _JSON_WHITESPACE_MATCHER(content_text).end()
+        if not content_text.startswith('[', index):
+            content_value = response.json()
+            return iter(_unmarshal_content(swagger_spec, content_spec, content_value) or ())
+        content_items = _iter_json_array_items(content_text, index)
+    elif content_type.startswith(APP_MSGPACK):
+        unpacker = msgpack.Unpacker(raw=False)
+        unpacker.feed(response.raw_bytes)
+        try:
+            number_of_items = unpacker.read_array_header()
+        except ValueError:  # the content is not an array
+            content_value = msgpack.loads(response.raw_bytes, raw=False)
+            return iter(_unmarshal_content(swagger_spec, content_spec, content_value) or ())
+        content_items = (unpacker.unpack() for _ in range(number_of_items))
+    else:
+        raise SwaggerMappingError(
+            "Unsupported content-type in response: {0}".format(content_type),
+        )
+
+    item_spec = deref(content_spec.get('items', {}))
+    return (
+        _unmarshal_content(swagger_spec, item_spec, content_item)
+        for content_item in content_items
+    )
+
+
+def _unmarshal_content(swagger_spec, content_spec, content_value):
+    """Validate, if needed, and unmarshal the content of an incoming response.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :type content_spec: dict
+    :param content_value: decoded content of the response
+    """
+    if swagger_spec.config['validate_responses']:
+        if swagger_spec.config['validate_while_unmarshaling']:
+            return validate_and_unmarshal_schema_object(swagger_spec, content_spec, content_value)
+        validate_schema_object(swagger_spec, content_spec, content_value)
+
+    return unmarshal_schema_object(swagger_spec, content_spec, content_value)
+
+
+def _iter_json_array_items(content_text, index):
+    """Decode, one at a time, the items of the JSON array starting at index.
+
+    :type content_text: str
+    :param index: position of the opening bracket of the array
+    :raises: ValueError if content_text is not valid JSON
+    """
+    decoder = json.JSONDecoder()
+    index = _JSON_WHITESPACE_MATCHER(content_text, index + 1).end()
+    if content_text.startswith(']', index):
+        index += 1
+    else:
+        while True:
+            item, index = decoder.raw_decode(content_text, index)
+            yield item
+            index = _JSON_WHITESPACE_MATCHER(content_text, index).end()
+            if content_text.startswith(']', index):
+                index += 1
+                break
+            elif not content_text.startswith(',', index):
+                raise json.JSONDecodeError("Expecting ',' delimiter", content_text, index)
+            index = _JSON_WHITESPACE_MATCHER(content_text, index + 1).end()
+
+    index = _JSON_WHITESPACE_MATCHER(content_text, index).end()
+    if index != len(content_text):
+        raise json.JSONDecodeError('Extra data', content_text, index)
+
+
 def get_response_spec(status_code, op):
     """Given the http status_code of an operation invocation's response, figure
     out which response specification it maps to.
@@ -144,22 +245,54 @@ def get_response_spec(status_code, op):
     :raises: MatchingResponseNotFound when the status_code could not be mapped
         to a response specification.
     """
-    deref = op.swagger_spec.deref
-    op_spec = deref(op.op_spec)
-    response_specs = deref(op_spec.get('responses'))
-    default_response_spec = deref(response_specs.get('default', None))
+    return get_resolved_response(status_code, op).response_spec
 
-    response_spec = deref(
-        response_specs.get(str(status_code), default_response_spec),
-    )
 
-    if response_spec is None:
+def get_resolved_response(status_code, op):
+    """Same as :func:`get_response_spec`, but returns the response specification
+    together with its dereferenced schema and headers.
+
+    :type status_code: int
+    :type op: :class:`bravado_core.operation.Operation`
+
+    :rtype: :class:`bravado_core.operation.ResolvedResponse`
+    :raises: MatchingResponseNotFound when the status_code could not be mapped
+        to a response specification.
+    """
+    resolved_responses = op.resolved_responses
+    resolved_response = resolved_responses.get(status_code) or resolved_responses.get('default')
+
+    if resolved_response is None:
         raise MatchingResponseNotFound(
             "Response specification matching http status_code {0} not found "
             "for operation {1}. Either add a response specification for the "
             "status_code or use a `default` response.".format(status_code, op),
         )
-    return response_spec
+    return resolved_response
+
+
+def _resolve_response_spec(op, response_spec):
+    """Find the resolved response of op whose specification is response_spec,
+    dereferencing schema and headers of response specifications that do not
+    belong to op.
+
+    :type op: :class:`bravado_core.operation.Operation`
+    :type response_spec: dict
+    :rtype: :class:`bravado_core.operation.ResolvedResponse`
+    """
+    for resolved_response in itervalues(op.resolved_responses):
+        if resolved_response.response_spec is response_spec:
+            return resolved_response
+
+    deref = op.swagger_spec.deref
+    return ResolvedResponse(
+        response_spec=response_spec,
+        schema=deref(response_spec.get('schema')),
+        headers={
+            header_name: deref(header_spec)
+            for header_name, header_spec in iteritems(deref(response_spec.get('headers')) or {})
+        },
+    )
 
 
 def validate_response(response_spec, op, response):
@@ -186,10 +319,8 @@ def validate_response_body(op, response_spec, response):
 
     :raises: SwaggerMappingError
     """
-    deref = op.swagger_spec.deref
-
     # response that returns nothing in the body
-    response_body_spec = deref(response_spec.get('schema'))
+    response_body_spec = _resolve_response_spec(op, response_spec).schema
     if response_body_spec is None:
         if response.text in EMPTY_BODIES:
             return
@@ -232,14 +363,8 @@ def validate_response_headers(op, response_spec, response):
     :type response_spec: dict
     :type response: :class:`bravado_core.response.OutgoingResponse`
     """
-    deref = op.swagger_spec.deref
-
-    headers_spec = deref(response_spec.get('headers'))
-    if not headers_spec:
-        return
-
+    headers_spec = _resolve_response_spec(op, response_spec).headers
     for header_name, header_spec in iteritems(headers_spec):
-        header_spec = deref(header_spec)
         try:
             validate_schema_object(
                 op.swagger_spec, header_spec, response.headers.get(header_name),
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Map concrete request paths (ie. ``/v2/pet/42``) to the matching operations.
+
+The router is a trie of path segments, so the cost of a lookup depends on
+the number of segments of the request path and not on the number of paths
+defined by the specification.
+"""
+import re
+from collections import OrderedDict
+
+import typing
+from six import itervalues
+from six.moves.urllib.parse import unquote
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core.operation import Operation
+    from bravado_core.spec import Spec
+
+    PathParams = typing.Dict[typing.Text, typing.Text]
+
+
+_PATH_PARAM_PATTERN = re.compile(r'{([^}]+)}')
+
+
+class _RouterNode(object):
+    def __init__(self):
+        # type: () -> None
+        # (key, value) = (path segment, _RouterNode)
+        self.static_children = {}  # type: typing.Dict[typing.Text, _RouterNode]
+        # (key, value) = (path segment, _TemplatedChild) for segments with path parameters. e.g. {petId}
+        self.templated_children = OrderedDict()  # type: typing.Dict[typing.Text, _TemplatedChild]
+        # (key, value) = (http method, Operation)
+        self.operations = {}  # type: typing.Dict[typing.Text, Operation]
+
+
+class _TemplatedChild(object):
+    def __init__(self, segment):
+        # type: (typing.Text) -> None
+        self.param_names = tuple(_PATH_PARAM_PATTERN.findall(segment))
+        if segment == '{{{0}}}'.format(self.param_names[0]):
+            # The whole segment is the path parameter, no need to use regular expressions
+            self.matcher = None  # type: typing.Optional[typing.Pattern[typing.Text]]
+        else:
+            self.matcher = re.compile('^{0}$'.format(
+                '(.+?)'.join(re.escape(part) for part in _PATH_PARAM_PATTERN.split(segment)[::2]),
+            ))
+        self.node = _RouterNode()
+
+
+class Router(object):
+    """Map concrete request paths to the matching operation and path parameters.
+
+    If multiple path templates match a request path, segments without path
+    parameters have precedence (ie. ``/pet/findByStatus`` over ``/pet/{petId}``).
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self._root = _RouterNode()
+        # (key, value) = ((http method, path), Operation) for paths without path parameters
+        self._static_operations = {}  # type: typing.Dict[typing.Tuple[typing.Text, typing.Text], Operation]
+
+    def add_operation(self, path_template, operation):
+        # type: (typing.Text, Operation) -> None
+        """
+        :param path_template: path of the operation, including the base path. e.g. /v2/pet/{petId}
+        :type operation: :class:`bravado_core.operation.Operation`
+        """
+        http_method = operation.http_method.lower()
+        if not _PATH_PARAM_PATTERN.search(path_template):
+            self._static_operations[(http_method, path_template)] = operation
+            return
+
+        node = self._root
+        for segment in path_template.split('/'):
+            if _PATH_PARAM_PATTERN.search(segment):
+                if segment not in node.templated_children:
+                    node.templated_children[segment] = _TemplatedChild(segment)
+                node = node.templated_children[segment].node
+            else:
+                node = node.static_children.setdefault(segment, _RouterNode())
+        node.operations[http_method] = operation
+
+    def match(self, http_method, path):
+        # type: (typing.Text, typing.Text) -> typing.Optional[typing.Tuple[Operation, PathParams]]
+        """Find the operation serving the request.
+
+        :param http_method: http method of the request
+        :param path: request path, without query string. e.g. /v2/pet/42
+
+        :returns: tuple of the matching operation and the (url-decoded) path parameters
+            or None if a match couldn't be found
+        """
+        http_method = http_method.lower()
+        operation = self._static_operations.get((http_method, path))
+        if operation is not None:
+            return operation, {}
+
+        path_params = {}  # type: PathParams
+        operation = _match(self._root, http_method, path.split('/'), 0, path_params)
+        if operation is None:
+            return None
+        return operation, path_params
+
+
+def _match(node, http_method, segments, index, path_params):
+    # type: (_RouterNode, typing.Text, typing.List[typing.Text], int, PathParams) -> typing.Optional[Operation]
+    if index == len(segments):
+        return node.operations.get(http_method)
+
+    segment = segments[index]
+    static_child = node.static_children.get(segment)
+    if static_child is not None:
+        operation = _match(static_child, http_method, segments, index + 1, path_params)
+        if operation is not None:
+            return operation
+
+    if not segment:
+        return None
+
+    for templated_child in itervalues(node.templated_children):
+        if templated_child.matcher is None:
+            param_values = (segment,)  # type: typing.Sequence[typing.Text]
+        else:
+            match = templated_child.matcher.match(segment)
+            if match is None:
+                continue
+            param_values = match.groups()
+
+        operation = _match(templated_child.node, http_method, segments, index + 1, path_params)
+        if operation is not None:
+            for param_name, param_value in zip(templated_child.param_names, param_values):
+                path_params[param_name] = unquote(param_value)
+            return operation
+
+    return None
+
+
+def build_router(swagger_spec):
+    # type: (Spec) -> Router
+    """Build the router of all the operations defined by swagger_spec.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    """
+    router = Router()
+    base_path = swagger_spec.spec_dict.get('basePath', '').rstrip('/')
+    for resource in swagger_spec.resources.values():
+        for operation in resource.operations.values():
+            router.add_operation(base_path + operation.path_name, operation)
+    return router
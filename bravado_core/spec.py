@@ -1,42 +1,50 @@
 # -*- coding: utf-8 -*-
-import json
+import gc
 import logging
-import os.path
 import warnings
 from copy import deepcopy
 from itertools import chain
 
 import typing
-import yaml
-from jsonref import JsonRef
 from jsonschema import FormatChecker
 from jsonschema.validators import RefResolver
 from six import iteritems
 from six import iterkeys
-from six.moves import range
 from six.moves.urllib.parse import urlparse
 from six.moves.urllib.parse import urlunparse
-from six.moves.urllib.request import url2pathname
 from swagger_spec_validator import validator20
 from swagger_spec_validator.ref_validators import in_scope
 
 from bravado_core import formatter
 from bravado_core import version as _version
+from bravado_core.dereference import dereference_refs
 from bravado_core.exception import SwaggerSchemaError
 from bravado_core.exception import SwaggerValidationError
 from bravado_core.formatter import return_true_wrapper
+from bravado_core.loader import get_file_url
+from bravado_core.loader import is_yaml  # noqa: F401  # is_yaml used to be defined here
+from bravado_core.loader import load_file
+from bravado_core.loader import load_json
+from bravado_core.loader import load_url
+from bravado_core.loader import load_yaml
 from bravado_core.model import _from_pickleable_representation
 from bravado_core.model import _to_pickleable_representation
 from bravado_core.model import Model
 from bravado_core.model import model_discovery
+from bravado_core.prebuild import prebuild_spec
+from bravado_core.prefetch import build_prefetching_handlers
 from bravado_core.resource import build_resources
+from bravado_core.router import build_router
 from bravado_core.schema import is_dict_like
-from bravado_core.schema import is_list_like
 from bravado_core.schema import is_ref
 from bravado_core.security_definition import SecurityDefinition
+from bravado_core.spec_cache import build_cache_key
+from bravado_core.spec_cache import load_spec
+from bravado_core.spec_cache import store_spec
 from bravado_core.spec_flattening import flattened_spec
 from bravado_core.util import cached_property
-from bravado_core.util import memoize_by_id
+from bravado_core.util import MemoizeCache
+from bravado_core.util import MemoizeCacheRegistry
 from bravado_core.util import strip_xscope
 
 
@@ -69,6 +77,18 @@ CONFIG_DEFAULTS = {
     #       server side can use either models or dicts.
     'use_models': True,
 
+    # If True, model types store the property values of their instances in slots
+    # (see bravado_core.model.SlottedModel) instead of in a dictionary. Instances use
+    # much less memory, which matters if many unmarshaled objects are kept around.
+    'slotted_models': False,
+
+    # If True, model instances wrap the raw (JSON) values of their properties and unmarshal
+    # each property (nested models, formats, etc.) on first access (see bravado_core.model.LazyModel).
+    # This saves CPU time if only a few properties of large responses are accessed.
+    # NOTE: it takes precedence over slotted_models. Errors in the property values are raised when
+    #       the properties are accessed, unless values are validated before being unmarshaled.
+    'lazy_models': False,
+
     # List of user-defined formats of type
     # :class:`bravado_core.formatter.SwaggerFormat`. These formats are in
     # addition to the formats already supported by the Swagger 2.0
@@ -96,9 +116,78 @@ CONFIG_DEFAULTS = {
     # If False, use str() function for 'byte' format
     # If True, encode/decode base64 data for 'byte' format
     'use_base64_for_byte_format': False,
+
+    # If False, RFC3339 values of 'date' and 'date-time' formats are parsed natively (falling back to
+    # dateutil for the other values), which is much faster and gives equal results.
+    # If True, all the values are parsed by dateutil.parser.parse
+    'use_dateutil_for_dates': False,
+
+    # Handling of arrays of numbers and integers (without format or with the default formats).
+    # If None, convert the items one at a time into lists.
+    # If 'list', convert all the items at once (via array.array) into lists.
+    # If 'array', unmarshal the arrays into array.array objects.
+    # If 'numpy', unmarshal the arrays into numpy.ndarray objects (numpy has to be installed).
+    #   Arrays of any of the above types, lists and tuples are accepted while marshaling.
+    # NOTE: arrays with items that could not be converted at once (ie. null items) are converted
+    #       one item at a time, and unmarshaled into lists.
+    'numeric_array_type': None,
+
+    # Strategy used to build the unmarshaling methods of object schemas.
+    # If 'partial', compose the generic unmarshaling functions via functools.partial
+    # If 'codegen', generate (and compile) one specialized function per object schema.
+    #   Polymorphic schemas fall back to the 'partial' strategy.
+    'unmarshal_backend': 'partial',
+
+    # Strategy used to build the marshaling methods of object schemas.
+    # Possible values, and their meaning, are the same as for unmarshal_backend.
+    'marshal_backend': 'partial',
+
+    # Strategy used to validate values against schemas.
+    # If 'jsonschema', validate values via (cached) jsonschema validators
+    # If 'compiled', check values via closures specialized once per schema.
+    #   jsonschema validators are still used to report validation errors.
+    'validate_backend': 'jsonschema',
+
+    # If True, validate response bodies and request parameters while unmarshaling them
+    # (so with a single traversal of the value). Raised errors are not affected.
+    # NOTE: this has effect only if validate_responses or validate_requests are enabled
+    'validate_while_unmarshaling': False,
+
+    # If True, build all the marshaling, unmarshaling and validation methods while building
+    # the spec instead of while handling the first requests/responses. See Spec.prebuild
+    'warm_up': False,
+
+    # Maximum number of values cached, per Spec, by each memoized function (ie. the unmarshaling
+    # methods per schema). Least recently used values are evicted first. If None, caches are unbounded.
+    # NOTE: evicted values are rebuilt when needed, so small values could hurt performances
+    'memoize_cache_maxsize': None,
+
+    # If True, load all the documents referenced by the spec ($refs to other files or urls)
+    # concurrently, in a pool of threads, before validating the spec.
+    # NOTE: http_client needs to be thread-safe if the spec references remote documents
+    'prefetch_refs': False,
+
+    # Callable used to parse JSON documents (the spec and the documents it references), as
+    # alternative to json.loads (ie. orjson.loads). It is given the documents as bytes, or as
+    # text if the http client provides text content.
+    # See bravado_core.loader.load_json
+    'json_loads': None,
 }
 
 
+_CACHE_MISS = object()
+
+
+def _resolve_ref(swagger_spec, ref_dict):
+    # type: (Spec, typing.Any) -> typing.Any
+    # Restore attached resolution scope before resolving since the
+    # resolver doesn't have a traversal history (accumulated scope_stack)
+    # when asked to resolve.
+    with in_scope(swagger_spec.resolver, ref_dict):
+        _, target = swagger_spec.resolver.resolve(ref_dict['$ref'])
+        return target
+
+
 def _identity(obj):
     # type: (T) -> T
     return obj
@@ -139,10 +228,18 @@ class Spec(object):
         # Built on-demand - see get_op_for_request(..)
         self._request_to_op_map = None
 
+        # Built by build(..), or on-demand - see match_request(..)
+        self._router = None
+
         # (key, value) = (format name, SwaggerFormat)
         self.user_defined_formats = {}
         self.format_checker = FormatChecker()
 
+        # Compiled artifacts, as marshaling, unmarshaling and validation methods, of the schemas.
+        # They're released with the Spec, or could be explicitly released via compiled.clear().
+        # See bravado_core.util.MemoizeCacheRegistry for introspection.
+        self.compiled = MemoizeCacheRegistry(maxsize=self.config['memoize_cache_maxsize'])
+
         # spec dict used to build resources, in case internally_dereference_refs config is enabled
         # it will be overridden by the dereferenced specs (by build method). More context in PR#263
         self._internal_spec_dict = spec_dict
@@ -185,6 +282,9 @@ class Spec(object):
             if attr_name in {
                 'format_checker',   # jsonschema.FormatChecker does not define an equality method
                 'resolver',         # jsonschema.validators.RefResolver does not define an equality method
+                '_request_to_op_map',  # bravado_core.operation.Operation instances are compared via resources
+                '_router',          # bravado_core.router.Router is derived from resources
+                'compiled',         # Compiled artifacts are derived from the other attributes
             }:
                 continue
 
@@ -243,7 +343,11 @@ class Spec(object):
 
         # Copy the attributes that are built via Spec.build
         for attr_name, attr_value in iteritems(self.__dict__):
-            setattr(copied_self, attr_name, deepcopy(attr_value, memo=memo))
+            if attr_name == 'compiled':
+                # Cached values refer to self, the copy will build its own
+                setattr(copied_self, attr_name, MemoizeCacheRegistry(maxsize=attr_value.maxsize))
+            else:
+                setattr(copied_self, attr_name, deepcopy(attr_value, memo=memo))
 
         return copied_self
 
@@ -261,6 +365,9 @@ class Spec(object):
                 # are not directly pickleable.
                 # Check bravado_core.model._to_pickleable_representation for details.
                 'definitions',
+                # Exclude compiled artifacts as they contain runtime defined functions.
+                # They will be rebuilt, if needed, once unpickled.
+                'compiled',
             )
         }
 
@@ -297,6 +404,7 @@ class Spec(object):
         }
         self.__dict__.clear()
         self.__dict__.update(state)
+        self.compiled = MemoizeCacheRegistry(maxsize=self.config.get('memoize_cache_maxsize'))
 
     @cached_property
     def client_spec_dict(self):
@@ -335,7 +443,7 @@ class Spec(object):
         return strip_xscope(self.spec_dict)
 
     @classmethod
-    def from_dict(cls, spec_dict, origin_url=None, http_client=None, config=None):
+    def from_dict(cls, spec_dict, origin_url=None, http_client=None, config=None, cache_dir=None):
         """Build a :class:`Spec` from Swagger API Specification
 
         :param spec_dict: swagger spec in json-like dict form.
@@ -343,21 +451,83 @@ class Spec(object):
         :type  origin_url: str
         :param http_client: http client used to download remote $refs
         :param config: Configuration dict. See CONFIG_DEFAULTS.
+        :param cache_dir: directory where to store snapshots of the built Spec, if any.
+            If a snapshot of the same spec is present, and no local file referenced
+            by the spec changed, the Spec is loaded from the snapshot instead of being built.
+        :type  cache_dir: str
         """
+        if cache_dir is not None:
+            cache_key = build_cache_key(spec_dict, origin_url, config)
+            spec = load_spec(cls, cache_dir, cache_key, http_client)
+            if spec is not None:
+                if spec.config['warm_up']:
+                    # Built methods are not part of the snapshots
+                    spec.prebuild()
+                return spec
+
         spec = cls(spec_dict, origin_url, http_client, config)
         spec.build()
+
+        if cache_dir is not None:
+            store_spec(spec, cache_dir, cache_key)
         return spec
 
-    def _validate_spec(self):
+    @classmethod
+    def from_file(cls, path, http_client=None, config=None, cache_dir=None):
+        """Build a :class:`Spec` from a local JSON or YAML Swagger API Specification.
+
+        The file is parsed via :mod:`bravado_core.loader`, see the json_loads config.
+
+        :param path: path of the spec file
+        :type  path: str
+        :param http_client: http client used to download remote $refs
+        :param config: Configuration dict. See CONFIG_DEFAULTS.
+        :param cache_dir: directory where to store snapshots of the built Spec, if any. See :meth:`from_dict`
+        :type  cache_dir: str
+        """
+        return cls.from_url(get_file_url(path), http_client=http_client, config=config, cache_dir=cache_dir)
+
+    @classmethod
+    def from_url(cls, spec_url, http_client=None, config=None, cache_dir=None):
+        """Build a :class:`Spec` from the JSON or YAML Swagger API Specification at spec_url.
+
+        The spec is retrieved, and parsed, via :mod:`bravado_core.loader`, see the json_loads config.
+
+        :param spec_url: url of the spec. Local files are referred via file:// urls
+        :type  spec_url: str
+        :param http_client: http client used to download the spec and remote $refs.
+            If None, the spec is downloaded via :func:`urllib.request.urlopen`
+        :param config: Configuration dict. See CONFIG_DEFAULTS.
+        :param cache_dir: directory where to store snapshots of the built Spec, if any. See :meth:`from_dict`
+        :type  cache_dir: str
+        """
+        json_loads = dict(CONFIG_DEFAULTS, **(config or {}))['json_loads']
+        spec_dict = load_url(spec_url, http_client=http_client, json_loads=json_loads)
+        return cls.from_dict(spec_dict, origin_url=spec_url, http_client=http_client, config=config, cache_dir=cache_dir)
+
+    def _validate_spec(self, http_handlers=None):
         if self.config['validate_swagger_spec']:
             self.resolver = validator20.validate_spec(
                 spec_dict=self.spec_dict,
                 spec_url=self.origin_url or '',
-                http_handlers=self.get_ref_handlers(),
+                http_handlers=http_handlers or self.get_ref_handlers(),
+            )
+        elif http_handlers is not None:
+            self.resolver = RefResolver(
+                base_uri=self.origin_url or '',
+                referrer=self.spec_dict,
+                handlers=http_handlers,
             )
 
     def build(self):
-        self._validate_spec()
+        http_handlers = None
+        if self.config['prefetch_refs']:
+            http_handlers = build_prefetching_handlers(
+                spec_dict=self.spec_dict,
+                origin_url=self.origin_url or '',
+                handlers=self.get_ref_handlers(),
+            )
+        self._validate_spec(http_handlers)
 
         model_discovery(self)
 
@@ -370,6 +540,7 @@ class Spec(object):
             self.register_format(user_defined_format)
 
         self.resources = build_resources(self)
+        self._router = build_router(self)
 
         self.api_url = build_api_serving_url(
             spec_dict=self.spec_dict,
@@ -377,6 +548,34 @@ class Spec(object):
             use_spec_url_for_base_path=self.config['use_spec_url_for_base_path'],
         )
 
+        if self.config['warm_up']:
+            self.prebuild()
+
+    def prebuild(self, freeze=False):
+        """Build all the structures that are otherwise built lazily, while handling
+        the first requests and responses of each operation (ie. marshaling and
+        unmarshaling methods, validators, model properties, etc.).
+
+        This is meant to be called in the parent process of prefork servers, so that
+        workers share the built structures and do not pay their cost while serving requests.
+
+        :param freeze: if True, move all the objects tracked by the garbage collector
+            to its permanent generation (via :func:`gc.freeze`, available on python 3.7+).
+            The garbage collector does not touch such objects anymore, so their memory
+            pages are not copied by the forked processes.
+        :type freeze: bool
+        :returns: seconds spent building the structures of each operation. Structures shared
+            by multiple operations (ie. models) are accounted to the first operation using them.
+        :rtype: dict of (:class:`bravado_core.operation.Operation`, float)
+        """
+        timings = prebuild_spec(self)
+
+        if freeze and hasattr(gc, 'freeze'):
+            gc.collect()
+            gc.freeze()
+
+        return timings
+
     def get_ref_handlers(self):
         """Get mapping from URI schemes to handlers that takes a URI.
 
@@ -386,7 +585,7 @@ class Spec(object):
         :returns: dict like {'http': callable, 'https': callable}
         :rtype: dict
         """
-        return build_http_handlers(self.http_client)
+        return build_http_handlers(self.http_client, json_loads=self.config['json_loads'])
 
     def _force_deref(self, ref_dict):
         # type: (T) -> T
@@ -400,13 +599,18 @@ class Spec(object):
         if ref_dict is None or not is_ref(ref_dict):
             return ref_dict
 
-        # Restore attached resolution scope before resolving since the
-        # resolver doesn't have a traversal history (accumulated scope_stack)
-        # when asked to resolve.
-        with in_scope(self.resolver, ref_dict):
-            reference_value = ref_dict['$ref']  # type: ignore
-            _, target = self.resolver.resolve(reference_value)
-            return target
+        # Resolved references are cached by identity of ref_dict and of its attached scope (x-scope),
+        # so dereferencing the same $ref again (ie. while handling each request) is a dictionary lookup
+        resolved_refs = self.compiled.get(_resolve_ref)
+        if resolved_refs is None:
+            resolved_refs = self.compiled[_resolve_ref] = MemoizeCache(self.compiled.maxsize)
+        ref_scope = ref_dict.get('x-scope')  # type: ignore
+        cache_key = (id(ref_dict), id(ref_scope))
+        target = resolved_refs.lookup(cache_key, _CACHE_MISS)
+        if target is _CACHE_MISS:
+            target = _resolve_ref(self, ref_dict)
+            resolved_refs.store(cache_key, target, (ref_dict, ref_scope))
+        return target
 
     # NOTE: deref gets overridden, if internally_dereference_refs is enabled, after calling build
     deref = _force_deref
@@ -424,17 +628,43 @@ class Spec(object):
         """
         if self._request_to_op_map is None:
             # lazy initialization
-            self._request_to_op_map = {}
-            base_path = self.spec_dict.get('basePath', '').rstrip('/')
-            for resource in self.resources.values():
-                for op in resource.operations.values():
-                    full_path = base_path + op.path_name
-                    key = (op.http_method, full_path)
-                    self._request_to_op_map[key] = op
+            self._build_request_to_op_map()
 
         key = (http_method.lower(), path_pattern)
         return self._request_to_op_map.get(key)
 
+    def _build_request_to_op_map(self):
+        self._request_to_op_map = {}
+        base_path = self.spec_dict.get('basePath', '').rstrip('/')
+        for resource in self.resources.values():
+            for op in resource.operations.values():
+                full_path = base_path + op.path_name
+                key = (op.http_method, full_path)
+                self._request_to_op_map[key] = op
+
+    def match_request(self, http_method, path):
+        """Return the Swagger operation, and the path parameters, for the passed
+        in request http method and path.
+
+        Differently from :meth:`get_op_for_request`, the path is the concrete
+        request path and not the path pattern. e.g. /foo/42/baz/1 instead of /foo/{bar}/baz/{id}
+
+        :param http_method: http method of the request
+        :param path: request path, without query string
+
+        :returns: tuple of the matching operation and the dict of the (url-decoded)
+            path parameters, or None if a match couldn't be found
+        :rtype: tuple(:class:`bravado_core.operation.Operation`, dict)
+        """
+        if self._router is None:
+            if self.resources is None:
+                # The spec has not been built, so there are no operations to match
+                return None
+            # lazy initialization
+            self._router = build_router(self)
+
+        return self._router.match(http_method, path)
+
     def register_format(self, user_defined_format):
         """Registers a user-defined format to be used with this spec.
 
@@ -457,6 +687,8 @@ class Spec(object):
             user_defined_format = formatter.DEFAULT_FORMATS.get(name)
             if name == 'byte' and self.config['use_base64_for_byte_format']:
                 user_defined_format = formatter.BASE64_BYTE_FORMAT
+            elif name in formatter.DATEUTIL_DATE_FORMATS and self.config['use_dateutil_for_dates']:
+                user_defined_format = formatter.DATEUTIL_DATE_FORMATS[name]
 
         if user_defined_format is None:
             warnings.warn(
@@ -498,33 +730,7 @@ class Spec(object):
     @cached_property
     def _deref_flattened_spec(self):
         # type: () -> typing.Mapping[typing.Text, typing.Any]
-        deref_spec_dict = JsonRef.replace_refs(self.flattened_spec)
-
-        @memoize_by_id
-        def descend(obj):
-            # Inline modification of obj
-            # This method is needed because JsonRef could produce performance penalties in accessing
-            # the proxied attributes
-            if isinstance(obj, JsonRef):
-                # Extract the proxied value
-                # http://jsonref.readthedocs.io/en/latest/#jsonref.JsonRef.__subject__
-                return obj.__subject__
-            if is_dict_like(obj):
-                for key in list(iterkeys(obj)):
-                    obj[key] = descend(obj=obj[key])
-            elif is_list_like(obj):
-                # obj is list like object provided from flattened_spec specs.
-                # This guarantees that it cannot be a tuple instance and
-                # inline object modification are allowed
-                for index in range(len(obj)):
-                    obj[index] = descend(obj=obj[index])
-            return obj
-
-        try:
-            return descend(obj=deref_spec_dict)
-        finally:
-            # Make sure that all memory allocated, for caching, could be released
-            descend.cache.clear()  # type: ignore  # @memoize_by_id adds cache attribute to the decorated function
+        return dereference_refs(self.flattened_spec)
 
     @property
     def deref_flattened_spec(self):
@@ -532,26 +738,14 @@ class Spec(object):
         return self._deref_flattened_spec
 
 
-def is_yaml(url, content_type=None):
-    yaml_content_types = {'application/yaml', 'application/x-yaml', 'text/yaml'}
-
-    yaml_file_extensions = {'.yaml', '.yml'}
-
-    if content_type in yaml_content_types:
-        return True
-
-    _, ext = os.path.splitext(url)
-    if ext.lower() in yaml_file_extensions:
-        return True
-
-    return False
-
-
-def build_http_handlers(http_client):
+def build_http_handlers(http_client, json_loads=None):
     """Create a mapping of uri schemes to callables that take a uri. The
     callable is used by jsonschema's RefResolver to download remote $refs.
 
     :param http_client: http_client with a request() method
+    :param json_loads: callable used to parse JSON documents, if None
+        :func:`json.loads` (or the http response json method) is used.
+        See :func:`bravado_core.loader.load_json`
 
     :returns: dict like {'http': callable, 'https': callable}
     """
@@ -564,16 +758,14 @@ def build_http_handlers(http_client):
         response = http_client.request(request_params).result()
         content_type = response.headers.get('content-type', '').lower()
         if is_yaml(uri, content_type):
-            return yaml.safe_load(response.content)
+            return load_yaml(response.content)
+        elif json_loads is not None:
+            return load_json(response.content, json_loads)
         else:
             return response.json()
 
     def read_file(uri):
-        with open(url2pathname(urlparse(uri).path), mode='rb') as fp:
-            if is_yaml(uri):
-                return yaml.safe_load(fp)
-            else:
-                return json.loads(fp.read().decode("utf-8"))
+        return load_file(uri, json_loads)
 
     return {
         'http': download,
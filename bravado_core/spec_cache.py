@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+On-disk snapshots of built :class:`bravado_core.spec.Spec` instances.
+
+Building a Spec (validation, model discovery, references dereferencing, etc.)
+could take seconds on big specs. The snapshots allow processes that build the
+same Spec to pay that cost only once.
+
+A snapshot is identified by a hash of everything used to build the Spec (spec dict,
+origin url, config, bravado-core and python versions) and it is discarded if the
+content of any local file referenced by the Spec changed since the snapshot creation.
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+
+import typing
+from six import iteritems
+from six.moves.cPickle import dump
+from six.moves.cPickle import HIGHEST_PROTOCOL
+from six.moves.cPickle import load
+from six.moves.urllib.parse import urlparse
+from six.moves.urllib.request import url2pathname
+
+from bravado_core import version as _version
+
+
+if getattr(typing, 'TYPE_CHECKING', False):
+    from bravado_core.spec import Spec
+
+    T = typing.TypeVar('T', bound=Spec)
+    JSONDict = typing.Mapping[typing.Text, typing.Any]
+
+
+log = logging.getLogger(__name__)
+
+
+def _json_default(obj):
+    # type: (typing.Any) -> typing.Text
+    if callable(obj):
+        # repr of functions contain the memory address, which changes across processes
+        return '{0}.{1}'.format(
+            getattr(obj, '__module__', None),
+            getattr(obj, '__qualname__', getattr(obj, '__name__', None)),
+        )
+    return repr(obj)
+
+
+def build_cache_key(spec_dict, origin_url, config):
+    # type: (JSONDict, typing.Optional[typing.Text], typing.Optional[JSONDict]) -> typing.Text
+    """Hash everything that is used to build a Spec.
+
+    NOTE: the key needs to be built before building the Spec, as building the spec
+    modifies spec_dict (ie. x-scope annotations are added).
+
+    :param spec_dict: swagger spec in json-like dict form.
+    :param origin_url: the url used to retrieve the spec, if any
+    :param config: Configuration dict. See bravado_core.spec.CONFIG_DEFAULTS.
+    """
+    key_content = json.dumps(
+        [_version, sys.version_info[:2], origin_url, config, spec_dict],
+        sort_keys=True,
+        default=_json_default,
+    )
+    return hashlib.sha256(key_content.encode('utf-8')).hexdigest()
+
+
+def _hash_file(path):
+    # type: (typing.Text) -> typing.Optional[typing.Text]
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (IOError, OSError):
+        return None
+
+
+def _referenced_files(swagger_spec):
+    # type: (Spec) -> typing.Dict[typing.Text, typing.Optional[typing.Text]]
+    """Content hashes of the local files referenced by swagger_spec.
+
+    NOTE: references to remote urls are assumed not to change.
+    """
+    referenced_files = {}
+    for uri in swagger_spec.resolver.store:
+        parsed_uri = urlparse(uri)
+        if parsed_uri.scheme == 'file':
+            path = url2pathname(parsed_uri.path)
+            referenced_files[path] = _hash_file(path)
+    return referenced_files
+
+
+def _snapshot_path(cache_dir, cache_key):
+    # type: (typing.Text, typing.Text) -> typing.Text
+    return os.path.join(cache_dir, '{0}.pickle'.format(cache_key))
+
+
+def load_spec(spec_class, cache_dir, cache_key, http_client=None):
+    # type: (typing.Type[T], typing.Text, typing.Text, typing.Any) -> typing.Optional[T]
+    """Load a Spec from the snapshot stored in cache_dir.
+
+    :param spec_class: type of the Spec to create
+    :param cache_dir: directory containing the snapshots
+    :param cache_key: key of the snapshot, see :func:`build_cache_key`
+    :param http_client: http client used to download remote $refs
+    :returns: the Spec or None if there is no valid snapshot
+    """
+    try:
+        with open(_snapshot_path(cache_dir, cache_key), 'rb') as f:
+            snapshot = load(f)
+    except (IOError, OSError):
+        return None
+    except Exception:
+        log.warning('Unable to load Spec snapshot %s, ignoring it', cache_key, exc_info=True)
+        return None
+
+    for path, file_hash in iteritems(snapshot['referenced_files']):
+        if _hash_file(path) != file_hash:
+            log.debug('Spec snapshot %s is stale as %s changed', cache_key, path)
+            return None
+
+    swagger_spec = spec_class.__new__(spec_class)
+    swagger_spec.__setstate__(snapshot['state'])
+    swagger_spec.http_client = http_client
+    return swagger_spec
+
+
+def store_spec(swagger_spec, cache_dir, cache_key):
+    # type: (Spec, typing.Text, typing.Text) -> None
+    """Store the snapshot of a built Spec in cache_dir.
+
+    Failures are logged and otherwise ignored, as the snapshots are only an optimization.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :param cache_dir: directory containing the snapshots
+    :param cache_key: key of the snapshot, see :func:`build_cache_key`
+    """
+    snapshot = {
+        'referenced_files': _referenced_files(swagger_spec),
+        # http clients are not part of the snapshot, they're provided while loading it
+        'state': dict(swagger_spec.__getstate__(), http_client=None),
+    }
+
+    temporary_path = None
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        # Write and rename, so concurrent processes never read partially written snapshots
+        fd, temporary_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            dump(snapshot, f, HIGHEST_PROTOCOL)
+        getattr(os, 'replace', os.rename)(temporary_path, _snapshot_path(cache_dir, cache_key))
+    except Exception:
+        log.warning('Unable to store Spec snapshot %s', cache_key, exc_info=True)
+        if temporary_path is not None and os.path.exists(temporary_path):
+            os.remove(temporary_path)
@@ -226,22 +226,46 @@ def discriminator_validator(
     if discriminator_value == schema[MODEL_MARKER]:
         return
 
-    discriminated_schema = swagger_spec.definitions[discriminator_value]._model_spec
-    if 'allOf' not in discriminated_schema:
+    new_schema = _get_discriminated_schema(
+        swagger_spec=swagger_spec,
+        schema=schema,
+        discriminated_schema=swagger_spec.definitions[discriminator_value]._model_spec,
+    )
+    if new_schema is None:
         raise ValidationError(
             message='discriminated schema \'{}\' must inherit from \'{}\''.format(
                 discriminator_value, schema[MODEL_MARKER],
             ),
         )
 
+    from bravado_core.validate import validate_object  # Local import due to circular dependency
+    validate_object(swagger_spec=swagger_spec, object_spec=new_schema, value=instance)
+
+
+@memoize_by_id
+def _get_discriminated_schema(
+    swagger_spec,  # type: Spec
+    schema,  # type: JSONDict
+    discriminated_schema,  # type: JSONDict
+):
+    # type: (...) -> typing.Optional[JSONDict]
+    """
+    Build the schema used to validate an object discriminated as `discriminated_schema`
+    without validating it again against `schema`.
+
+    NOTE: the result is memoized so that validators built for the returned schema
+    (see :func:`bravado_core.validate._get_validator`) could be reused across calls.
+
+    :return: the schema to validate the object against or None if `discriminated_schema`
+        does not inherit from `schema`
+    """
+    if 'allOf' not in discriminated_schema:
+        return None
+
     schemas_to_remove = [s for s in discriminated_schema['allOf'] if swagger_spec.deref(s) == schema]
     if not schemas_to_remove:
         # Not checking against len(schemas_to_remove) > 1 because it should be prevented by swagger spec validation
-        raise ValidationError(
-            message='discriminated schema \'{}\' must inherit from \'{}\''.format(
-                discriminator_value, schema[MODEL_MARKER],
-            ),
-        )
+        return None
 
     # Remove the current schema from the allOf list in order to avoid unbounded recursion
     # (the current object is already validated against schema)
@@ -253,9 +277,7 @@ def discriminator_validator(
         all_of_schema if all_of_schema not in schemas_to_remove else {}
         for all_of_schema in new_schema['allOf']
     ]
-
-    from bravado_core.validate import validate_object  # Local import due to circular dependency
-    validate_object(swagger_spec=swagger_spec, object_spec=new_schema, value=instance)
+    return new_schema
 
 
 def ref_validator(
@@ -5,16 +5,24 @@ The module exposes unmarshaling capabilities.
 Unmarshaling is the operation that converts a "JSON" object into its python representation.
 The operation should also take care of converting types accordingly to the defined :class:`bravado_core.formatter.SwaggerFormat`s.
 """
+import sys
 import warnings
 from functools import partial
 
 import typing
 from six import iteritems
+from six import reraise
 
 from bravado_core import _decorators
+from bravado_core import _numeric_array
 from bravado_core import schema
+from bravado_core._codegen import compile_function
+from bravado_core._codegen import make_function_name
 from bravado_core.exception import SwaggerMappingError
+from bravado_core.model import is_object
+from bravado_core.model import LazyModel
 from bravado_core.model import MODEL_MARKER
+from bravado_core.model import SlottedModel
 from bravado_core.schema import collapsed_properties
 from bravado_core.schema import collapsed_required
 from bravado_core.schema import get_type_from_schema
@@ -22,12 +30,16 @@ from bravado_core.schema import is_dict_like
 from bravado_core.schema import is_list_like
 from bravado_core.schema import SWAGGER_PRIMITIVES
 from bravado_core.util import memoize_by_id
+from bravado_core.validate import _get_shallow_validation_closure
+from bravado_core.validate import _get_validation_closure
+from bravado_core.validate import validate_schema_object
 
 
 if getattr(typing, 'TYPE_CHECKING', False):
     from bravado_core._compat_typing import JSONDict
     from bravado_core._compat_typing import NoReturn
     from bravado_core._compat_typing import UnmarshalingMethod
+    from bravado_core._numeric_array import ArrayFactory
     from bravado_core.model import Model
     from bravado_core.spec import Spec
 
@@ -39,6 +51,10 @@ _handle_null_value = partial(
 )
 
 
+class _InvalidValueError(Exception):
+    """Raised by the validating unmarshaling methods if a value does not pass validation."""
+
+
 def unmarshal_schema_object(swagger_spec, schema_object_spec, value):
     # type: (Spec, JSONDict, typing.Any) -> typing.Any
     """
@@ -61,6 +77,50 @@ def unmarshal_schema_object(swagger_spec, schema_object_spec, value):
     return unmarshaling_method(value)
 
 
+def validate_and_unmarshal_schema_object(swagger_spec, schema_object_spec, value):
+    # type: (Spec, JSONDict, typing.Any) -> typing.Any
+    """
+    Validate and unmarshal the value using the given schema object specification.
+
+    The function is equivalent to :func:`bravado_core.validate.validate_schema_object`
+    followed by :func:`unmarshal_schema_object`, and raises the same errors,
+    but the value is traversed only once.
+
+    :type swagger_spec: :class:`bravado_core.spec.Spec`
+    :type schema_object_spec: dict
+    :type value: int, float, long, string, unicode, boolean, list, dict, etc
+
+    :return: unmarshalled value
+    :raises ValidationError: when jsonschema validation fails.
+    :raises SwaggerMappingError: on invalid Swagger `type` or if the value could not be unmarshaled.
+    """
+    deref = swagger_spec.deref
+    object_schema = deref(schema_object_spec)
+    default_type = 'object' if swagger_spec.config['default_type_to_object'] else None
+    object_type = deref(object_schema.get('type', default_type))
+    if object_type not in SWAGGER_PRIMITIVES and object_type != 'array' and not is_object(swagger_spec, object_schema):
+        # Values of such schemas are not validated (or validate_schema_object raises SwaggerMappingError)
+        validate_schema_object(swagger_spec, schema_object_spec, value)
+        return unmarshal_schema_object(swagger_spec, schema_object_spec, value)
+
+    validating_unmarshaling_method = _get_validating_unmarshaling_method(
+        swagger_spec=swagger_spec,
+        object_schema=schema_object_spec,
+    )
+    try:
+        return validating_unmarshaling_method(value)
+    except _InvalidValueError:
+        # Let jsonschema report the validation error
+        validate_schema_object(swagger_spec, schema_object_spec, value)
+        return unmarshal_schema_object(swagger_spec, schema_object_spec, value)
+    except Exception:
+        # The value might have been only partially validated, ensure that
+        # validation errors have precedence over unmarshaling errors
+        exc_info = sys.exc_info()
+        validate_schema_object(swagger_spec, schema_object_spec, value)
+        reraise(*exc_info)
+
+
 def unmarshal_primitive(swagger_spec, primitive_spec, value):
     # type: (Spec, JSONDict, typing.Any) -> typing.Any
     """Unmarshal a jsonschema primitive type into a python primitive.
@@ -175,6 +235,10 @@ def _get_unmarshaling_method(swagger_spec, object_schema, is_nullable=True):
         # TODO: Type file is not a valid type. It is present to support parameter unmarshaling (move to bravado_core.param)  # noqa: E501
         return null_decorator(_unmarshaling_method_file(swagger_spec, object_schema))
     elif object_type == 'object':
+        if swagger_spec.config['unmarshal_backend'] == 'codegen':
+            compiled_method = _compile_unmarshaling_method_object(swagger_spec, object_schema, is_nullable)
+            if compiled_method is not None:
+                return compiled_method
         return null_decorator(_unmarshaling_method_object(swagger_spec, object_schema))
     elif object_type in SWAGGER_PRIMITIVES:
         return null_decorator(_unmarshaling_method_primitive_type(swagger_spec, object_schema))
@@ -187,6 +251,72 @@ def _get_unmarshaling_method(swagger_spec, object_schema, is_nullable=True):
         )
 
 
+@_decorators.wrap_recursive_call_exception
+@memoize_by_id
+def _get_validating_unmarshaling_method(swagger_spec, object_schema, is_nullable=True):
+    # type: (Spec, JSONDict, bool) -> UnmarshalingMethod
+    """
+    Determine the method needed to validate and unmarshal values of a defined object_schema.
+
+    The returned method behaves as the one returned by :func:`_get_unmarshaling_method`, but it
+    raises :class:`_InvalidValueError` if the value is not valid according to object_schema.
+    Objects and arrays are checked against their own keywords only, their properties and items
+    are checked by their validating unmarshaling methods while being unmarshaled.
+
+    :param swagger_spec: Spec object
+    :param object_schema: Schema of the object type
+    :param is_nullable: same meaning of :func:`_get_unmarshaling_method` is_nullable parameter
+    """
+    unmarshaling_method = _get_unmarshaling_method(
+        swagger_spec=swagger_spec,
+        object_schema=object_schema,
+        is_nullable=is_nullable,
+    )
+    object_schema = swagger_spec.deref(object_schema)
+    object_type = get_type_from_schema(swagger_spec, object_schema)
+
+    if object_type == 'array' and is_dict_like(object_schema.get('items')):
+        return partial(
+            _validate_and_unmarshal,
+            _get_shallow_validation_closure(swagger_spec, object_schema),
+            unmarshaling_method,
+            partial(
+                _unmarshal_array,
+                _get_validating_unmarshaling_method(swagger_spec=swagger_spec, object_schema=object_schema['items']),
+            ),
+        )
+    elif object_type == 'object' and 'allOf' not in object_schema and 'discriminator' not in object_schema:
+        return partial(
+            _validate_and_unmarshal,
+            _get_shallow_validation_closure(swagger_spec, object_schema),
+            unmarshaling_method,
+            _unmarshaling_method_object(swagger_spec, object_schema, validate=True),
+        )
+    else:
+        # Values that are not traversed while unmarshaling (or polymorphic objects) are fully validated upfront
+        return partial(
+            _validate_and_unmarshal,
+            _get_validation_closure(swagger_spec, object_schema),
+            unmarshaling_method,
+            unmarshaling_method,
+        )
+
+
+def _validate_and_unmarshal(
+    validation_closure,  # type: typing.Callable[[typing.Any], bool]
+    unmarshaling_method,  # type: UnmarshalingMethod
+    not_null_unmarshaling_method,  # type: UnmarshalingMethod
+    value,  # type: typing.Any
+):
+    # type: (...) -> typing.Any
+    if not validation_closure(value):
+        raise _InvalidValueError()
+    if value is None:
+        # Defaults are not validated, so None values are entirely handled by the unmarshaling method
+        return unmarshaling_method(value)
+    return not_null_unmarshaling_method(value)
+
+
 def _no_op_unmarshaling(value):
     # type: (typing.Any) -> typing.Any
     return value
@@ -225,6 +355,27 @@ def _unmarshal_array(unmarshal_array_item_function, value):
     ]
 
 
+def _unmarshal_numeric_array(array_factory, typecode, unmarshal_array_function, value):
+    # type: (ArrayFactory, str, UnmarshalingMethod, typing.Any) -> typing.Any
+    """
+    Unmarshal a JSON list of numbers at once (see the numeric_array_type config option).
+
+    :param array_factory: Function building the configured type of array (see :func:`_numeric_array.get_array_factory`)
+    :param typecode: array.array type code of the items
+    :param unmarshal_array_function: Unmarshaling function of the array, used if not all the
+        items are numbers of the expected type (ie. None items). It returns a list.
+    :param value: JSON value to unmarshal
+
+    :raises: SwaggerMappingError
+    """
+    if value.__class__ is list:
+        try:
+            return array_factory(typecode, value)
+        except _numeric_array.ARRAY_ERRORS:
+            pass
+    return unmarshal_array_function(value)
+
+
 def _unmarshaling_method_array(swagger_spec, object_schema):
     # type: (Spec, JSONDict) -> UnmarshalingMethod
     """
@@ -239,9 +390,33 @@ def _unmarshaling_method_array(swagger_spec, object_schema):
     if item_schema is _NOT_FOUND:
         return _no_op_unmarshaling
 
+    unmarshal_array_item_function = _get_unmarshaling_method(swagger_spec=swagger_spec, object_schema=item_schema)
+    typecode = _numeric_array.get_typecode(swagger_spec, item_schema)
+    if typecode is not None:
+        return partial(
+            _unmarshal_numeric_array,
+            _numeric_array.get_array_factory(swagger_spec),
+            typecode,
+            partial(_unmarshal_array, unmarshal_array_item_function),
+        )
+
+    # NOTE: the functions generated by the codegen backend unmarshal each object faster than the column by
+    # column strategy could, so arrays are unmarshaled column by column only with the partial backend
+    if (
+        swagger_spec.config['unmarshal_backend'] != 'codegen' and
+        get_type_from_schema(swagger_spec, item_schema) == 'object'
+    ):
+        object_array_unmarshaling_method = _unmarshaling_method_object(
+            swagger_spec,
+            item_schema,
+            array_item_unmarshaling_method=unmarshal_array_item_function,
+        )
+        if object_array_unmarshaling_method is not None:
+            return object_array_unmarshaling_method
+
     return partial(
         _unmarshal_array,
-        _get_unmarshaling_method(swagger_spec=swagger_spec, object_schema=item_schema),
+        unmarshal_array_item_function,
     )
 
 
@@ -307,8 +482,123 @@ def _unmarshal_object(
     return unmarshaled_value
 
 
-def _unmarshaling_method_object(swagger_spec, object_schema, use_models=True):
-    # type: (Spec, JSONDict, bool) -> UnmarshalingMethod
+def _unmarshal_object_array(
+    swagger_spec,  # type: Spec
+    model_type,  # type: typing.Optional[typing.Type[Model]]
+    properties_to_unmarshaling_function,  # type: typing.List[typing.Tuple[typing.Text, UnmarshalingMethod, typing.Any]]
+    additional_properties_unmarshaling_function,  # type: UnmarshalingMethod
+    unmarshal_array_item_function,  # type: UnmarshalingMethod
+    value,  # type: typing.Any
+):
+    # type: (...) -> typing.Any
+    """
+    Unmarshal a JSON list of objects, all of the same non polymorphic schema, to its python representation.
+
+    The objects are unmarshaled column by column: the unmarshaling function of each property is applied
+    to the values of the property of all the objects, and then to the additional properties.
+
+    :param swagger_spec: Spec object
+    :param model_type: Type of the objects (subclass of :class:`bravado_core.model.Model`), or None for dictionaries
+    :param properties_to_unmarshaling_function: List of (property name, unmarshaling method, value to use
+        if the property is missing)
+    :param additional_properties_unmarshaling_function: Unmarshaling function of eventual additional properties
+    :param unmarshal_array_item_function: Unmarshaling function for each array item, used if
+        not all the items are dictionaries (ie. None items or not JSON values)
+    :param value: JSON value to unmarshal
+
+    :raises: SwaggerMappingError
+    """
+    if not is_list_like(value):
+        raise SwaggerMappingError('Expected list like type for {0}:{1}'.format(type(value), value))
+
+    for item in value:
+        if item.__class__ is not dict:
+            return [
+                unmarshal_array_item_function(item)
+                for item in value
+            ]
+
+    include_missing_properties = swagger_spec.config['include_missing_properties']
+    results = [{} for _ in value]
+    property_names = set()
+    for property_name, unmarshaling_function, missing_value in properties_to_unmarshaling_function:
+        property_names.add(property_name)
+        for result, item in zip(results, value):
+            property_value = item.get(property_name, _NOT_FOUND)
+            if property_value is not _NOT_FOUND:
+                result[property_name] = unmarshaling_function(property_value)
+            elif include_missing_properties:
+                result[property_name] = missing_value
+
+    for result, item in zip(results, value):
+        if not property_names.issuperset(item):
+            for property_name, property_value in iteritems(item):
+                if property_name not in property_names:
+                    result[property_name] = additional_properties_unmarshaling_function(property_value)
+
+    if model_type is None:
+        return results
+
+    models = []
+    for result in results:
+        model = object.__new__(model_type)
+        object.__setattr__(model, '_Model__dict', result)
+        models.append(model)
+    return models
+
+
+def _unmarshal_lazy_model(
+    swagger_spec,  # type: Spec
+    model_type,  # type: typing.Type[LazyModel]
+    unmarshalers,  # type: typing.Tuple[typing.Dict[typing.Text, UnmarshalingMethod], UnmarshalingMethod]
+    discriminator_property,  # type: typing.Optional[typing.Text]
+    possible_discriminated_type_name_to_model,  # type: typing.Dict[typing.Text, Model]
+    model_value,  # type: typing.Any
+):
+    # type: (...) -> typing.Any
+    """
+    Unmarshal a dict into a :class:`bravado_core.model.LazyModel` instance, whose properties
+    are unmarshaled on first access.
+
+    :param swagger_spec: Spec object
+    :param model_type: Type of the return value
+    :param unmarshalers: Tuple (mapping between property name and associated unmarshaling method,
+        unmarshaling function of eventual additional properties)
+    :param discriminator_property: Discriminator property name. It will be `None` if the schema is not a polymorphic schema
+    :param possible_discriminated_type_name_to_model: Mapping of the possible dereferenced Model names and Model instances.
+    :param model_value: JSON value to unmarshal
+
+    :raises: SwaggerMappingError
+    """
+    if not is_dict_like(model_value):
+        raise SwaggerMappingError(
+            "Expected type to be dict for value {0} to unmarshal to a {1}."
+            "Was {2} instead.".format(model_value, model_type, type(model_value)),
+        )
+
+    if discriminator_property:
+        discriminator_value = model_value[discriminator_property]
+        discriminated_model = possible_discriminated_type_name_to_model.get(discriminator_value)
+        if discriminated_model is not None:
+            unmarshal_func = _get_unmarshaling_method(
+                swagger_spec=swagger_spec,
+                object_schema=discriminated_model._model_spec,
+            )
+            return unmarshal_func(model_value)
+
+    return model_type._LazyModel__from_raw_values(  # type: ignore  # mangled private method
+        model_value, unmarshalers, swagger_spec.config['include_missing_properties'],
+    )
+
+
+def _unmarshaling_method_object(
+    swagger_spec,  # type: Spec
+    object_schema,  # type: JSONDict
+    use_models=True,  # type: bool
+    validate=False,  # type: bool
+    array_item_unmarshaling_method=None,  # type: typing.Optional[UnmarshalingMethod]
+):
+    # type: (...) -> UnmarshalingMethod
     """
     Determine the unmarshaling method needed for a schema of a type object.
 
@@ -322,7 +612,13 @@ def _unmarshaling_method_object(swagger_spec, object_schema, use_models=True):
     :param object_schema: Schema of the object type
     # TODO: use_models parameter should be removed once unmarshal_model function is removed
     :param use_models: Flag that enables or disables the usage of Models
+    :param validate: Flag that enables the validation of properties (see :func:`_get_validating_unmarshaling_method`)
+    :param array_item_unmarshaling_method: If set, determine the method needed to unmarshal arrays of objects
+        column by column (see :func:`_unmarshal_object_array`) instead. It is the unmarshaling method of the
+        array items, used for arrays with items that are not objects. `None` is returned if the objects
+        could not be unmarshaled column by column (ie. polymorphic objects).
     """
+    get_unmarshaling_method = _get_validating_unmarshaling_method if validate else _get_unmarshaling_method
 
     model_type = None  # type: typing.Optional[typing.Type[Model]]
     object_schema = swagger_spec.deref(object_schema)
@@ -330,6 +626,10 @@ def _unmarshaling_method_object(swagger_spec, object_schema, use_models=True):
         model_name = object_schema[MODEL_MARKER]
         model_type = swagger_spec.definitions.get(model_name)
         if use_models and model_type is None:
+            if array_item_unmarshaling_method is not None:
+                # Arrays of unknown models are unmarshaled item by item, so that
+                # empty arrays are accepted and errors report the offending item
+                return None
             return partial(
                 _raise_unknown_model,
                 model_name,
@@ -340,7 +640,7 @@ def _unmarshaling_method_object(swagger_spec, object_schema, use_models=True):
     properties = collapsed_properties(object_schema, swagger_spec)
     required_properties = collapsed_required(object_schema, swagger_spec)
     properties_to_unmarshaling_function = {
-        prop_name: _get_unmarshaling_method(
+        prop_name: get_unmarshaling_method(
             swagger_spec=swagger_spec,
             object_schema=prop_schema,
             is_nullable=prop_schema.get('x-nullable', False) or prop_name not in required_properties,
@@ -352,7 +652,7 @@ def _unmarshaling_method_object(swagger_spec, object_schema, use_models=True):
     if object_schema.get('additionalProperties') is not False:
         additional_properties_schema = object_schema.get('additionalProperties', {})
         if additional_properties_schema not in ({}, True):
-            additional_properties_unmarshaling_function = _get_unmarshaling_method(
+            additional_properties_unmarshaling_function = get_unmarshaling_method(
                 swagger_spec=swagger_spec,
                 object_schema=additional_properties_schema,
                 is_nullable=False,
@@ -377,6 +677,35 @@ def _unmarshaling_method_object(swagger_spec, object_schema, use_models=True):
             if model_type and model_type.__name__ in v._inherits_from
         })
 
+    if array_item_unmarshaling_method is not None:
+        use_models = bool(model_type) and swagger_spec.config['use_models']
+        if discriminator_property or use_models and (
+            SlottedModel in model_type.__mro__ or LazyModel in model_type.__mro__  # type: ignore  # model_type is set
+        ):
+            return None
+        return partial(
+            _unmarshal_object_array,
+            swagger_spec,
+            model_type if use_models else None,
+            [
+                # Models are filled with None (Model.__init__ behaviour) while dictionaries are filled with the default value
+                (prop_name, unmarshaling_function, None if use_models else properties_to_default_value.get(prop_name))
+                for prop_name, unmarshaling_function in iteritems(properties_to_unmarshaling_function)
+            ],
+            additional_properties_unmarshaling_function,
+            array_item_unmarshaling_method,
+        )
+
+    if model_type and swagger_spec.config['use_models'] and not validate and LazyModel in model_type.__mro__:
+        return partial(
+            _unmarshal_lazy_model,
+            swagger_spec,
+            model_type,
+            (properties_to_unmarshaling_function, additional_properties_unmarshaling_function),
+            discriminator_property,
+            possible_discriminated_type_name_to_model,
+        )
+
     return partial(
         _unmarshal_object,
         swagger_spec,
@@ -406,3 +735,232 @@ def _unmarshaling_method_primitive_type(swagger_spec, object_schema):
         return swagger_format.to_python
     else:
         return _no_op_unmarshaling
+
+
+def _compile_unmarshaling_method_object(swagger_spec, object_schema, is_nullable):
+    # type: (Spec, JSONDict, bool) -> typing.Optional[UnmarshalingMethod]
+    """
+    Generate a specialized unmarshaling function for a schema of a type object.
+
+    The generated function inlines the unmarshaling of the properties with primitive types (including
+    formats conversion), arrays of such properties, the null/default values handling and the missing
+    properties handling. Nested objects are unmarshaled by the method returned by :func:`_get_unmarshaling_method`
+    (recursive schemas are handled by the lazy methods returned by :func:`_decorators.wrap_recursive_call_exception`).
+
+    NOTE: the function has to behave exactly as the method determined by :func:`_unmarshaling_method_object`.
+
+    :param swagger_spec: Spec object
+    :param object_schema: Schema of the object type (dereferenced)
+    :param is_nullable: Flag set to `True` if the current schema is nullable
+
+    :return: the generated function or None if the schema is not supported (ie. polymorphic schemas or lazy models)
+    """
+    model_type = None  # type: typing.Optional[typing.Type[Model]]
+    if MODEL_MARKER in object_schema:
+        model_type = swagger_spec.definitions.get(object_schema[MODEL_MARKER])
+        if model_type is None:
+            return None
+
+    if object_schema.get('discriminator'):
+        return None
+
+    properties = collapsed_properties(object_schema, swagger_spec)
+    required_properties = collapsed_required(object_schema, swagger_spec)
+    use_models = model_type is not None and swagger_spec.config['use_models']
+    if use_models and LazyModel in model_type.__mro__:  # type: ignore  # model_type is not None if use_models
+        # Lazy models unmarshal the property values on first access
+        return None
+    # Property values of slotted models are directly stored in their slots, while the
+    # result dictionary collects only the additional properties
+    use_slots = use_models and SlottedModel in model_type.__mro__  # type: ignore  # model_type is not None if use_models
+
+    namespace = {
+        '_MISSING': _NOT_FOUND,
+        '_SwaggerMappingError': SwaggerMappingError,
+        '_is_dict_like': is_dict_like,
+        '_list_types': (list, tuple),
+        '_config': swagger_spec.config,
+        '_property_names': frozenset(properties),
+        '_model_type': model_type if use_models else dict,
+        '_new': object.__new__,
+        '_setattr': object.__setattr__,
+    }  # type: typing.Dict[str, typing.Any]
+
+    body = [
+        'if value is None:',
+        '    return _unmarshal_null_value(value)',
+        'if value.__class__ is not dict and not _is_dict_like(value):',
+        '    raise _SwaggerMappingError(',
+        '        "Expected type to be dict for value {0} to unmarshal to a {1}."',
+        '        "Was {2} instead.".format(value, _model_type, type(value)),',
+        '    )',
+        'result = {}',
+    ]
+    if use_slots:
+        body.append('model = _new(_model_type)')
+    if properties:
+        body.extend([
+            'get = value.get',
+            'include_missing_properties = _config[\'include_missing_properties\']',
+        ])
+
+    for index, (prop_name, prop_schema) in enumerate(iteritems(properties)):
+        prop_is_nullable = prop_schema.get('x-nullable', False) or prop_name not in required_properties
+        prop_method = _get_unmarshaling_method(
+            swagger_spec=swagger_spec,
+            object_schema=prop_schema,
+            is_nullable=prop_is_nullable,
+        )
+        namespace['_method_{0}'.format(index)] = prop_method
+        # Models are filled with None (Model.__init__ behaviour) while dictionaries are filled with the default value
+        namespace['_default_{0}'.format(index)] = unmarshal_schema_object(
+            swagger_spec=swagger_spec,
+            schema_object_spec=prop_schema,
+            value=schema.get_default(swagger_spec, prop_schema),
+        ) if not use_models and schema.has_default(swagger_spec, prop_schema) else None
+
+        key = repr(prop_name)
+        if use_slots:
+            namespace['_set_{0}'.format(index)] = model_type._property_slots[prop_name].__set__  # type: ignore
+
+        def assignment(expression, key=key, index=index):
+            # type: (str, str, int) -> str
+            if use_slots:
+                return '_set_{0}(model, {1})'.format(index, expression)
+            return 'result[{0}] = {1}'.format(key, expression)
+
+        body.extend([
+            'item = get({0}, _MISSING)'.format(key),
+            'if item is _MISSING:',
+            '    if include_missing_properties:',
+            '        ' + assignment('_default_{0}'.format(index)),
+        ])
+
+        expression = _inline_unmarshaling_expression(
+            swagger_spec, prop_schema, 'item', '_method_{0}'.format(index), '_item_method_{0}'.format(index), namespace,
+        )
+        if expression is None:
+            body.extend([
+                'else:',
+                '    ' + assignment('_method_{0}(item)'.format(index)),
+            ])
+        else:
+            deref_prop_schema = swagger_spec.deref(prop_schema)
+            if (
+                (prop_is_nullable or schema.is_prop_nullable(swagger_spec, deref_prop_schema)) and
+                schema.get_default(swagger_spec, deref_prop_schema) is None
+            ):
+                null_expression = 'None'
+            else:
+                null_expression = '_method_{0}(None)'.format(index)
+            body.extend([
+                'elif item is None:',
+                '    ' + assignment(null_expression),
+                'else:',
+                '    ' + assignment(expression),
+            ])
+
+    additional_properties_unmarshaling_function = _no_op_unmarshaling
+    if object_schema.get('additionalProperties') is not False:
+        additional_properties_schema = object_schema.get('additionalProperties', {})
+        if additional_properties_schema not in ({}, True):
+            additional_properties_unmarshaling_function = _get_unmarshaling_method(
+                swagger_spec=swagger_spec,
+                object_schema=additional_properties_schema,
+                is_nullable=False,
+            )
+    namespace['_additional_properties_method'] = additional_properties_unmarshaling_function
+    body.extend([
+        'if not _property_names.issuperset(value):',
+        '    for key in value:',
+        '        if key not in _property_names:',
+        '            result[key] = {0}'.format(
+            'value[key]'
+            if additional_properties_unmarshaling_function is _no_op_unmarshaling
+            else '_additional_properties_method(value[key])',
+        ),
+    ])
+
+    if use_slots:
+        body.extend([
+            '_setattr(model, \'_SlottedModel__additional\', result or None)',
+            'return model',
+        ])
+    elif use_models:
+        body.extend([
+            'model = _new(_model_type)',
+            '_setattr(model, \'_Model__dict\', result)',
+            'return model',
+        ])
+    else:
+        body.append('return result')
+
+    function = compile_function(
+        function_name=make_function_name('unmarshal', object_schema.get(MODEL_MARKER) or object_schema.get('title')),
+        arguments=['value'],
+        body_lines=body,
+        namespace=namespace,
+    )
+    namespace['_unmarshal_null_value'] = _handle_null_value(
+        swagger_spec=swagger_spec,
+        object_schema=object_schema,
+        is_nullable=is_nullable,
+    )(function)
+    return function
+
+
+def _inline_unmarshaling_expression(swagger_spec, object_schema, variable, method_name, item_method_name, namespace):
+    # type: (Spec, JSONDict, str, str, str, typing.Dict[str, typing.Any]) -> typing.Optional[str]
+    """
+    Build the python expression that unmarshals the (not None) value stored in `variable`.
+
+    :param swagger_spec: Spec object
+    :param object_schema: Schema of the value
+    :param variable: name of the variable containing the value
+    :param method_name: name of the unmarshaling method of object_schema
+    :param item_method_name: name to use for the unmarshaling method of the array items
+    :param namespace: namespace of the generated function, eventually extended with the needed objects
+
+    :return: the expression or None if the unmarshaling method has to be used
+    """
+    object_schema = swagger_spec.deref(object_schema)
+    object_type = get_type_from_schema(swagger_spec, object_schema)
+
+    if object_type is None:
+        return variable
+
+    elif object_type in SWAGGER_PRIMITIVES or object_type == 'file':
+        unmarshaling_function = _unmarshaling_method_primitive_type(swagger_spec, object_schema)
+        if object_type == 'file' or unmarshaling_function is _no_op_unmarshaling:
+            return variable
+        namespace[method_name + '_to_python'] = unmarshaling_function
+        return '{0}_to_python({1})'.format(method_name, variable)
+
+    elif object_type == 'array':
+        item_schema = object_schema.get('items', _NOT_FOUND)
+        if item_schema is _NOT_FOUND:
+            return variable
+
+        item_schema = swagger_spec.deref(item_schema)
+        if _numeric_array.get_typecode(swagger_spec, item_schema) is not None:
+            # The unmarshaling method converts the whole array at once
+            return None
+
+        item_type = get_type_from_schema(swagger_spec, item_schema)
+        if item_type is None or (
+            (
+                item_type == 'file' or
+                item_type in SWAGGER_PRIMITIVES and
+                _unmarshaling_method_primitive_type(swagger_spec, item_schema) is _no_op_unmarshaling
+            ) and
+            schema.get_default(swagger_spec, item_schema) is None
+        ):
+            item_expression = 'list({0})'.format(variable)
+        else:
+            namespace[item_method_name] = _get_unmarshaling_method(swagger_spec=swagger_spec, object_schema=item_schema)
+            item_expression = '[{0}(element) for element in {1}]'.format(item_method_name, variable)
+
+        # The unmarshaling method takes care of raising the expected exception on not list-like values
+        return '{0} if isinstance({1}, _list_types) else {2}({1})'.format(item_expression, variable, method_name)
+
+    return None
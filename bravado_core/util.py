@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
 import copy
+import functools
 import inspect
 import re
+import threading
+from collections import namedtuple
+from collections import OrderedDict
 
 import typing
 from enum import Enum
 from six import iteritems
 from six import iterkeys
+from six import itervalues
 
 from bravado_core._compat import get_function_spec
 from bravado_core._compat import wraps
@@ -17,7 +22,7 @@ if getattr(typing, 'TYPE_CHECKING', False):
     from bravado_core._compat_typing import FuncType
     from bravado_core._compat_typing import JSONDict
 
-    CacheKey = typing.Tuple[typing.Tuple[typing.Text, int], ...]
+    CacheKey = typing.Tuple[typing.Any, ...]
     T = typing.TypeVar('T')
 
 
@@ -87,45 +92,257 @@ class RecursiveCallException(Exception):
     pass
 
 
-def memoize_by_id(func):
-    # type: (FuncType) -> FuncType
-    cache = func.cache = {}  # type: ignore  # It's not worth to modify the signature to include handling of cache attribute  # noqa: E501
-    key_in_progress_set = set()  # type: typing.Set[CacheKey]
-    _CACHE_MISS = object()
+# Placeholder for arguments that have not been provided and that do not have a default value
+_MISSING_ARGUMENT = object()
+
+
+def _make_generic_key_builder(func):
+    # type: (FuncType) -> typing.Callable[..., CacheKey]
+    """
+    Create a cache key builder that works for any function signature.
+    The cache key is an ordered tuple containing parameter name and related id as in (name, id(value)).
+    """
+    def make_key(*args, **kwargs):
+        # type: (typing.Any, typing.Any) -> CacheKey
+        return tuple(
+            (param_name, id(param_value))
+            for param_name, param_value in sorted(iteritems(inspect.getcallargs(func, *args, **kwargs)))
+        )
+    return make_key
+
+
+def _make_positional_key_builder(func):
+    # type: (FuncType) -> typing.Optional[typing.Callable[..., CacheKey]]
+    """
+    Create a cache key builder for functions that accept only named (positional or keyword) arguments.
+
+    The position of each argument and the default values are determined once, so building a key
+    does not require any signature inspection. The cache key is a flat tuple containing the id of
+    each argument value, in the order of the function signature.
 
+    NOTE: arguments that are not provided and have no default value are mapped to the id of a sentinel
+    object, such keys will never be stored in the cache as the function call will raise TypeError.
+
+    :return: the key builder or None if the function signature is not supported (ie. it uses *args,
+        **kwargs or keyword-only arguments)
+    """
     spec = get_function_spec(func)
-    default_mapping = dict(zip(reversed(spec.args), reversed(spec.defaults or [])))
+    if spec.varargs or getattr(spec, 'varkw', getattr(spec, 'keywords', None)) or getattr(spec, 'kwonlyargs', None):
+        return None
+
+    arg_names = tuple(spec.args)
+    arg_names_set = frozenset(arg_names)
+    number_of_args = len(arg_names)
+    defaults = (_MISSING_ARGUMENT,) * (number_of_args - len(spec.defaults or ())) + tuple(spec.defaults or ())
+    arg_names_and_defaults = tuple(zip(arg_names, defaults))
 
     def make_key(*args, **kwargs):
         # type: (typing.Any, typing.Any) -> CacheKey
+        if not kwargs:
+            if len(args) == number_of_args:
+                return tuple(map(id, args))
+        elif not args and arg_names_set.issuperset(kwargs):
+            return tuple([id(kwargs.get(arg_name, default)) for arg_name, default in arg_names_and_defaults])
+
+        if len(args) > number_of_args or not arg_names_set.difference(arg_names[:len(args)]).issuperset(kwargs):
+            # Let python raise the appropriate TypeError (too many, unexpected or duplicated arguments)
+            inspect.getcallargs(func, *args, **kwargs)
+
+        return tuple(map(id, args)) + tuple([
+            id(kwargs.get(arg_name, default))
+            for arg_name, default in arg_names_and_defaults[len(args):]
+        ])
+
+    return make_key
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class MemoizeCache(OrderedDict):
+    """
+    Cache of the values returned by a function decorated with :func:`memoize_by_id`.
+
+    (key, value) = (tuple of the ids of the arguments, returned value)
+
+    The arguments of the calls cached with :meth:`store` are referenced by the cache, so
+    their ids cannot be reused by other objects while the cached values are reachable.
+    The arguments are released when the values are evicted, on ``clear()`` or together
+    with the cache (ie. with the Spec owning it).
+
+    :param maxsize: maximum number of cached values. If exceeded, the least recently used
+        values are evicted. None means unbounded.
+    """
+
+    def __init__(self, maxsize=None):
+        # type: (typing.Optional[int]) -> None
+        super(MemoizeCache, self).__init__()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # (key, value) = (cache key, arguments of the call)
+        self._arguments = {}  # type: typing.Dict[CacheKey, typing.Tuple[typing.Any, ...]]
+        # Guards the reordering and the eviction of the values, that mutate the cache
+        self._lock = threading.Lock()
+
+    def lookup(self, key, default):
+        # type: (CacheKey, typing.Any) -> typing.Any
+        if self.maxsize is None:
+            value = self.get(key, default)
+            if value is default:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+        with self._lock:
+            value = self.get(key, default)
+            if value is default:
+                self.misses += 1
+            else:
+                self.hits += 1
+                # Mark the value as the most recently used
+                if hasattr(self, 'move_to_end'):
+                    self.move_to_end(key)
+                else:  # pragma: no cover  # OrderedDict.move_to_end is not available in py2
+                    del self[key]
+                    self[key] = value
+            return value
+
+    def store(self, key, value, arguments=None):
+        # type: (CacheKey, typing.Any, typing.Optional[typing.Tuple[typing.Any, ...]]) -> None
+        with self._lock:
+            self[key] = value
+            if arguments is not None:
+                self._arguments[key] = arguments
+            while self.maxsize is not None and len(self) > self.maxsize:
+                evicted_key, _ = self.popitem(last=False)
+                self._arguments.pop(evicted_key, None)
+
+    def clear(self):
+        # type: () -> None
+        with self._lock:
+            super(MemoizeCache, self).clear()
+            self._arguments.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        # type: () -> CacheInfo
+        return CacheInfo(hits=self.hits, misses=self.misses, maxsize=self.maxsize, currsize=len(self))
+
+
+class MemoizeCacheRegistry(dict):
+    """
+    Caches of the functions decorated with :func:`memoize_by_id` scoped to a single object,
+    stored as its ``compiled`` attribute (ie. :attr:`bravado_core.spec.Spec.compiled`).
+
+    The caches are released together with the object owning them, or by calling ``clear()``.
+
+    (key, value) = (decorated function, :class:`MemoizeCache`)
+
+    :param maxsize: default maximum size of the caches, see :class:`MemoizeCache`.
+    """
+
+    def __init__(self, maxsize=None):
+        # type: (typing.Optional[int]) -> None
+        super(MemoizeCacheRegistry, self).__init__()
+        self.maxsize = maxsize
+
+    def info(self):
+        # type: () -> typing.Dict[typing.Text, CacheInfo]
         """
-        Create a cache key starting from *args and **kwargs.
-        The cache key is an ordered tuple containing parameter name and related id as in (name, id(value)).
+        :return: statistics of each cache, by qualified name of the decorated function
+            (ie. ``bravado_core.unmarshal._get_unmarshaling_method``)
         """
-        if args:
-            param_name_to_value_mapping = sorted(iteritems(inspect.getcallargs(func, *args, **kwargs)))
-        else:
-            # Use the default values while determining the parameter name to value to be used for the cache key
-            param_name_to_value_mapping = sorted(iteritems(dict(default_mapping, **kwargs)))
+        return {
+            '{0}.{1}'.format(func.__module__, func.__name__): cache.info()
+            for func, cache in iteritems(self)
+        }
 
-        return tuple(
-            (param_name, id(param_value))
-            for param_name, param_value in param_name_to_value_mapping
-        )
+
+def _get_memoize_cache_registry(scope):
+    # type: (typing.Any) -> typing.Optional[MemoizeCacheRegistry]
+    registry = getattr(scope, 'compiled', None)
+    return registry if isinstance(registry, MemoizeCacheRegistry) else None
+
+
+def memoize_by_id(func=None, maxsize=None):
+    # type: (typing.Optional[FuncType], typing.Optional[int]) -> typing.Any
+    """
+    Memoize the values returned by func, caching them by the ids of the arguments.
+
+    If the first argument of func is ``swagger_spec`` the values are cached in the
+    :class:`MemoizeCacheRegistry` of the provided Spec, and so they are released with it.
+    Otherwise (or if the Spec has no registry) they are cached in the ``cache`` attribute
+    of the decorated function.
+
+    The arguments of the calls are kept alive by the caches scoped to a Spec, which are
+    released with it, and by bounded caches, until the values are evicted. The unbounded
+    ``cache`` of the decorated function lives as long as the process, so it does not keep
+    the arguments alive (as their ids are part of the cache keys, cached values could be
+    returned for new objects reusing the ids of garbage-collected arguments).
+
+    Recursive calls with the same arguments raise :class:`RecursiveCallException`, calls
+    with the same arguments done concurrently by different threads are all executed.
+
+    The decorator could be used as ``@memoize_by_id`` or as ``@memoize_by_id(maxsize=...)``.
+
+    The decorated function exposes ``cache_info(scope=None)`` and ``cache_clear(scope=None)``,
+    where scope is the Spec owning the cache (if any).
+
+    :param maxsize: maximum number of cached values, see :class:`MemoizeCache`.
+        If None the default maximum size of the registry, if any, is used.
+    """
+    if func is None:
+        return functools.partial(memoize_by_id, maxsize=maxsize)
+
+    cache = func.cache = MemoizeCache(maxsize)  # type: ignore  # It's not worth to modify the signature to include handling of cache attribute  # noqa: E501
+    # Keys of the calls in progress, tracked per thread so that only recursive calls are detected
+    in_progress = threading.local()
+    _CACHE_MISS = object()
+
+    make_key = _make_positional_key_builder(func) or _make_generic_key_builder(func)
+    arg_names = get_function_spec(func).args
+    is_scoped = bool(arg_names) and arg_names[0] == 'swagger_spec'
+
+    def get_cache(scope=None):
+        # type: (typing.Any) -> MemoizeCache
+        registry = _get_memoize_cache_registry(scope)
+        if registry is None:
+            return cache
+        scoped_cache = registry.get(wrapper)
+        if scoped_cache is None:
+            scoped_cache = registry[wrapper] = MemoizeCache(registry.maxsize if maxsize is None else maxsize)
+        return scoped_cache
 
     @wraps(func)
     def wrapper(*args, **kwargs):
         # type: (typing.Any, typing.Any) -> typing.Any
         cache_key = make_key(*args, **kwargs)
-        cached_value = cache.get(cache_key, _CACHE_MISS)
+        if is_scoped:
+            call_cache = get_cache(args[0] if args else kwargs.get('swagger_spec'))
+        else:
+            call_cache = cache
+        cached_value = call_cache.lookup(cache_key, _CACHE_MISS)
         if cached_value is _CACHE_MISS:
+            key_in_progress_set = getattr(in_progress, 'keys', None)
+            if key_in_progress_set is None:
+                key_in_progress_set = in_progress.keys = set()
             if cache_key in key_in_progress_set:
                 raise RecursiveCallException()
             key_in_progress_set.add(cache_key)
-            cached_value = func(*args, **kwargs)
-            key_in_progress_set.remove(cache_key)
-            cache[cache_key] = cached_value
+            try:
+                cached_value = func(*args, **kwargs)
+            finally:
+                key_in_progress_set.remove(cache_key)
+            if call_cache is cache and cache.maxsize is None:
+                call_cache.store(cache_key, cached_value)
+            else:
+                call_cache.store(cache_key, cached_value, args + tuple(itervalues(kwargs)))
         return cached_value
+
+    wrapper.cache_info = lambda scope=None: get_cache(scope).info()  # type: ignore
+    wrapper.cache_clear = lambda scope=None: get_cache(scope).clear()  # type: ignore
     return wrapper  # type: ignore  # ignoring type to avoiding typing.cast call
 
 
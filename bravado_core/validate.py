@@ -4,19 +4,27 @@ Delegate as much validation as possible out to jsonschema. This module serves
 as the single point of entry for validations should we need to further
 customize the behavior.
 """
+import numbers
 import sys
 
 import jsonschema
 import typing
+from six import integer_types
+from six import iteritems
 from six import itervalues
 from six import reraise
+from six import string_types
 
+from bravado_core import _decorators
 from bravado_core._compat import wraps
 from bravado_core.exception import SwaggerMappingError
 from bravado_core.exception import SwaggerSecurityValidationError
 from bravado_core.model import is_object
+from bravado_core.schema import is_param_spec
+from bravado_core.schema import is_prop_nullable
 from bravado_core.schema import SWAGGER_PRIMITIVES
 from bravado_core.swagger20_validator import get_validator_type
+from bravado_core.util import memoize_by_id
 
 
 if getattr(typing, 'TYPE_CHECKING', False):
@@ -24,6 +32,9 @@ if getattr(typing, 'TYPE_CHECKING', False):
     from bravado_core._compat_typing import FuncType
     from bravado_core.operation import Operation
     from bravado_core.spec import Spec
+    from bravado_core.swagger20_validator import ValidatorType
+
+    ValidationClosure = typing.Callable[[typing.Any], bool]
 
 
 def scrub_sensitive_value(func):
@@ -94,11 +105,7 @@ def validate_primitive(
     :param primitive_spec: spec for a swagger primitive type in dict form
     :type value: int, string, float, long, etc
     """
-    get_validator_type(swagger_spec=swagger_spec)(
-        primitive_spec,
-        format_checker=swagger_spec.format_checker,
-        resolver=swagger_spec.resolver,
-    ).validate(value)
+    _validate(swagger_spec, primitive_spec, value)
 
 
 @scrub_sensitive_value
@@ -113,11 +120,7 @@ def validate_array(
     :param array_spec: spec for an 'array' type in dict form
     :type value: list
     """
-    get_validator_type(swagger_spec=swagger_spec)(
-        array_spec,
-        format_checker=swagger_spec.format_checker,
-        resolver=swagger_spec.resolver,
-    ).validate(value)
+    _validate(swagger_spec, array_spec, value)
 
 
 @scrub_sensitive_value
@@ -132,11 +135,354 @@ def validate_object(
     :param object_spec: spec for an 'object' type in dict form
     :type value: dict
     """
-    get_validator_type(swagger_spec=swagger_spec)(
-        object_spec,
+    _validate(swagger_spec, object_spec, value)
+
+
+def _validate(
+    swagger_spec,  # type: Spec
+    schema,  # type: JSONDict
+    value,  # type: typing.Any
+):
+    # type: (...) -> None
+    if swagger_spec.config['validate_backend'] == 'compiled' and _get_validation_closure(swagger_spec, schema)(value):
+        return
+    # The jsonschema validator is the source of truth for the raised errors. If the value has been
+    # rejected by the compiled closure we run it anyway in order to raise exactly the same error.
+    _get_validator(swagger_spec, schema).validate(value)
+
+
+@memoize_by_id
+def _get_validator(swagger_spec, schema):
+    # type: (Spec, JSONDict) -> ValidatorType
+    """
+    Build the jsonschema validator for the given schema.
+
+    The validator does not hold state related to the validated values, so it is
+    built only once per schema and reused by all the following validations.
+    """
+    return get_validator_type(swagger_spec=swagger_spec)(
+        schema,
         format_checker=swagger_spec.format_checker,
         resolver=swagger_spec.resolver,
-    ).validate(value)
+    )
+
+
+def _always_valid(value):
+    # type: (typing.Any) -> bool
+    return True
+
+
+def _is_not_none(value):
+    # type: (typing.Any) -> bool
+    return value is not None
+
+
+# Type checks equivalent to the Draft4 ones defined by jsonschema
+_TYPE_CHECKS = {
+    'array': lambda value: isinstance(value, list),
+    'boolean': lambda value: isinstance(value, bool),
+    'integer': lambda value: isinstance(value, integer_types) and not isinstance(value, bool),
+    'null': lambda value: value is None,
+    'number': lambda value: isinstance(value, numbers.Number) and not isinstance(value, bool),
+    'object': lambda value: isinstance(value, dict),
+    'string': lambda value: isinstance(value, string_types),
+}  # type: typing.Dict[typing.Text, ValidationClosure]
+
+
+# Keywords that, if defined as objects, only validate the values of properties or items
+_CHILDREN_KEYWORDS = frozenset(('additionalProperties', 'items', 'properties'))
+
+
+@_decorators.wrap_recursive_call_exception
+@memoize_by_id
+def _get_validation_closure(swagger_spec, schema):
+    # type: (Spec, JSONDict) -> ValidationClosure
+    """
+    Compile the given schema into a closure that returns True if a value is valid.
+
+    Common Swagger 2.0 keywords are checked by specialized closures, that are resolved once
+    per schema. All the other keywords delegate to the keyword functions of the validator
+    returned by :func:`bravado_core.swagger20_validator.get_validator_type`.
+
+    NOTE: the closure is only meant to speed up the validation of valid values, so it must never
+    accept a value that jsonschema would reject. Errors are reported by running the jsonschema
+    validator (see :func:`_validate`).
+    """
+    if '$ref' in schema:
+        # Draft4 ignores all the keywords defined as siblings of $ref
+        return _get_validation_closure(swagger_spec, swagger_spec.deref(schema))
+
+    return _compile_validation_closure(swagger_spec, schema, skip_children=False)
+
+
+@_decorators.wrap_recursive_call_exception
+@memoize_by_id
+def _get_shallow_validation_closure(swagger_spec, schema):
+    # type: (Spec, JSONDict) -> ValidationClosure
+    """
+    Compile the given schema into a closure that returns True if a value is valid,
+    ignoring the values of its properties and items.
+
+    The closure does not check `properties` and the object forms of `items` and `additionalProperties`.
+    It is meant to be used while traversing the value (ie. while unmarshaling it),
+    such that each property and item is checked by the closure of its own schema.
+    """
+    if '$ref' in schema:
+        return _get_shallow_validation_closure(swagger_spec, swagger_spec.deref(schema))
+
+    return _compile_validation_closure(swagger_spec, schema, skip_children=True)
+
+
+def _compile_validation_closure(swagger_spec, schema, skip_children):
+    # type: (Spec, JSONDict, bool) -> ValidationClosure
+    keyword_functions = get_validator_type(swagger_spec=swagger_spec).VALIDATORS
+    checks = []
+    for keyword, keyword_value in iteritems(schema):
+        keyword_function = keyword_functions.get(keyword)
+        if keyword_function is None:
+            continue
+        if skip_children and keyword in _CHILDREN_KEYWORDS and isinstance(keyword_value, dict):
+            continue
+        keyword_compiler = _KEYWORD_COMPILERS.get(keyword)
+        check = keyword_compiler(swagger_spec, schema, keyword_value) if keyword_compiler else None
+        if check is None:
+            check = _compile_keyword_function(swagger_spec, schema, keyword_function, keyword_value)
+        if check is not _always_valid:
+            checks.append(check)
+
+    if not checks:
+        return _always_valid
+    elif len(checks) == 1:
+        return checks[0]
+
+    checks_tuple = tuple(checks)
+
+    def check_all(value):
+        # type: (typing.Any) -> bool
+        for check in checks_tuple:
+            if not check(value):
+                return False
+        return True
+    return check_all
+
+
+def _compile_keyword_function(swagger_spec, schema, keyword_function, keyword_value):
+    # type: (Spec, JSONDict, typing.Callable[..., typing.Any], typing.Any) -> ValidationClosure
+    validator = _get_validator(swagger_spec, schema)
+
+    def check(value):
+        # type: (typing.Any) -> bool
+        try:
+            # Some keyword functions (ie. discriminator) raise errors instead of yielding them
+            for _ in keyword_function(validator, keyword_value, value, schema) or ():
+                return False
+        except jsonschema.ValidationError:
+            return False
+        return True
+    return check
+
+
+def _compile_type(swagger_spec, schema, types):
+    # type: (Spec, JSONDict, typing.Any) -> typing.Optional[ValidationClosure]
+    type_checks = tuple(
+        _TYPE_CHECKS.get(type_)
+        for type_ in ([types] if isinstance(types, string_types) else types)
+    )
+    if None in type_checks:
+        # Let jsonschema deal with unknown types
+        return None
+
+    # Swagger parameters and nullable properties accept None regardless of their type
+    if is_param_spec(swagger_spec, schema) or is_prop_nullable(swagger_spec, schema):
+        type_checks += (_TYPE_CHECKS['null'],)
+
+    if len(type_checks) == 1:
+        return type_checks[0]
+
+    def check(value):
+        # type: (typing.Any) -> bool
+        return any(type_check(value) for type_check in type_checks)
+    return check
+
+
+def _compile_format(swagger_spec, schema, format):
+    # type: (Spec, JSONDict, typing.Any) -> typing.Optional[ValidationClosure]
+    format_checker = swagger_spec.format_checker
+    skip_none = is_param_spec(swagger_spec, schema) or is_prop_nullable(swagger_spec, schema)
+
+    def check(value):
+        # type: (typing.Any) -> bool
+        return (skip_none and value is None) or format_checker.conforms(value, format)
+    return check
+
+
+def _compile_required(swagger_spec, schema, required):
+    # type: (Spec, JSONDict, typing.Any) -> typing.Optional[ValidationClosure]
+    if is_param_spec(swagger_spec, schema):
+        # Swagger 2.0 parameters define `required` as a boolean
+        return _is_not_none if required else _always_valid
+
+    if not isinstance(required, (list, tuple)):
+        return None
+
+    def check(value):
+        # type: (typing.Any) -> bool
+        if not isinstance(value, dict):
+            return True
+        for property_name in required:
+            if property_name not in value:
+                return False
+        return True
+    return check
+
+
+def _compile_properties(swagger_spec, schema, properties):
+    # type: (Spec, JSONDict, typing.Any) -> typing.Optional[ValidationClosure]
+    property_checks = tuple(
+        (property_name, _get_validation_closure(swagger_spec, property_schema))
+        for property_name, property_schema in iteritems(properties)
+    )
+
+    def check(value):
+        # type: (typing.Any) -> bool
+        if not isinstance(value, dict):
+            return True
+        for property_name, property_check in property_checks:
+            if property_name in value and not property_check(value[property_name]):
+                return False
+        return True
+    return check
+
+
+def _compile_additional_properties(swagger_spec, schema, additional_properties):
+    # type: (Spec, JSONDict, typing.Any) -> typing.Optional[ValidationClosure]
+    if 'patternProperties' in schema:
+        return None
+
+    properties = schema.get('properties', {})
+    if isinstance(additional_properties, dict):
+        additional_property_check = _get_validation_closure(swagger_spec, additional_properties)
+    elif not additional_properties:
+        additional_property_check = None
+    else:
+        return _always_valid
+
+    def check(value):
+        # type: (typing.Any) -> bool
+        if not isinstance(value, dict):
+            return True
+        for property_name in value:
+            if property_name not in properties and (
+                additional_property_check is None or
+                not additional_property_check(value[property_name])
+            ):
+                return False
+        return True
+    return check
+
+
+# Types of the items accepted by _compile_numeric_items_check, by item schema type
+_NUMERIC_ITEM_TYPES = {
+    'integer': frozenset(integer_types),
+    'number': frozenset(integer_types + (float,)),
+}
+
+# Keywords of item schemas checked by _compile_numeric_items_check
+_NUMERIC_ITEM_KEYWORDS = frozenset(('type', 'format', 'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum'))
+
+
+def _compile_numeric_items_check(swagger_spec, items):
+    # type: (Spec, JSONDict) -> typing.Optional[ValidationClosure]
+    """
+    Compile the check of lists of numbers, all valid according to the items schema, that
+    checks the types and the bounds of all the items at once (instead of item by item).
+
+    The check could reject valid lists (ie. with None items of nullable schemas, or
+    with NaN items) that then have to be checked item by item.
+
+    :return: the check, or None if the items schema has keywords that have to be checked item by item
+    """
+    items = swagger_spec.deref(items)
+    item_type = items.get('type')
+    item_types = _NUMERIC_ITEM_TYPES.get(item_type) if isinstance(item_type, string_types) else None
+    if item_types is None:
+        return None
+
+    keyword_functions = get_validator_type(swagger_spec=swagger_spec).VALIDATORS
+    for keyword in items:
+        if keyword in keyword_functions and keyword not in _NUMERIC_ITEM_KEYWORDS:
+            return None
+    if 'format' in items and items['format'] in swagger_spec.format_checker.checkers:
+        return None
+
+    minimum = items.get('minimum')
+    maximum = items.get('maximum')
+    exclusive_minimum = items.get('exclusiveMinimum', False)
+    exclusive_maximum = items.get('exclusiveMaximum', False)
+    # min and max of lists with NaN items depend on the order of the items
+    check_nan = item_type == 'number' and (minimum is not None or maximum is not None)
+
+    def check(value):
+        # type: (typing.List[typing.Any]) -> bool
+        if not item_types.issuperset(map(type, value)):
+            return False
+        if check_nan and any(item != item for item in value):
+            return False
+        if minimum is not None:
+            smallest = min(value)
+            if smallest < minimum or (exclusive_minimum and smallest == minimum):
+                return False
+        if maximum is not None:
+            largest = max(value)
+            if largest > maximum or (exclusive_maximum and largest == maximum):
+                return False
+        return True
+    return check
+
+
+def _compile_items(swagger_spec, schema, items):
+    # type: (Spec, JSONDict, typing.Any) -> typing.Optional[ValidationClosure]
+    if not isinstance(items, dict):
+        return None
+
+    item_check = _get_validation_closure(swagger_spec, items)
+    numeric_items_check = _compile_numeric_items_check(swagger_spec, items)
+
+    def check(value):
+        # type: (typing.Any) -> bool
+        if not isinstance(value, list):
+            return True
+        if numeric_items_check is not None and value and numeric_items_check(value):
+            return True
+        for item in value:
+            if not item_check(item):
+                return False
+        return True
+    return check
+
+
+def _compile_all_of(swagger_spec, schema, all_of):
+    # type: (Spec, JSONDict, typing.Any) -> typing.Optional[ValidationClosure]
+    all_of_checks = tuple(_get_validation_closure(swagger_spec, all_of_schema) for all_of_schema in all_of)
+
+    def check(value):
+        # type: (typing.Any) -> bool
+        for all_of_check in all_of_checks:
+            if not all_of_check(value):
+                return False
+        return True
+    return check
+
+
+_KEYWORD_COMPILERS = {
+    'additionalProperties': _compile_additional_properties,
+    'allOf': _compile_all_of,
+    'format': _compile_format,
+    'items': _compile_items,
+    'properties': _compile_properties,
+    'required': _compile_required,
+    'type': _compile_type,
+}  # type: typing.Dict[typing.Text, typing.Callable[[Spec, JSONDict, typing.Any], typing.Optional[ValidationClosure]]]
 
 
 def validate_security_object(
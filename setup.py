@@ -36,7 +36,6 @@ setup(
         "Programming Language :: Python :: 3.7",
     ],
     install_requires=[
-        "jsonref",
         "jsonschema[format]>=2.5.1",
         "python-dateutil",
         "pyyaml",
@@ -55,6 +54,8 @@ setup(
         ':python_version<"3.5"': ['typing'],
         ':python_version<"3.4"': ['enum34'],
         ':python_version<"3.2"': ['functools32'],
+        # See the numeric_array_type config option
+        'numpy': ['numpy'],
     },
     python_requires='!=3.0,!=3.1,!=3.2,!=3.3,!=3.4,!=3.5.0',
 )
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import copy
+
+import pytest
+
+from bravado_core.dereference import dereference_refs
+from bravado_core.exception import SwaggerSchemaError
+
+
+def test_dereference_refs():
+    spec_dict = {
+        'definitions': {
+            'Pet': {'type': 'object', 'properties': {'tag': {'$ref': '#/definitions/Tag'}}},
+            'Tag': {'type': 'string'},
+            'a~b/c d': {'type': 'integer'},
+        },
+        'paths': {
+            '/pets': {'get': {'responses': {'200': {'schema': {'type': 'array', 'items': {'$ref': '#/definitions/Pet'}}}}}},
+        },
+        'parameters': {
+            'escaped': {'$ref': '#/definitions/a~0b~1c%20d'},
+            'through_ref': {'$ref': '#/paths/~1pets/get/responses/200/schema/items/properties/tag'},
+        },
+    }
+    original_spec_dict = copy.deepcopy(spec_dict)
+
+    deref_spec_dict = dereference_refs(spec_dict)
+
+    definitions = deref_spec_dict['definitions']
+    assert definitions['Pet'] == {'type': 'object', 'properties': {'tag': {'type': 'string'}}}
+    # Referenced objects are shared
+    assert definitions['Pet']['properties']['tag'] is definitions['Tag']
+    assert deref_spec_dict['paths']['/pets']['get']['responses']['200']['schema']['items'] is definitions['Pet']
+    assert deref_spec_dict['parameters']['escaped'] is definitions['a~b/c d']
+    assert deref_spec_dict['parameters']['through_ref'] is definitions['Tag']
+    # spec_dict is not modified
+    assert spec_dict == original_spec_dict
+
+
+def test_dereference_refs_with_recursive_references():
+    spec_dict = {
+        'definitions': {
+            'Node': {
+                'type': 'object',
+                'properties': {'children': {'type': 'array', 'items': {'$ref': '#/definitions/Node'}}},
+            },
+            'Alias': {'$ref': '#/definitions/Node'},
+        },
+    }
+
+    definitions = dereference_refs(spec_dict)['definitions']
+
+    assert definitions['Node']['properties']['children']['items'] is definitions['Node']
+    assert definitions['Alias'] is definitions['Node']
+
+
+def test_dereference_refs_with_long_chains_of_references():
+    chain_length = 5000
+    spec_dict = {
+        'definitions': {
+            'Node{0}'.format(index): {'properties': {'next': {'$ref': '#/definitions/Node{0}'.format(index + 1)}}}
+            for index in range(chain_length)
+        },
+    }
+    spec_dict['definitions']['Node{0}'.format(chain_length)] = {'type': 'object'}
+
+    definitions = dereference_refs(spec_dict)['definitions']
+
+    assert definitions['Node0']['properties']['next'] is definitions['Node1']
+
+
+@pytest.mark.parametrize(
+    'reference',
+    ['#/definitions/Unknown', '#/definitions/Pet/0', 'other.json#/definitions/Pet', '#/definitions/Loop'],
+)
+def test_dereference_refs_fails_on_unresolvable_references(reference):
+    spec_dict = {
+        'definitions': {
+            'Pet': {'type': 'object'},
+            'Loop': {'$ref': '#/definitions/Loop'},
+        },
+        'parameters': {'param': {'$ref': reference}},
+    }
+    with pytest.raises(SwaggerSchemaError):
+        dereference_refs(spec_dict)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+from datetime import date
+from datetime import datetime
+
+import dateutil.parser
+import pytest
+from dateutil.tz import tzoffset
+from dateutil.tz import tzutc
+from mock import patch
+
+from bravado_core.formatter import DATEUTIL_DATE_FORMATS
+from bravado_core.formatter import DEFAULT_FORMATS
+from bravado_core.formatter import parse_date
+from bravado_core.formatter import parse_date_time
+from bravado_core.spec import Spec
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        '2018-05-21T12:34:56',
+        '2018-05-21T12:34:56Z',
+        '2018-05-21t12:34:56z',
+        '2018-05-21 12:34:56+00:00',
+        '2018-05-21T12:34:56-00:00',
+        '2018-05-21T12:34:56.7+02:00',
+        '2018-05-21T12:34:56.123456-05:30',
+        '2018-05-21T12:34:56.1234567891Z',
+        # Not RFC3339, parsed by dateutil
+        '2018-05-21',
+        '2018-05-21T12:34',
+        '20180521T123456Z',
+        'May 21 2018 12:34:56',
+    ],
+)
+def test_parse_date_time_matches_dateutil(value):
+    expected = dateutil.parser.parse(value)
+
+    result = parse_date_time(value)
+
+    assert result == expected
+    # NOTE: dateutil could return tzlocal() instead of tzutc() for UTC values, depending on the local timezone
+    assert result.utcoffset() == expected.utcoffset()
+    assert result.replace(tzinfo=None) == expected.replace(tzinfo=None)
+
+
+def test_parse_date_time_timezones():
+    assert parse_date_time('2018-05-21T12:34:56Z').tzinfo is parse_date_time('2018-05-21T12:34:56+00:00').tzinfo
+    assert parse_date_time('2018-05-21T12:34:56+01:00').tzinfo is parse_date_time('2019-01-01T00:00:00+01:00').tzinfo
+    assert parse_date_time('2018-05-21T12:34:56-01:30').utcoffset() == tzoffset(None, -5400).utcoffset(None)
+    assert parse_date_time('2018-05-21T12:34:56Z') == datetime(2018, 5, 21, 12, 34, 56, tzinfo=tzutc())
+
+
+@patch('bravado_core.formatter.dateutil.parser.parse', wraps=dateutil.parser.parse)
+def test_parse_date_time_rfc3339_values_are_parsed_natively(mock_parse):
+    parse_date_time('2018-05-21T12:34:56.789+02:00')
+    parse_date('2018-05-21')
+    assert mock_parse.call_count == 0
+
+
+@pytest.mark.parametrize('value', ['2018-02-30T12:34:56Z', '2018-05-21T25:00:00', 'not a date-time'])
+def test_parse_date_time_invalid_values(value):
+    with pytest.raises(ValueError):
+        parse_date_time(value)
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('2018-05-21', date(2018, 5, 21)),
+        ('2018-05-21T12:34:56Z', date(2018, 5, 21)),
+        ('May 21 2018', date(2018, 5, 21)),
+    ],
+)
+def test_parse_date(value, expected):
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize('value', ['2018-02-30', 'not a date'])
+def test_parse_date_invalid_values(value):
+    with pytest.raises(ValueError):
+        parse_date(value)
+
+
+@pytest.mark.parametrize('use_dateutil_for_dates', [False, True])
+def test_use_dateutil_for_dates(minimal_swagger_dict, use_dateutil_for_dates):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'use_dateutil_for_dates': use_dateutil_for_dates})
+    formats = DATEUTIL_DATE_FORMATS if use_dateutil_for_dates else DEFAULT_FORMATS
+
+    for format_name in ('date', 'date-time'):
+        assert swagger_spec.get_format(format_name) is formats[format_name]
+    assert swagger_spec.get_format('date-time').to_wire(datetime(2018, 5, 21)) == '2018-05-21T00:00:00+00:00'
+    assert swagger_spec.get_format('date-time').to_python('2018-05-21T00:00:00Z') == datetime(2018, 5, 21, tzinfo=tzutc())
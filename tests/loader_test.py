@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import mock
+import pytest
+import yaml
+
+from bravado_core.loader import get_file_url
+from bravado_core.loader import load
+from bravado_core.loader import load_file
+from bravado_core.loader import load_json
+from bravado_core.loader import load_url
+from bravado_core.loader import load_yaml
+
+
+DOCUMENT = {'swagger': '2.0', 'definitions': {'Pet': {'type': 'object', 'x-nullable': True}}}
+
+
+@pytest.mark.parametrize('content', [yaml.dump(DOCUMENT), yaml.dump(DOCUMENT).encode('utf-8')])
+def test_load_yaml(content):
+    assert load_yaml(content) == DOCUMENT
+
+
+@pytest.mark.parametrize('content', [json.dumps(DOCUMENT), json.dumps(DOCUMENT).encode('utf-8')])
+def test_load_json(content):
+    assert load_json(content) == DOCUMENT
+
+
+def test_load_json_with_custom_json_loads():
+    content = json.dumps(DOCUMENT).encode('utf-8')
+    mock_json_loads = mock.Mock(return_value=DOCUMENT)
+    assert load_json(content, mock_json_loads) == DOCUMENT
+    mock_json_loads.assert_called_once_with(content)
+
+
+def test_load_json_does_not_decode_bytes():
+    content = json.dumps(DOCUMENT).encode('utf-8')
+    with mock.patch('bravado_core.loader.json.loads', return_value=DOCUMENT) as mock_json_loads:
+        assert load_json(content) == DOCUMENT
+    mock_json_loads.assert_called_once_with(content)
+
+
+@pytest.mark.parametrize(
+    'url, content_type, expected_yaml',
+    [
+        ('file:///swagger.yaml', None, True),
+        ('file:///swagger.YML', None, True),
+        ('http://host/swagger', 'application/x-yaml', True),
+        ('http://host/swagger.json', None, False),
+        ('http://host/swagger', 'application/json', False),
+    ],
+)
+def test_load(url, content_type, expected_yaml):
+    content = yaml.dump(DOCUMENT) if expected_yaml else json.dumps(DOCUMENT)
+    with mock.patch('bravado_core.loader.load_yaml', wraps=load_yaml) as mock_load_yaml:
+        assert load(content, url, content_type) == DOCUMENT
+    assert mock_load_yaml.called is expected_yaml
+
+
+@pytest.mark.parametrize('extension', ['.yaml', '.json'])
+@pytest.mark.parametrize('use_url', [True, False])
+def test_load_file(tmpdir, extension, use_url):
+    path = os.path.join(str(tmpdir), 'swagger' + extension)
+    with open(path, 'w') as f:
+        f.write(yaml.dump(DOCUMENT) if extension == '.yaml' else json.dumps(DOCUMENT))
+    assert load_file(get_file_url(path) if use_url else path) == DOCUMENT
+
+
+def test_load_url_with_http_client():
+    mock_http_client = mock.Mock()
+    response = mock_http_client.request.return_value.result.return_value
+    response.headers = {'content-type': 'application/yaml; charset=utf-8'}
+    response.raw_bytes = yaml.dump(DOCUMENT).encode('utf-8')
+
+    assert load_url('http://host/swagger', http_client=mock_http_client) == DOCUMENT
+    mock_http_client.request.assert_called_once_with({'method': 'GET', 'url': 'http://host/swagger'})
+
+
+def test_load_url_without_http_client():
+    with mock.patch('bravado_core.loader.urlopen') as mock_urlopen:
+        mock_urlopen.return_value.headers = {'content-type': 'application/json'}
+        mock_urlopen.return_value.read.return_value = json.dumps(DOCUMENT).encode('utf-8')
+        assert load_url('http://host/swagger') == DOCUMENT
+    mock_urlopen.assert_called_once_with('http://host/swagger')
+    assert mock_urlopen.return_value.close.called
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import msgpack
+import pytest
+import simplejson as json
+
+from bravado_core.content_type import APP_JSON
+from bravado_core.content_type import APP_MSGPACK
+from bravado_core.exception import SwaggerMappingError
+from bravado_core.marshal import iter_marshal_array_to_bytes
+from bravado_core.marshal import marshal_schema_object
+
+
+@pytest.fixture
+def find_by_status_schema(petstore_spec):
+    return petstore_spec.spec_dict['paths']['/pet/findByStatus']['get']['responses']['200']['schema']
+
+
+@pytest.fixture
+def pets(petstore_spec):
+    Pet = petstore_spec.definitions['Pet']
+    Category = petstore_spec.definitions['Category']
+    return [
+        Pet(id=1, name='Fido', photoUrls=[], category=Category(id=200, name='friendly')),
+        {'id': 2, 'name': 'Rex', 'photoUrls': ['wagtail.png']},
+    ]
+
+
+@pytest.mark.parametrize(
+    'content_type, loads',
+    [
+        (APP_JSON, json.loads),
+        (APP_MSGPACK, lambda raw_bytes: msgpack.loads(raw_bytes, raw=False)),
+    ],
+)
+@pytest.mark.parametrize('number_of_pets', [0, 1, 2])
+def test_iter_marshal_array_to_bytes(petstore_spec, find_by_status_schema, pets, content_type, loads, number_of_pets):
+    pets = pets[:number_of_pets]
+    chunks = list(iter_marshal_array_to_bytes(petstore_spec, find_by_status_schema, pets, content_type))
+
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert loads(b''.join(chunks)) == marshal_schema_object(petstore_spec, find_by_status_schema, pets)
+
+
+def test_iter_marshal_array_to_bytes_marshals_values_lazily(minimal_swagger_spec):
+    array_spec = {'type': 'array', 'items': {'type': 'string', 'format': 'date'}}
+    values = (datetime.date(2020, 1, day) for day in range(1, 3))
+    chunks = iter_marshal_array_to_bytes(minimal_swagger_spec, array_spec, values)
+
+    assert next(chunks) == b'["2020-01-01"'
+    assert next(values) == datetime.date(2020, 1, 2)
+    assert list(chunks) == [b']']
+
+
+def test_iter_marshal_array_to_bytes_with_null_value(minimal_swagger_spec):
+    array_spec = {'type': 'array', 'items': {'type': 'string'}}
+    assert list(iter_marshal_array_to_bytes(minimal_swagger_spec, array_spec, None)) == [b'null']
+
+
+@pytest.mark.parametrize('values', [{'a': 'b'}, 'a string'])
+def test_iter_marshal_array_to_bytes_raises_on_not_iterable_values(minimal_swagger_spec, values):
+    array_spec = {'type': 'array', 'items': {'type': 'string'}}
+    with pytest.raises(SwaggerMappingError):
+        iter_marshal_array_to_bytes(minimal_swagger_spec, array_spec, values)
+
+
+def test_iter_marshal_array_to_bytes_raises_on_unsupported_content_type(minimal_swagger_spec):
+    array_spec = {'type': 'array', 'items': {'type': 'string'}}
+    with pytest.raises(SwaggerMappingError):
+        iter_marshal_array_to_bytes(minimal_swagger_spec, array_spec, [], 'text/plain')
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
+import array
 import copy
 
 import pytest
 
 from bravado_core.exception import SwaggerMappingError
 from bravado_core.marshal import marshal_array
+from bravado_core.marshal import marshal_schema_object
 from bravado_core.spec import Spec
 
 
@@ -197,3 +199,53 @@ def test_non_nullable_array(empty_swagger_spec, int_array_spec):
     with pytest.raises(SwaggerMappingError) as excinfo:
         marshal_array(empty_swagger_spec, int_array_spec, None)
     assert 'is a required value' in str(excinfo.value)
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        [1, 2.5],
+        (1, 2.5),
+        array.array('d', [1, 2.5]),
+        array.array('q', [1, 2]),
+    ],
+)
+@pytest.mark.parametrize('numeric_array_type', ['list', 'array'])
+def test_numeric_array_type(empty_swagger_spec, value, numeric_array_type):
+    empty_swagger_spec.config['numeric_array_type'] = numeric_array_type
+    result = marshal_array(empty_swagger_spec, {'type': 'array', 'items': {'type': 'number', 'format': 'double'}}, value)
+    assert result == [float(item) for item in value]
+    assert all(type(item) is float for item in result)
+
+
+@pytest.mark.parametrize('marshal_backend', ['partial', 'codegen'])
+def test_numeric_array_type_models(minimal_swagger_dict, marshal_backend):
+    minimal_swagger_dict['definitions']['Metrics'] = {
+        'type': 'object',
+        'properties': {
+            'values': {'type': 'array', 'items': {'type': 'integer'}},
+            'optional_values': {'type': 'array', 'items': {'type': 'integer', 'format': 'int32', 'x-nullable': True}},
+        },
+    }
+    swagger_spec = Spec.from_dict(
+        minimal_swagger_dict,
+        config={'numeric_array_type': 'array', 'marshal_backend': marshal_backend},
+    )
+    Metrics = swagger_spec.definitions['Metrics']
+    metrics_spec = swagger_spec.spec_dict['definitions']['Metrics']
+
+    assert marshal_schema_object(
+        swagger_spec, metrics_spec, Metrics(values=array.array('q', [1, 2]), optional_values=[1, None]),
+    ) == {'values': [1, 2], 'optional_values': [1, None]}
+    with pytest.raises(SwaggerMappingError):
+        marshal_schema_object(swagger_spec, metrics_spec, Metrics(values=array.array('q', [1, 2]), optional_values=1))
+
+
+def test_numeric_array_type_numpy(empty_swagger_spec):
+    numpy = pytest.importorskip('numpy')
+    empty_swagger_spec.config['numeric_array_type'] = 'numpy'
+
+    result = marshal_array(empty_swagger_spec, {'type': 'array', 'items': {'type': 'number'}}, numpy.array([1, 2.5]))
+
+    assert result == [1.0, 2.5]
+    assert all(type(item) is float for item in result)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import pytest
+
+from bravado_core.exception import SwaggerMappingError
+from bravado_core.marshal import _get_marshaling_method
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.spec import Spec
+from tests.conftest import get_url
+
+
+@pytest.fixture
+def object_spec():
+    return {
+        'type': 'object',
+        'required': ['id', 'created'],
+        'properties': {
+            'id': {'type': 'integer', 'format': 'int64'},
+            'created': {'type': 'string', 'format': 'date'},
+            'name': {'type': 'string', 'default': 'unnamed'},
+            'nickname': {'type': 'string', 'x-nullable': True},
+            'dates': {'type': 'array', 'items': {'type': 'string', 'format': 'date'}},
+            'labels': {'type': 'array', 'items': {'type': 'string'}},
+            'anything': {},
+        },
+        'additionalProperties': {'type': 'string', 'format': 'date'},
+    }
+
+
+@pytest.fixture(params=['partial', 'codegen'])
+def swagger_spec(request, minimal_swagger_dict):
+    return Spec.from_dict(minimal_swagger_dict, config={'marshal_backend': request.param})
+
+
+def test_codegen_generates_a_function(minimal_swagger_dict, object_spec):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'marshal_backend': 'codegen'})
+    marshaling_method = _get_marshaling_method(swagger_spec=swagger_spec, object_schema=object_spec)
+    assert marshaling_method.__name__ == 'marshal'
+    assert marshaling_method.__source__.startswith('def marshal(value):')
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        (
+            {'id': 1, 'created': datetime.date(2020, 1, 2)},
+            {'id': 1, 'created': '2020-01-02'},
+        ),
+        (
+            {
+                'id': 1, 'created': datetime.date(2020, 1, 2), 'name': None, 'nickname': None,
+                'dates': [datetime.date(2020, 1, 3), None], 'labels': ('a', 'b'), 'anything': None,
+                'additional': datetime.date(2020, 1, 4),
+            },
+            {
+                'id': 1, 'created': '2020-01-02', 'nickname': None,
+                'dates': ['2020-01-03', None], 'labels': ['a', 'b'],
+                'additional': '2020-01-04',
+            },
+        ),
+    ],
+)
+def test_marshal_object(swagger_spec, object_spec, value, expected):
+    assert marshal_schema_object(swagger_spec, object_spec, value) == expected
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        {'id': None, 'created': datetime.date(2020, 1, 2)},
+        {'id': 1, 'created': 'not-a-date'},
+        {'id': 1, 'created': datetime.date(2020, 1, 2), 'dates': 'not-a-list'},
+        'not-a-dict',
+    ],
+)
+def test_marshal_object_raises_on_invalid_values(swagger_spec, object_spec, value):
+    with pytest.raises(SwaggerMappingError):
+        marshal_schema_object(swagger_spec, object_spec, value)
+
+
+@pytest.mark.parametrize('internally_dereference_refs', [True, False])
+def test_marshal_models_is_equivalent_to_partial_backend(petstore_dict, petstore_abspath, internally_dereference_refs):
+    value = {
+        'id': 1,
+        'name': 'Fido',
+        'photoUrls': ['wagtail.png'],
+        'category': {'id': 200, 'name': 'friendly'},
+        'tags': [{'id': 99, 'name': 'mini'}],
+        'additional': 'property',
+    }
+
+    results = []
+    for marshal_backend in ('partial', 'codegen'):
+        petstore_spec = Spec.from_dict(
+            petstore_dict,
+            origin_url=get_url(petstore_abspath),
+            config={
+                'marshal_backend': marshal_backend,
+                'internally_dereference_refs': internally_dereference_refs,
+            },
+        )
+        pet = petstore_spec.definitions['Pet']._unmarshal(value)
+        results.append(marshal_schema_object(petstore_spec, petstore_spec._internal_spec_dict['definitions']['Pet'], pet))
+
+    assert results[0] == results[1] == value
+
+
+def test_polymorphic_schemas_are_not_compiled(polymorphic_dict):
+    polymorphic_spec = Spec.from_dict(polymorphic_dict, config={'marshal_backend': 'codegen'})
+    marshaling_method = _get_marshaling_method(
+        swagger_spec=polymorphic_spec,
+        object_schema=polymorphic_spec.spec_dict['definitions']['GenericPet'],
+    )
+    assert not hasattr(marshaling_method, '__source__')
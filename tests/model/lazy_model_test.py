@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+import datetime
+from copy import deepcopy
+
+import mock
+import pytest
+from six.moves.cPickle import dumps
+from six.moves.cPickle import loads
+
+from bravado_core.exception import SwaggerMappingError
+from bravado_core.formatter import DEFAULT_FORMATS
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.model import _to_pickleable_representation
+from bravado_core.model import LazyModel
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import _get_validating_unmarshaling_method
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture
+def lazy_swagger_dict(minimal_swagger_dict):
+    minimal_swagger_dict['definitions'] = {
+        'Owner': {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string'},
+                'birthday': {'type': 'string', 'format': 'date'},
+            },
+        },
+        'Pet': {
+            'type': 'object',
+            'required': ['name'],
+            'properties': {
+                'id': {'type': 'integer'},
+                'name': {'type': 'string'},
+                'born': {'type': 'string', 'format': 'date-time'},
+                'owner': {'$ref': '#/definitions/Owner'},
+                'friends': {'type': 'array', 'items': {'$ref': '#/definitions/Owner'}},
+            },
+        },
+    }
+    return minimal_swagger_dict
+
+
+@pytest.fixture(params=['partial', 'codegen'])
+def lazy_spec(request, lazy_swagger_dict):
+    return Spec.from_dict(
+        lazy_swagger_dict,
+        config={
+            'lazy_models': True,
+            'unmarshal_backend': request.param,
+            'marshal_backend': request.param,
+        },
+    )
+
+
+@pytest.fixture
+def pet_spec(lazy_spec):
+    return lazy_spec.spec_dict['definitions']['Pet']
+
+
+@pytest.fixture
+def pet_value():
+    return {
+        'id': 1,
+        'name': 'Lassie',
+        'born': '2020-01-02T03:04:05+00:00',
+        'owner': {'name': 'Joe', 'birthday': '1990-05-06'},
+        'friends': [{'name': 'Jane'}],
+        'color': 'brown',
+    }
+
+
+def test_model_types_are_lazy(lazy_spec):
+    assert LazyModel in lazy_spec.definitions['Pet'].__mro__
+    assert _to_pickleable_representation('Pet', lazy_spec.definitions['Pet'])['bases'] == (LazyModel,)
+
+
+def test_model_types_are_not_lazy_by_default(cat_type):
+    # NOTE: issubclass is not used as models generated by different Spec objects are considered equivalent
+    assert LazyModel not in cat_type.__mro__
+
+
+def test_properties_are_unmarshaled_on_first_access(lazy_spec, pet_spec, pet_value):
+    born = datetime.datetime(2020, 1, 2, 3, 4, 5)
+    mock_parse = mock.Mock(return_value=born)
+    date_time_format = DEFAULT_FORMATS['date-time']._replace(to_python=mock_parse)
+    with mock.patch.dict(DEFAULT_FORMATS, {'date-time': date_time_format}):
+        pet = unmarshal_schema_object(lazy_spec, pet_spec, pet_value)
+        assert mock_parse.call_count == 0
+
+        assert pet.name == 'Lassie'
+        assert mock_parse.call_count == 0
+
+        assert pet.born is born
+        assert pet['born'] is born
+        assert mock_parse.call_count == 1
+
+
+def test_nested_models_are_lazy(lazy_spec, pet_spec, pet_value):
+    pet = unmarshal_schema_object(lazy_spec, pet_spec, pet_value)
+
+    owner = pet.owner
+    assert isinstance(owner, lazy_spec.definitions['Owner'])
+    assert owner is pet.owner
+    assert owner.birthday == datetime.date(1990, 5, 6)
+    assert pet.friends == [lazy_spec.definitions['Owner'](name='Jane')]
+
+
+def test_lazy_model_mapping_interface(lazy_spec, pet_spec, pet_value):
+    pet = unmarshal_schema_object(lazy_spec, pet_spec, pet_value)
+
+    assert set(pet) == {'id', 'name', 'born', 'owner', 'friends', 'color'}
+    assert 'born' in pet and 'color' in pet and 'foo' not in pet
+    assert pet._additional_props == {'color'}
+    assert dir(pet) == sorted(pet_value)
+    assert pet.color == 'brown'
+
+    pet.born = None
+    assert pet.born is None
+    del pet.owner
+    assert pet.owner is None
+    del pet['color']
+    assert 'color' not in pet
+    with pytest.raises(AttributeError):
+        pet.color
+    with pytest.raises(KeyError):
+        pet['foo']
+
+
+def test_lazy_model_missing_properties(lazy_spec, pet_spec):
+    pet = unmarshal_schema_object(lazy_spec, pet_spec, {'name': 'Lassie'})
+    assert pet.born is None
+    assert pet._as_dict() == {'id': None, 'name': 'Lassie', 'born': None, 'owner': None, 'friends': None}
+
+    lazy_spec.config['include_missing_properties'] = False
+    pet = unmarshal_schema_object(lazy_spec, pet_spec, {'name': 'Lassie'})
+    assert list(pet) == ['name']
+
+
+def test_lazy_model_equality_repr_and_deepcopy(lazy_spec, pet_spec, pet_value):
+    pet = unmarshal_schema_object(lazy_spec, pet_spec, pet_value)
+    other_pet = unmarshal_schema_object(lazy_spec, pet_spec, pet_value)
+    pet_copy = deepcopy(pet)
+
+    assert pet == other_pet == pet_copy
+    assert pet_copy.owner is not pet.owner
+    assert pet != unmarshal_schema_object(lazy_spec, pet_spec, dict(pet_value, name='Snoopy'))
+    assert "born=datetime.datetime(2020, 1, 2, 3, 4, 5" in repr(pet)
+
+
+def test_lazy_model_as_dict(lazy_spec, pet_spec, pet_value):
+    pet = unmarshal_schema_object(lazy_spec, pet_spec, pet_value)
+
+    pet_dict = pet._as_dict()
+
+    assert pet_dict['owner'] == {'name': 'Joe', 'birthday': datetime.date(1990, 5, 6)}
+    assert pet_dict['born'].year == 2020
+    assert pet._as_dict(additional_properties=False, recursive=False)['owner'] is pet.owner
+
+
+def test_lazy_model_marshal(lazy_spec, pet_spec, pet_value):
+    pet = unmarshal_schema_object(lazy_spec, pet_spec, pet_value)
+    pet.name  # partially unmarshaled instances are marshaled as well
+
+    assert marshal_schema_object(lazy_spec, pet_spec, pet) == pet_value
+
+
+def test_lazy_model_construction(lazy_spec):
+    pet_type = lazy_spec.definitions['Pet']
+    pet = pet_type(name='Lassie', born=datetime.datetime(2020, 1, 2))
+
+    assert pet.born == datetime.datetime(2020, 1, 2)
+    assert pet == pet_type._from_dict({'name': 'Lassie', 'born': datetime.datetime(2020, 1, 2)})
+
+
+def test_invalid_values_are_raised_on_access(lazy_spec, pet_spec, pet_value):
+    pet = unmarshal_schema_object(lazy_spec, pet_spec, dict(pet_value, owner='Joe'))
+    assert pet.name == 'Lassie'
+    with pytest.raises(SwaggerMappingError):
+        pet.owner
+
+
+def test_invalid_models_are_rejected(lazy_spec, pet_spec):
+    with pytest.raises(SwaggerMappingError):
+        unmarshal_schema_object(lazy_spec, pet_spec, 'Lassie')
+
+
+def test_validate_while_unmarshaling_is_eager(lazy_spec, pet_spec, pet_value):
+    validating_unmarshaling_method = _get_validating_unmarshaling_method(lazy_spec, pet_spec)
+
+    pet = validating_unmarshaling_method(pet_value)
+
+    assert pet._LazyModel__pending is None
+    assert pet.born.year == 2020
+
+
+def test_lazy_model_types_are_pickleable(lazy_spec, pet_spec, pet_value):
+    unpickled_spec = loads(dumps(lazy_spec))
+    pet = unmarshal_schema_object(unpickled_spec, unpickled_spec.spec_dict['definitions']['Pet'], pet_value)
+
+    assert LazyModel in type(pet).__mro__
+    assert pet.owner.birthday == datetime.date(1990, 5, 6)
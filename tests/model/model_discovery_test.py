@@ -37,11 +37,13 @@ def test_model_discovery_flow_with_ref_dereference(wrap__run_post_processing, mi
     )
     model_discovery(swagger_spec=spec)
 
-    # _run_post_processing is called 3 times
+    # _run_post_processing is called 2 times
     # 1. post processing on initial specs
     # 2. post processing on on bravado_core.spec_flattening.flattened_spec
-    # 3. post processing to rebuild definitions to remove possible references in the model specs
-    assert wrap__run_post_processing.call_count == 3
+    # Definitions are then rebuilt, without a temporary Spec, to remove possible references in the model specs
+    assert wrap__run_post_processing.call_count == 2
+    assert spec.definitions['model']._swagger_spec is spec
+    assert spec.definitions['model']._model_spec is spec.deref_flattened_spec['definitions']['model']
 
 
 @pytest.mark.parametrize(
@@ -64,3 +66,21 @@ def test_model_discovery_for_models_with_not_string_title_x_model(minimal_swagge
     # https://raw.githubusercontent.com/kubernetes/kubernetes/release-1.15/api/openapi-spec/swagger.json#/definitions/io.k8s.apiextensions-apiserver.pkg.apis.apiextensions.v1beta1.JSONSchemaProps
     spec = Spec.from_dict(spec_dict=dict(minimal_swagger_dict, definitions={'Model': model_dict}))
     assert set(spec.definitions) == {'Model'}
+
+
+def test_model_discovery_for_long_chains_of_references(minimal_swagger_dict):
+    # Discovery used to be recursive and failed with RecursionError on long chains of $refs
+    chain_length = 2000
+    definitions = {
+        'Node{0:05d}'.format(index): {
+            'type': 'object',
+            'properties': {'next': {'$ref': '#/definitions/Node{0:05d}'.format(index + 1)}},
+        }
+        for index in range(chain_length)
+    }
+    definitions['Node{0:05d}'.format(chain_length)] = {'type': 'object'}
+    spec = Spec.from_dict(
+        spec_dict=dict(minimal_swagger_dict, definitions=definitions),
+        config={'validate_swagger_spec': False},
+    )
+    assert set(spec.definitions) == set(definitions)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import sys
+from copy import deepcopy
+
+import pytest
+from six.moves.cPickle import dumps
+from six.moves.cPickle import loads
+
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.model import _from_pickleable_representation
+from bravado_core.model import _to_pickleable_representation
+from bravado_core.model import Model
+from bravado_core.model import SlottedModel
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture
+def slotted_spec(minimal_swagger_dict, definitions_spec):
+    minimal_swagger_dict['definitions'] = definitions_spec
+    return Spec.from_dict(minimal_swagger_dict, config={'slotted_models': True})
+
+
+@pytest.fixture
+def slotted_cat_type(slotted_spec):
+    return slotted_spec.definitions['Cat']
+
+
+def test_model_types_are_slotted(slotted_spec, slotted_cat_type):
+    assert SlottedModel in slotted_cat_type.__mro__
+    assert set(slotted_cat_type._property_slots) == {'id', 'category', 'name', 'photoUrls', 'tags', 'neutered'}
+    assert not hasattr(slotted_cat_type(), '__dict__')
+
+
+def test_model_types_are_not_slotted_by_default(cat_type):
+    # NOTE: issubclass is not used as models generated by different Spec objects are considered equivalent
+    assert SlottedModel not in cat_type.__mro__
+
+
+def test_slotted_model_instances_are_smaller(cat_type, slotted_cat_type, cat_kwargs):
+    cat = cat_type(**cat_kwargs)
+    slotted_cat = slotted_cat_type(**cat_kwargs)
+    assert sys.getsizeof(slotted_cat) < sys.getsizeof(cat) + sys.getsizeof(cat._Model__dict)
+
+
+def test_slotted_model_mapping_interface(slotted_cat_type, cat_kwargs):
+    slotted_cat_type._model_spec['additionalProperties'] = True
+    cat = slotted_cat_type(foo='bar', **cat_kwargs)
+
+    assert cat.name == cat['name'] == 'Oskar'
+    assert cat.foo == cat['foo'] == 'bar'
+    assert set(cat) == set(cat_kwargs).union({'foo'})
+    assert cat._additional_props == {'foo'}
+    assert 'name' in cat and 'foo' in cat and 'bar' not in cat
+    assert dir(cat) == sorted(set(cat_kwargs).union({'foo'}))
+    assert cat._as_dict() == dict(cat_kwargs, foo='bar')
+    assert cat._as_dict(additional_properties=False) == cat_kwargs
+
+    cat.name = 'Felix'
+    cat['baz'] = 1
+    assert cat['name'] == 'Felix'
+    assert cat._additional_props == {'foo', 'baz'}
+
+    del cat.name
+    del cat['baz']
+    assert cat.name is None
+    assert 'baz' not in cat
+    with pytest.raises(AttributeError):
+        cat.baz
+    with pytest.raises(AttributeError):
+        del cat.baz
+    with pytest.raises(KeyError):
+        cat['baz']
+
+
+def test_slotted_model_unset_properties(slotted_spec, slotted_cat_type):
+    slotted_spec.config['include_missing_properties'] = False
+    cat = slotted_cat_type(name='Oskar')
+    assert list(cat) == ['name']
+    assert 'id' not in cat
+    with pytest.raises(AttributeError):
+        cat.id
+    cat.id = 1
+    assert cat._as_dict() == {'name': 'Oskar', 'id': 1}
+
+
+def test_slotted_model_rejects_additional_properties(slotted_cat_type, cat_kwargs):
+    slotted_cat_type._model_spec['additionalProperties'] = False
+    with pytest.raises(AttributeError):
+        slotted_cat_type(foo='bar', **cat_kwargs)
+
+
+def test_slotted_model_equality_repr_and_deepcopy(cat_type, slotted_cat_type, cat_kwargs):
+    cat = slotted_cat_type(**cat_kwargs)
+    cat_copy = deepcopy(cat)
+    assert cat_copy == cat
+    assert cat_copy is not cat and cat_copy.tags is not cat.tags
+    assert repr(cat) == repr(cat_type(**cat_kwargs))
+    assert cat != slotted_cat_type(**dict(cat_kwargs, name='Felix'))
+
+
+@pytest.mark.parametrize('backend', ['partial', 'codegen'])
+def test_slotted_model_unmarshal_and_marshal(slotted_spec, backend):
+    slotted_spec.config['unmarshal_backend'] = backend
+    slotted_spec.config['marshal_backend'] = backend
+    pet_spec = slotted_spec.spec_dict['definitions']['Pet']
+    pet_value = {
+        'id': 1,
+        'name': 'Lassie',
+        'photoUrls': [],
+        'category': {'id': 2, 'name': 'Dog'},
+        'tags': [{'id': 3, 'name': 'good'}],
+        'color': 'brown',
+    }
+
+    pet = unmarshal_schema_object(slotted_spec, pet_spec, pet_value)
+
+    assert SlottedModel in type(pet).__mro__
+    assert pet.name == 'Lassie'
+    assert pet.category == {'id': 2, 'name': 'Dog'}
+    assert pet._additional_props == {'color'}
+    assert marshal_schema_object(slotted_spec, pet_spec, pet) == pet_value
+
+
+def test_slotted_model_types_are_pickleable(slotted_spec, slotted_cat_type, cat_kwargs):
+    pickleable_representation = _to_pickleable_representation('Cat', slotted_cat_type)
+    assert pickleable_representation['bases'] == (SlottedModel,)
+    reconstructed_cat_type = _from_pickleable_representation(pickleable_representation)
+    assert list(reconstructed_cat_type._property_slots) == list(slotted_cat_type._property_slots)
+
+    unpickled_spec = loads(dumps(slotted_spec))
+    cat = unpickled_spec.definitions['Cat'](**cat_kwargs)
+    assert cat._as_dict() == cat_kwargs
+
+
+def test_slotted_and_not_slotted_model_types_are_equivalent(cat_type, slotted_cat_type, cat_kwargs):
+    assert issubclass(SlottedModel, Model)
+    assert isinstance(slotted_cat_type(**cat_kwargs), cat_type)
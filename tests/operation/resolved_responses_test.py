@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from bravado_core.operation import Operation
+from bravado_core.operation import ResolvedResponse
+from bravado_core.spec import Spec
+
+
+def test_resolved_responses_by_status_code(minimal_swagger_dict):
+    minimal_swagger_dict['responses'] = {
+        'NotFound': {'description': 'Not found'},
+    }
+    minimal_swagger_dict['definitions'] = {
+        'Pet': {'type': 'object'},
+    }
+    op_spec = {
+        'responses': {
+            '200': {
+                'description': 'A pet',
+                'schema': {'$ref': '#/definitions/Pet'},
+                'headers': {'X-Rate-Limit': {'type': 'integer'}},
+            },
+            '404': {'$ref': '#/responses/NotFound'},
+            'default': {'description': 'Error'},
+            'x-vendor-extension': 'not a response',
+        },
+    }
+    minimal_swagger_spec = Spec.from_dict(minimal_swagger_dict)
+    op = Operation(minimal_swagger_spec, '/foo', 'get', op_spec)
+
+    assert op.resolved_responses == {
+        200: ResolvedResponse(
+            response_spec=op_spec['responses']['200'],
+            schema=minimal_swagger_spec.spec_dict['definitions']['Pet'],
+            headers={'X-Rate-Limit': {'type': 'integer'}},
+        ),
+        '200': op.resolved_responses[200],
+        404: ResolvedResponse(
+            response_spec={'description': 'Not found'},
+            schema=None,
+            headers={},
+        ),
+        '404': op.resolved_responses[404],
+        'default': ResolvedResponse(
+            response_spec={'description': 'Error'},
+            schema=None,
+            headers={},
+        ),
+    }
+
+
+def test_resolved_responses_without_responses(minimal_swagger_dict):
+    minimal_swagger_spec = Spec.from_dict(minimal_swagger_dict)
+    op = Operation(minimal_swagger_spec, '/foo', 'get', {})
+    assert op.resolved_responses == {}
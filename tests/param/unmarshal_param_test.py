@@ -255,6 +255,14 @@ def test_validate_requests(petstore_dict):
     assert_validate_call_count(1, {'validate_requests': True}, petstore_dict)
 
 
+def test_validate_requests_while_unmarshaling(petstore_dict):
+    with patch('bravado_core.param.validate_and_unmarshal_schema_object') as m_validate_and_unmarshal:
+        assert_validate_call_count(
+            0, {'validate_requests': True, 'validate_while_unmarshaling': True}, petstore_dict,
+        )
+        assert m_validate_and_unmarshal.call_count == 1
+
+
 def test_ref(minimal_swagger_dict, array_param_spec):
     ref_spec = {'$ref': '#/refs/ArrayParam'}
     minimal_swagger_dict['refs'] = {
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import mock
+import pytest
+
+from bravado_core.prefetch import build_prefetching_handlers
+from bravado_core.prefetch import prefetch_documents
+from bravado_core.prefetch import referenced_urls
+from bravado_core.spec import Spec
+from tests.conftest import get_url
+
+
+def test_referenced_urls():
+    document = {
+        'a': {'$ref': '#/definitions/a'},
+        'b': [{'$ref': 'b.json#/definitions/b'}, {'$ref': 'b.json'}],
+        'c': {'properties': {'$ref': {'$ref': '../c.yaml#/c'}}},
+        'd': {'$ref': 'http://host/d.json'},
+        'e': {'$ref': 'spec.json#/definitions/e'},
+    }
+    assert referenced_urls(document, 'file:///dir/spec.json') == {
+        'file:///dir/b.json',
+        'file:///c.yaml',
+        'http://host/d.json',
+    }
+
+
+@pytest.fixture
+def documents():
+    return {
+        'file:///spec.json': {'a': {'$ref': 'a.json#/a'}, 'b': {'$ref': 'b.json'}},
+        'file:///a.json': {'a': {'$ref': 'c.json#/c'}, 'b': {'$ref': 'b.json'}},
+        'file:///b.json': {'b': {'type': 'string'}},
+        'file:///c.json': {'c': {'$ref': 'spec.json#/a'}},
+    }
+
+
+@pytest.fixture
+def mock_handler(documents):
+    return mock.Mock(side_effect=lambda url: documents[url])
+
+
+def test_prefetch_documents(documents, mock_handler):
+    prefetched_documents = prefetch_documents(
+        documents['file:///spec.json'], 'file:///spec.json', {'file': mock_handler},
+    )
+    assert prefetched_documents == {
+        url: document
+        for url, document in documents.items()
+        if url != 'file:///spec.json'
+    }
+    # Each document is loaded once
+    assert sorted(call[0][0] for call in mock_handler.call_args_list) == [
+        'file:///a.json', 'file:///b.json', 'file:///c.json',
+    ]
+
+
+def test_prefetch_documents_skips_unloadable_documents(documents, mock_handler):
+    del documents['file:///c.json']
+    prefetched_documents = prefetch_documents(
+        documents['file:///spec.json'], 'file:///spec.json', {'file': mock_handler},
+    )
+    assert set(prefetched_documents) == {'file:///a.json', 'file:///b.json'}
+
+
+def test_prefetch_documents_ignores_unknown_schemes(mock_handler):
+    spec_dict = {'a': {'$ref': 'http://host/a.json'}}
+    assert prefetch_documents(spec_dict, 'file:///spec.json', {'file': mock_handler}) == {}
+    assert not mock_handler.called
+
+
+def test_build_prefetching_handlers(documents, mock_handler):
+    handlers = build_prefetching_handlers(documents['file:///spec.json'], 'file:///spec.json', {'file': mock_handler})
+    mock_handler.reset_mock()
+
+    assert handlers['file']('file:///a.json') is documents['file:///a.json']
+    assert not mock_handler.called
+
+    # Documents not prefetched are loaded by the original handler
+    documents['file:///d.json'] = {}
+    assert handlers['file']('file:///d.json') is documents['file:///d.json']
+    mock_handler.assert_called_once_with('file:///d.json')
+
+
+@pytest.mark.parametrize('validate_swagger_spec', [True, False])
+def test_spec_build_with_prefetch_refs(multi_file_recursive_dict, multi_file_recursive_abspath, validate_swagger_spec):
+    origin_url = get_url(multi_file_recursive_abspath)
+    config = {'validate_swagger_spec': validate_swagger_spec}
+    expected_spec = Spec.from_dict(multi_file_recursive_dict, origin_url=origin_url, config=config)
+
+    prefetched_documents = {}
+
+    def _prefetch_documents(*args, **kwargs):
+        prefetched_documents.update(prefetch_documents(*args, **kwargs))
+        return prefetched_documents
+
+    with mock.patch('bravado_core.prefetch.prefetch_documents', side_effect=_prefetch_documents):
+        spec = Spec.from_dict(
+            multi_file_recursive_dict,
+            origin_url=origin_url,
+            config=dict(config, prefetch_refs=True),
+        )
+    assert set(spec.definitions) == set(expected_spec.definitions)
+    assert spec.flattened_spec == expected_spec.flattened_spec
+
+    # The resolver has been served the prefetched documents
+    referenced_files = {url for url in expected_spec.resolver.store if url.startswith('file://') and url != origin_url}
+    assert referenced_files
+    for url in referenced_files:
+        assert spec.resolver.store[url] is prefetched_documents[url]
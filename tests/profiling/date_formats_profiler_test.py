@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture(
+    params=[True, False],
+    ids=['dateutil', 'native'],
+)
+def date_time_array_schema_and_spec(request, minimal_swagger_dict):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'use_dateutil_for_dates': request.param})
+    return {'type': 'array', 'items': {'type': 'string', 'format': 'date-time'}}, swagger_spec
+
+
+@pytest.fixture
+def date_times(number_of_objects):
+    return [
+        '2018-05-{0:02d}T12:{1:02d}:56.{2:06d}{3}'.format(index % 28 + 1, index % 60, index, '+02:00' if index % 2 else 'Z')
+        for index in range(number_of_objects)
+    ]
+
+
+def test_unmarshal_date_times(benchmark, date_time_array_schema_and_spec, date_times):
+    date_time_array_schema, swagger_spec = date_time_array_schema_and_spec
+    benchmark(unmarshal_schema_object, swagger_spec, date_time_array_schema, date_times)
+
+
+def test_marshal_date_times(benchmark, date_time_array_schema_and_spec, date_times):
+    date_time_array_schema, swagger_spec = date_time_array_schema_and_spec
+    values = [value.replace(tzinfo=None) for value in unmarshal_schema_object(swagger_spec, date_time_array_schema, date_times)]
+    to_wire = swagger_spec.get_format('date-time').to_wire
+    benchmark(lambda: [to_wire(value) for value in values])
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import copy
+
+import pytest
+
+from bravado_core.dereference import dereference_refs
+from bravado_core.spec import Spec
+from tests.profiling.model_discovery_profiler_test import _generate_spec_dict
+
+
+@pytest.mark.parametrize('number_of_definitions', [100, 1000])
+def test_build_with_internally_dereference_refs(benchmark, number_of_definitions):
+    spec_dict = _generate_spec_dict(number_of_definitions)
+
+    def build():
+        Spec.from_dict(
+            copy.deepcopy(spec_dict),
+            config={'validate_swagger_spec': False, 'internally_dereference_refs': True},
+        ).deref_flattened_spec
+
+    benchmark(build)
+
+
+def test_dereference_refs(benchmark, petstore_spec):
+    benchmark(dereference_refs, petstore_spec.flattened_spec)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.spec import _identity
+from bravado_core.spec import _resolve_ref
+from bravado_core.spec import Spec
+
+
+@pytest.fixture
+def ref_dicts(petstore_spec):
+    # $refs of the response bodies of the petstore operations, with the scope attached while building the spec
+    return [
+        response_spec['schema']
+        for path_spec in petstore_spec.spec_dict['paths'].values()
+        for operation_spec in path_spec.values()
+        for response_spec in operation_spec.get('responses', {}).values()
+        if '$ref' in response_spec.get('schema', {})
+    ]
+
+
+def _deref_all(deref, ref_dicts):
+    for _ in range(100):
+        for ref_dict in ref_dicts:
+            deref(ref_dict)
+
+
+def test_deref(benchmark, petstore_spec, ref_dicts):
+    benchmark(_deref_all, petstore_spec.deref, ref_dicts)
+
+
+def test_deref_without_cache(benchmark, petstore_spec, ref_dicts):
+    benchmark(_deref_all, lambda ref_dict: _resolve_ref(petstore_spec, ref_dict), ref_dicts)
+
+
+def test_deref_internally_dereferenced_spec(benchmark, petstore_spec, ref_dicts):
+    # With internally_dereference_refs enabled Spec.deref is _identity
+    assert Spec.from_dict(
+        petstore_spec.client_spec_dict, origin_url=petstore_spec.origin_url,
+        config={'internally_dereference_refs': True},
+    ).deref is _identity
+    benchmark(_deref_all, _identity, ref_dicts)
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.response import get_response_spec
+
+
+@pytest.fixture
+def status_codes_and_operations(petstore_spec):
+    return [
+        (int(status_code), op)
+        for resource in petstore_spec.resources.values()
+        for op in resource.operations.values()
+        for status_code in op.op_spec.get('responses', {})
+        if status_code.isdigit()
+    ]
+
+
+def _get_response_specs(status_codes_and_operations):
+    for _ in range(100):
+        for status_code, op in status_codes_and_operations:
+            get_response_spec(status_code, op)
+
+
+def test_get_response_spec(benchmark, status_codes_and_operations):
+    benchmark(_get_response_specs, status_codes_and_operations)
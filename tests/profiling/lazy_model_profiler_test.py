@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture(
+    params=[False, True],
+    ids=['eager-models', 'lazy-models'],
+)
+def lazy_models(request):
+    return request.param
+
+
+@pytest.fixture
+def pet_array_schema_and_spec(petstore_spec, lazy_models):
+    swagger_spec = Spec.from_dict(
+        spec_dict=petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config=dict(petstore_spec.config, lazy_models=lazy_models, unmarshal_backend='codegen'),
+    )
+    return {'type': 'array', 'items': swagger_spec.spec_dict['definitions']['Pet']}, swagger_spec
+
+
+def test_unmarshal_models_and_access_one_property(benchmark, pet_array_schema_and_spec, large_pets):
+    pet_array_schema, swagger_spec = pet_array_schema_and_spec
+    unmarshal_schema_object(swagger_spec, pet_array_schema, large_pets[:1])  # build the unmarshaling methods
+    benchmark(lambda: [pet.name for pet in unmarshal_schema_object(swagger_spec, pet_array_schema, large_pets)])
+
+
+def test_unmarshal_models_and_access_all_properties(benchmark, pet_array_schema_and_spec, large_pets):
+    pet_array_schema, swagger_spec = pet_array_schema_and_spec
+    unmarshal_schema_object(swagger_spec, pet_array_schema, large_pets[:1])  # build the unmarshaling methods
+    benchmark(lambda: [pet._as_dict() for pet in unmarshal_schema_object(swagger_spec, pet_array_schema, large_pets)])
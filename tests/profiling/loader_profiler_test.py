@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+import pytest
+import yaml
+
+from bravado_core.loader import load_yaml
+from tests.profiling.model_discovery_profiler_test import _generate_spec_dict
+
+
+@pytest.fixture(scope='module')
+def yaml_spec_content():
+    return yaml.dump(_generate_spec_dict(1000)).encode('utf-8')
+
+
+def test_yaml_safe_load(benchmark, yaml_spec_content):
+    benchmark(yaml.safe_load, yaml_spec_content)
+
+
+def test_load_yaml(benchmark, yaml_spec_content):
+    benchmark(load_yaml, yaml_spec_content)
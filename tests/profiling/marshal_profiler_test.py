@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import simplejson as json
+
+from bravado_core.marshal import iter_marshal_array_to_bytes
 from bravado_core.marshal import marshal_schema_object
 
 
@@ -26,3 +29,51 @@ def test_large_objects(benchmark, perf_petstore_spec, findByStatusReponseSchema,
         findByStatusReponseSchema,
         large_pets_models,
     )
+
+
+def test_large_objects_codegen_backend(benchmark, perf_petstore_spec, findByStatusReponseSchema, large_pets):
+    perf_petstore_spec.config['marshal_backend'] = 'codegen'
+    large_pets_models = [
+        perf_petstore_spec.definitions['Pet']._unmarshal(value)
+        for value in large_pets
+    ]
+    benchmark(
+        marshal_schema_object,
+        perf_petstore_spec,
+        findByStatusReponseSchema,
+        large_pets_models,
+    )
+
+
+def _marshal_and_dump(swagger_spec, schema, value):
+    return json.dumps(marshal_schema_object(swagger_spec, schema, value)).encode('utf-8')
+
+
+def _join_iter_marshal_array_to_bytes(swagger_spec, schema, value):
+    return b''.join(iter_marshal_array_to_bytes(swagger_spec, schema, value))
+
+
+def test_large_objects_to_bytes(benchmark, perf_petstore_spec, findByStatusReponseSchema, large_pets):
+    large_pets_models = [
+        perf_petstore_spec.definitions['Pet']._unmarshal(value)
+        for value in large_pets
+    ]
+    benchmark(
+        _marshal_and_dump,
+        perf_petstore_spec,
+        findByStatusReponseSchema,
+        large_pets_models,
+    )
+
+
+def test_large_objects_iter_to_bytes(benchmark, perf_petstore_spec, findByStatusReponseSchema, large_pets):
+    large_pets_models = [
+        perf_petstore_spec.definitions['Pet']._unmarshal(value)
+        for value in large_pets
+    ]
+    benchmark(
+        _join_iter_marshal_array_to_bytes,
+        perf_petstore_spec,
+        findByStatusReponseSchema,
+        large_pets_models,
+    )
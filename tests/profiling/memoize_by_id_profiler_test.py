@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.marshal import _get_marshaling_method
+from bravado_core.unmarshal import _get_unmarshaling_method
+from bravado_core.util import memoize_by_id
+
+
+@memoize_by_id
+def _memoized_function(a, b, c=None):
+    return a, b, c
+
+
+@pytest.mark.parametrize(
+    'args, kwargs',
+    [
+        ((1, 2, 3), {}),
+        ((1, 2), {}),
+        ((), {'a': 1, 'b': 2}),
+        ((), {'a': 1, 'b': 2, 'c': 3}),
+    ],
+    ids=['all-positional', 'positional-with-default', 'keywords-with-default', 'all-keywords'],
+)
+def test_cache_hit(benchmark, args, kwargs):
+    _memoized_function(*args, **kwargs)
+    benchmark(_memoized_function, *args, **kwargs)
+
+
+def test_unmarshaling_method_cache_hit(benchmark, perf_petstore_spec, findByStatusReponseSchema):
+    _get_unmarshaling_method(swagger_spec=perf_petstore_spec, object_schema=findByStatusReponseSchema)
+    benchmark(_get_unmarshaling_method, swagger_spec=perf_petstore_spec, object_schema=findByStatusReponseSchema)
+
+
+def test_marshaling_method_cache_hit(benchmark, perf_petstore_spec, findByStatusReponseSchema):
+    _get_marshaling_method(swagger_spec=perf_petstore_spec, object_schema=findByStatusReponseSchema)
+    benchmark(_get_marshaling_method, swagger_spec=perf_petstore_spec, object_schema=findByStatusReponseSchema)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import copy
+
+import pytest
+
+from bravado_core.spec import Spec
+
+
+def _generate_spec_dict(number_of_definitions):
+    definitions = {}
+    paths = {}
+    for index in range(number_of_definitions):
+        definitions['Model{0}'.format(index)] = {
+            'type': 'object',
+            'required': ['id'],
+            'properties': {
+                'id': {'type': 'integer', 'format': 'int64'},
+                'name': {'type': 'string'},
+                'tags': {'type': 'array', 'items': {'type': 'string'}},
+                'inline': {
+                    'type': 'object',
+                    'title': 'Inline{0}'.format(index),
+                    'properties': {'value': {'type': 'number'}},
+                },
+                'other': {'$ref': '#/definitions/Model{0}'.format(index % 10)},
+            },
+        }
+        paths['/model{0}/{{id}}'.format(index)] = {
+            'get': {
+                'operationId': 'get{0}'.format(index),
+                'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'type': 'integer'}],
+                'responses': {
+                    '200': {'description': 'ok', 'schema': {'$ref': '#/definitions/Model{0}'.format(index)}},
+                },
+            },
+        }
+    return {
+        'swagger': '2.0',
+        'info': {'title': 'generated', 'version': '1.0'},
+        'paths': paths,
+        'definitions': definitions,
+    }
+
+
+def _from_dict(spec_dict):
+    # Building a Spec modifies the spec dict (x-scope and x-model annotations are added)
+    return Spec.from_dict(copy.deepcopy(spec_dict), config={'validate_swagger_spec': False})
+
+
+@pytest.mark.parametrize('number_of_definitions', [100, 1000, 5000])
+def test_model_discovery(benchmark, number_of_definitions):
+    spec_dict = _generate_spec_dict(number_of_definitions)
+    benchmark(_from_dict, spec_dict)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+from bravado_core.validate import validate_schema_object
+
+
+@pytest.fixture
+def double_array_schema():
+    return {'type': 'array', 'items': {'type': 'number', 'format': 'double', 'minimum': 0, 'maximum': 100}}
+
+
+@pytest.fixture
+def doubles():
+    return [index % 100 + 0.5 for index in range(100000)]
+
+
+@pytest.fixture(
+    params=[None, 'list', 'array'],
+    ids=['item-by-item', 'list', 'array'],
+)
+def numeric_array_spec(request, minimal_swagger_dict):
+    return Spec.from_dict(minimal_swagger_dict, config={'numeric_array_type': request.param})
+
+
+def test_unmarshal_numeric_array(benchmark, numeric_array_spec, double_array_schema, doubles):
+    benchmark(unmarshal_schema_object, numeric_array_spec, double_array_schema, doubles)
+
+
+def test_marshal_numeric_array(benchmark, numeric_array_spec, double_array_schema, doubles):
+    values = unmarshal_schema_object(numeric_array_spec, double_array_schema, doubles)
+    benchmark(marshal_schema_object, numeric_array_spec, double_array_schema, values)
+
+
+@pytest.mark.parametrize('validate_backend', ['jsonschema', 'compiled'])
+def test_validate_numeric_array(benchmark, minimal_swagger_dict, double_array_schema, doubles, validate_backend):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'validate_backend': validate_backend})
+    benchmark(validate_schema_object, swagger_spec, double_array_schema, doubles)
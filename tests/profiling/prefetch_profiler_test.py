@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import copy
+import json
+import os
+import time
+
+import mock
+import pytest
+
+from bravado_core.spec import Spec
+from tests.conftest import get_url
+
+
+NUMBER_OF_FILES = 200
+
+
+def _generate_spec_dict(base_url):
+    return {
+        'swagger': '2.0',
+        'info': {'title': 'multi-file', 'version': '1.0'},
+        'paths': {},
+        'definitions': {
+            'Model{0}'.format(index): {'$ref': '{0}model{1}.json#/Model{1}'.format(base_url, index)}
+            for index in range(NUMBER_OF_FILES)
+        },
+    }
+
+
+def _generate_document(index):
+    return {
+        'Model{0}'.format(index): {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'integer'},
+                # Documents reference other documents, not only the spec
+                'other': {'$ref': 'model{0}.json#/Model{0}'.format(index // 2)} if index else {'type': 'string'},
+            },
+        },
+    }
+
+
+@pytest.fixture
+def multi_file_spec_abspath(tmpdir):
+    for index in range(NUMBER_OF_FILES):
+        with open(os.path.join(str(tmpdir), 'model{0}.json'.format(index)), 'w') as f:
+            json.dump(_generate_document(index), f)
+    spec_abspath = os.path.join(str(tmpdir), 'swagger.json')
+    with open(spec_abspath, 'w') as f:
+        json.dump(_generate_spec_dict(''), f)
+    return spec_abspath
+
+
+def _from_dict(spec_dict, origin_url, http_client, prefetch_refs):
+    return Spec.from_dict(
+        copy.deepcopy(spec_dict),
+        origin_url=origin_url,
+        http_client=http_client,
+        config={'prefetch_refs': prefetch_refs},
+    )
+
+
+@pytest.mark.parametrize('prefetch_refs', [True, False], ids=['prefetch', 'no-prefetch'])
+def test_multi_file_spec_build(benchmark, multi_file_spec_abspath, prefetch_refs):
+    with open(multi_file_spec_abspath) as f:
+        spec_dict = json.load(f)
+    benchmark(_from_dict, spec_dict, get_url(multi_file_spec_abspath), None, prefetch_refs)
+
+
+@pytest.fixture
+def slow_http_client():
+    # Simulates the network latency of downloading the referenced documents
+    def request(request_params):
+        time.sleep(0.002)
+        index = int(request_params['url'].rsplit('model', 1)[1].split('.')[0])
+        response = mock.Mock(headers={'content-type': 'application/json'})
+        response.json.return_value = _generate_document(index)
+        return mock.Mock(**{'result.return_value': response})
+
+    return mock.Mock(request=request)
+
+
+@pytest.mark.parametrize('prefetch_refs', [True, False], ids=['prefetch', 'no-prefetch'])
+def test_remote_multi_file_spec_build(benchmark, slow_http_client, prefetch_refs):
+    spec_dict = _generate_spec_dict('http://localhost/')
+    benchmark(_from_dict, spec_dict, 'http://localhost/swagger.json', slow_http_client, prefetch_refs)
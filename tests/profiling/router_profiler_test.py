@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.spec import Spec
+
+
+NUMBER_OF_RESOURCES = 1000
+
+
+@pytest.fixture(scope='module')
+def many_paths_spec():
+    paths = {}
+    for index in range(NUMBER_OF_RESOURCES):
+        paths['/resource{0}'.format(index)] = {
+            'get': {'operationId': 'list{0}'.format(index), 'responses': {'200': {'description': 'ok'}}},
+        }
+        paths['/resource{0}/{{id}}'.format(index)] = {
+            'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'type': 'string'}],
+            'get': {'operationId': 'get{0}'.format(index), 'responses': {'200': {'description': 'ok'}}},
+        }
+        paths['/resource{0}/{{id}}/items/{{itemId}}'.format(index)] = {
+            'parameters': [
+                {'name': 'id', 'in': 'path', 'required': True, 'type': 'string'},
+                {'name': 'itemId', 'in': 'path', 'required': True, 'type': 'string'},
+            ],
+            'get': {'operationId': 'getItem{0}'.format(index), 'responses': {'200': {'description': 'ok'}}},
+        }
+    spec_dict = {
+        'swagger': '2.0',
+        'info': {'title': 'many paths', 'version': '1.0'},
+        'basePath': '/v1',
+        'paths': paths,
+    }
+    return Spec.from_dict(spec_dict, config={'validate_swagger_spec': False})
+
+
+@pytest.mark.parametrize(
+    'path',
+    [
+        '/v1/resource999',
+        '/v1/resource999/42',
+        '/v1/resource999/42/items/1',
+    ],
+)
+def test_match_request(benchmark, many_paths_spec, path):
+    assert benchmark(many_paths_spec.match_request, 'GET', path) is not None
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import tracemalloc
+
+import pytest
+
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+
+
+@pytest.fixture(
+    params=[False, True],
+    ids=['dict-models', 'slotted-models'],
+)
+def slotted_models(request):
+    return request.param
+
+
+@pytest.fixture
+def pet_array_schema_and_spec(petstore_spec, slotted_models):
+    swagger_spec = Spec.from_dict(
+        spec_dict=petstore_spec.spec_dict,
+        origin_url=petstore_spec.origin_url,
+        config=dict(petstore_spec.config, slotted_models=slotted_models, unmarshal_backend='codegen'),
+    )
+    return {'type': 'array', 'items': swagger_spec.spec_dict['definitions']['Pet']}, swagger_spec
+
+
+def _allocated_memory(function, *args):
+    tracemalloc.start()
+    try:
+        value = function(*args)
+        allocated_memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del value
+    return allocated_memory
+
+
+def test_unmarshal_models_memory(benchmark, pet_array_schema_and_spec, large_pets):
+    pet_array_schema, swagger_spec = pet_array_schema_and_spec
+    unmarshal_schema_object(swagger_spec, pet_array_schema, large_pets[:1])  # build the unmarshaling methods
+    # Memory retained by the unmarshaled objects, compare it across dict and slotted models
+    benchmark.extra_info['allocated_bytes'] = _allocated_memory(
+        unmarshal_schema_object, swagger_spec, pet_array_schema, large_pets,
+    )
+    benchmark(unmarshal_schema_object, swagger_spec, pet_array_schema, large_pets)
+
+
+def test_access_model_properties(benchmark, pet_array_schema_and_spec, large_pets):
+    pet_array_schema, swagger_spec = pet_array_schema_and_spec
+    pets = unmarshal_schema_object(swagger_spec, pet_array_schema, large_pets)
+    benchmark(lambda: [(pet.id, pet.name, pet.category) for pet in pets])
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+import copy
+
+import pytest
+
+from bravado_core.spec import Spec
+from tests.conftest import get_url
+
+
+def _from_dict(spec_dict, origin_url, config, cache_dir=None):
+    # Building a Spec modifies the spec dict (x-scope annotations are added)
+    return Spec.from_dict(copy.deepcopy(spec_dict), origin_url=origin_url, config=config, cache_dir=cache_dir)
+
+
+@pytest.mark.parametrize('internally_dereference_refs', [True, False], ids=['full-deref', 'with-refs'])
+@pytest.mark.parametrize('use_cache_dir', [True, False], ids=['cache-dir', 'no-cache-dir'])
+def test_multi_file_spec_build(
+    benchmark, tmpdir, multi_file_recursive_dict, multi_file_recursive_abspath,
+    internally_dereference_refs, use_cache_dir,
+):
+    cache_dir = str(tmpdir) if use_cache_dir else None
+    config = {'internally_dereference_refs': internally_dereference_refs}
+    origin_url = get_url(multi_file_recursive_abspath)
+    # Warm up the snapshot cache, if enabled
+    _from_dict(multi_file_recursive_dict, origin_url, config, cache_dir)
+    benchmark(_from_dict, multi_file_recursive_dict, origin_url, config, cache_dir)
@@ -18,3 +18,13 @@ def test_large_objects(benchmark, perf_petstore_spec, findByStatusReponseSchema,
         findByStatusReponseSchema,
         large_pets,
     )
+
+
+def test_large_objects_codegen_backend(benchmark, perf_petstore_spec, findByStatusReponseSchema, large_pets):
+    perf_petstore_spec.config['unmarshal_backend'] = 'codegen'
+    benchmark(
+        unmarshal_schema_object,
+        perf_petstore_spec,
+        findByStatusReponseSchema,
+        large_pets,
+    )
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.request import IncomingRequest
+from bravado_core.request import unmarshal_request
+
+
+class FakeRequest(IncomingRequest):
+
+    def __init__(self, path=None, query=None, form=None, headers=None, files=None, body=None):
+        self.path = path or {}
+        self.query = query or {}
+        self.form = form or {}
+        self.headers = headers or {}
+        self.files = files or {}
+        self.body = body
+
+    def json(self, **kwargs):
+        return self.body
+
+
+@pytest.mark.parametrize('validate_requests', [True, False])
+def test_unmarshal_request_with_form_parameters(benchmark, petstore_spec, validate_requests):
+    petstore_spec.config['validate_requests'] = validate_requests
+    op = petstore_spec.resources['pet'].operations['updatePetWithForm']
+    request = FakeRequest(path={'petId': '42'}, form={'name': 'Lassie', 'status': 'available'})
+    benchmark(unmarshal_request, request, op)
+
+
+@pytest.mark.parametrize('validate_requests', [True, False])
+def test_unmarshal_request_with_query_parameters(benchmark, petstore_spec, validate_requests):
+    petstore_spec.config['validate_requests'] = validate_requests
+    op = petstore_spec.resources['pet'].operations['findPetsByStatus']
+    request = FakeRequest(query={'status': 'available,pending'})
+    benchmark(unmarshal_request, request, op)
@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
+import pytest
+import simplejson as json
+
 from bravado_core.response import IncomingResponse
+from bravado_core.response import iter_unmarshal_response
 from bravado_core.response import unmarshal_response
 
 
@@ -13,6 +17,7 @@ class FakeJsonResponse(IncomingResponse):
         headers=None,
     ):
         self.text = text
+        self.raw_bytes = json.dumps(text).encode('utf-8')
         self.status_code = 200
         self.reason = 'OK'
         self.headers = {'content-type': 'application/json'}
@@ -31,3 +36,26 @@ def test_small_objects(benchmark, petstore_op, small_pets):
 def test_large_objects(benchmark, petstore_op, large_pets):
     resp = FakeJsonResponse(large_pets)
     benchmark(unmarshal_response, resp, petstore_op)
+
+
+def test_large_objects_validating_while_unmarshaling(benchmark, petstore_op, large_pets):
+    petstore_op.swagger_spec.config['validate_while_unmarshaling'] = True
+    resp = FakeJsonResponse(large_pets)
+    benchmark(unmarshal_response, resp, petstore_op)
+
+
+@pytest.mark.parametrize('validate_backend', ['jsonschema', 'compiled'])
+def test_large_objects_validate_backend(benchmark, petstore_op, large_pets, validate_backend):
+    petstore_op.swagger_spec.config['validate_backend'] = validate_backend
+    resp = FakeJsonResponse(large_pets)
+    benchmark(unmarshal_response, resp, petstore_op)
+
+
+def _consume_iter_unmarshal_response(response, op):
+    for _ in iter_unmarshal_response(response, op):
+        pass
+
+
+def test_large_objects_iter_unmarshal_response(benchmark, petstore_op, large_pets):
+    resp = FakeJsonResponse(large_pets)
+    benchmark(_consume_iter_unmarshal_response, resp, petstore_op)
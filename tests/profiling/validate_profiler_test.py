@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.validate import validate_schema_object
+
+
+@pytest.mark.parametrize('validate_backend', ['jsonschema', 'compiled'])
+def test_small_objects(benchmark, perf_petstore_spec, findByStatusReponseSchema, small_pets, validate_backend):
+    perf_petstore_spec.config['validate_backend'] = validate_backend
+    benchmark(
+        validate_schema_object,
+        perf_petstore_spec,
+        findByStatusReponseSchema,
+        small_pets,
+    )
+
+
+@pytest.mark.parametrize('validate_backend', ['jsonschema', 'compiled'])
+def test_large_objects(benchmark, perf_petstore_spec, findByStatusReponseSchema, large_pets, validate_backend):
+    perf_petstore_spec.config['validate_backend'] = validate_backend
+    benchmark(
+        validate_schema_object,
+        perf_petstore_spec,
+        findByStatusReponseSchema,
+        large_pets,
+    )
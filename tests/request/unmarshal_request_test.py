@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 import pytest
+from jsonschema import ValidationError
 from mock import Mock
+from mock import patch
+from mock import PropertyMock
 
 from bravado_core.exception import SwaggerMappingError
 from bravado_core.operation import Operation
+from bravado_core.param import build_param_unmarshaler
 from bravado_core.request import IncomingRequest
 from bravado_core.request import unmarshal_request
 
@@ -53,3 +57,30 @@ def test_request_with_no_json_and_optional_body_parameter(petstore_spec):
         op_spec=op.op_spec,
     )
     assert unmarshal_request(request, op) == {'body': None}
+
+
+def test_request_attributes_are_retrieved_once(petstore_spec):
+    request = Mock(spec=IncomingRequest, path={'petId': '1234'})
+    form = type(request).form = PropertyMock(return_value={'name': 'Lassie', 'status': 'available'})
+    op = petstore_spec.resources['pet'].operations['updatePetWithForm']
+    assert unmarshal_request(request, op) == {'petId': 1234, 'name': 'Lassie', 'status': 'available'}
+    assert form.call_count == 1
+
+
+def test_request_unmarshaler_is_built_once(getPetByIdPetstoreOperation):
+    request = Mock(spec=IncomingRequest, path={'petId': '1234'}, headers={'api-key': 'key1'})
+    with patch('bravado_core.request.build_param_unmarshaler', wraps=build_param_unmarshaler) as m_build:
+        unmarshal_request(request, getPetByIdPetstoreOperation)
+        unmarshal_request(request, getPetByIdPetstoreOperation)
+    assert m_build.call_count == len(getPetByIdPetstoreOperation.params)
+
+
+def test_request_unmarshaler_follows_config_changes(getPetByIdPetstoreOperation):
+    request = Mock(spec=IncomingRequest, path={'petId': 'not an integer'}, headers={'api-key': 'key1'})
+    getPetByIdPetstoreOperation.swagger_spec.config['validate_requests'] = False
+    with pytest.raises(ValueError):
+        unmarshal_request(request, getPetByIdPetstoreOperation)
+
+    getPetByIdPetstoreOperation.swagger_spec.config['validate_requests'] = True
+    with pytest.raises(ValidationError):
+        unmarshal_request(request, getPetByIdPetstoreOperation)
@@ -3,7 +3,9 @@ import pytest
 
 from bravado_core.exception import MatchingResponseNotFound
 from bravado_core.operation import Operation
+from bravado_core.response import get_resolved_response
 from bravado_core.response import get_response_spec
+from bravado_core.spec import Spec
 
 
 @pytest.fixture
@@ -36,3 +38,24 @@ def test_raise_error_when_no_default_and_no_status_code_match(empty_swagger_spec
     with pytest.raises(MatchingResponseNotFound) as excinfo:
         get_response_spec(404, op)
     assert 'not found' in str(excinfo.value)
+
+
+def test_return_spec_for_status_code_as_string(empty_swagger_spec, op_spec):
+    op = Operation(empty_swagger_spec, '/pet/{petId}', 'get', op_spec)
+    assert op_spec['responses']['200'] == get_response_spec('200', op)
+
+
+def test_return_resolved_spec_for_referenced_response(minimal_swagger_dict, op_spec):
+    minimal_swagger_dict['responses'] = {'NotFound': {'description': 'Pet not found'}}
+    op_spec['responses']['404'] = {'$ref': '#/responses/NotFound'}
+    op = Operation(Spec.from_dict(minimal_swagger_dict), '/pet/{petId}', 'get', op_spec)
+    assert {'description': 'Pet not found'} == get_response_spec(404, op)
+
+
+def test_get_resolved_response(empty_swagger_spec, op_spec):
+    op_spec['responses']['200']['schema'] = {'type': 'string'}
+    op = Operation(empty_swagger_spec, '/pet/{petId}', 'get', op_spec)
+    resolved_response = get_resolved_response(200, op)
+    assert resolved_response.response_spec is get_response_spec(200, op)
+    assert resolved_response.schema == {'type': 'string'}
+    assert get_resolved_response(404, op).schema is None
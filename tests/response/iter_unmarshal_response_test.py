@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import msgpack
+import pytest
+import simplejson as json
+from jsonschema import ValidationError
+from mock import Mock
+
+from bravado_core.content_type import APP_JSON
+from bravado_core.content_type import APP_MSGPACK
+from bravado_core.exception import SwaggerMappingError
+from bravado_core.response import IncomingResponse
+from bravado_core.response import iter_unmarshal_response
+
+
+def _response(raw_bytes, content_type=APP_JSON, status_code=200):
+    return Mock(
+        spec=IncomingResponse,
+        status_code=status_code,
+        headers={'content-type': content_type},
+        raw_bytes=raw_bytes,
+        json=Mock(side_effect=lambda: json.loads(raw_bytes)),
+    )
+
+
+@pytest.fixture
+def find_by_status_op(petstore_spec):
+    return petstore_spec.resources['pet'].findPetsByStatus
+
+
+@pytest.fixture
+def pets():
+    return [
+        {'id': 1, 'name': 'Fido', 'photoUrls': [], 'category': {'id': 200, 'name': 'friendly'}},
+        {'id': 2, 'name': 'Rex', 'photoUrls': ['wagtail.png']},
+    ]
+
+
+@pytest.mark.parametrize(
+    'content_type, dumps',
+    [
+        (APP_JSON, lambda value: json.dumps(value).encode('utf-8')),
+        (APP_JSON, lambda value: json.dumps(value, indent=4).encode('utf-8')),
+        (APP_MSGPACK, lambda value: msgpack.dumps(value, use_bin_type=True)),
+    ],
+)
+def test_iter_unmarshal_response(find_by_status_op, pets, content_type, dumps):
+    Pet = find_by_status_op.swagger_spec.definitions['Pet']
+    Category = find_by_status_op.swagger_spec.definitions['Category']
+
+    result = list(iter_unmarshal_response(_response(dumps(pets), content_type), find_by_status_op))
+
+    assert [pet.name for pet in result] == ['Fido', 'Rex']
+    assert all(isinstance(pet, Pet) for pet in result)
+    assert isinstance(result[0].category, Category)
+
+
+@pytest.mark.parametrize('raw_bytes', [b'[]', b' [ ] ', b'null'])
+def test_iter_unmarshal_response_with_no_items(find_by_status_op, raw_bytes):
+    find_by_status_op.swagger_spec.config['validate_responses'] = False
+    assert list(iter_unmarshal_response(_response(raw_bytes), find_by_status_op)) == []
+
+
+def test_iter_unmarshal_response_decodes_items_lazily(find_by_status_op, pets):
+    raw_bytes = json.dumps(pets).encode('utf-8')[:-1] + b', not-json]'
+    items = iter_unmarshal_response(_response(raw_bytes), find_by_status_op)
+
+    assert next(items).name == 'Fido'
+    assert next(items).name == 'Rex'
+    with pytest.raises(ValueError):
+        next(items)
+
+
+@pytest.mark.parametrize('raw_bytes', [b'[{"id": 1} {"id": 2}]', b'[] []'])
+def test_iter_unmarshal_response_raises_on_invalid_json(find_by_status_op, raw_bytes):
+    find_by_status_op.swagger_spec.config['validate_responses'] = False
+    with pytest.raises(ValueError):
+        list(iter_unmarshal_response(_response(raw_bytes), find_by_status_op))
+
+
+@pytest.mark.parametrize('validate_while_unmarshaling', [True, False])
+def test_iter_unmarshal_response_validates_items(find_by_status_op, pets, validate_while_unmarshaling):
+    find_by_status_op.swagger_spec.config['validate_while_unmarshaling'] = validate_while_unmarshaling
+    pets[1]['id'] = 'not-an-integer'
+    items = iter_unmarshal_response(_response(json.dumps(pets).encode('utf-8')), find_by_status_op)
+
+    assert next(items).name == 'Fido'
+    with pytest.raises(ValidationError):
+        next(items)
+
+
+def test_iter_unmarshal_response_raises_if_response_is_not_an_array(petstore_spec):
+    op = petstore_spec.resources['pet'].getPetById
+    with pytest.raises(SwaggerMappingError):
+        iter_unmarshal_response(_response(b'{}'), op)
+
+
+def test_iter_unmarshal_response_raises_on_unsupported_content_type(find_by_status_op):
+    with pytest.raises(SwaggerMappingError):
+        iter_unmarshal_response(_response(b'[]', content_type='text/plain'), find_by_status_op)
@@ -7,6 +7,7 @@ from mock import patch
 
 from bravado_core.content_type import APP_JSON
 from bravado_core.content_type import APP_MSGPACK
+from bravado_core.operation import ResolvedResponse
 from bravado_core.response import IncomingResponse
 from bravado_core.response import unmarshal_response
 from bravado_core.spec import Spec
@@ -22,14 +23,18 @@ def response_spec():
     }
 
 
+def _resolved_response(response_spec):
+    return ResolvedResponse(response_spec, response_spec.get('schema'), {})
+
+
 def test_no_content(empty_swagger_spec):
     response_spec = {
         'description': "I don't have a 'schema' key so I return nothing",
     }
     response = Mock(spec=IncomingResponse, status_code=200)
 
-    with patch('bravado_core.response.get_response_spec') as m:
-        m.return_value = response_spec
+    with patch('bravado_core.response.get_resolved_response') as m:
+        m.return_value = _resolved_response(response_spec)
         op = Mock(swagger_spec=empty_swagger_spec)
         result = unmarshal_response(response, op)
         assert result is None
@@ -43,8 +48,8 @@ def test_json_content(empty_swagger_spec, response_spec):
         json=Mock(return_value='Monday'),
     )
 
-    with patch('bravado_core.response.get_response_spec') as m:
-        m.return_value = response_spec
+    with patch('bravado_core.response.get_resolved_response') as m:
+        m.return_value = _resolved_response(response_spec)
         op = Mock(swagger_spec=empty_swagger_spec)
         assert 'Monday' == unmarshal_response(response, op)
 
@@ -59,8 +64,8 @@ def test_msgpack_content(empty_swagger_spec, response_spec):
     )
 
     with patch(
-        'bravado_core.response.get_response_spec',
-        return_value=response_spec,
+        'bravado_core.response.get_resolved_response',
+        return_value=_resolved_response(response_spec),
     ):
         op = Mock(swagger_spec=empty_swagger_spec)
         assert message == unmarshal_response(response, op)
@@ -74,8 +79,8 @@ def test_text_content(empty_swagger_spec, response_spec):
         text='Monday',
     )
 
-    with patch('bravado_core.response.get_response_spec') as m:
-        m.return_value = response_spec
+    with patch('bravado_core.response.get_resolved_response') as m:
+        m.return_value = _resolved_response(response_spec)
         op = Mock(swagger_spec=empty_swagger_spec)
         assert 'Monday' == unmarshal_response(response, op)
 
@@ -90,8 +95,8 @@ def test_skips_validation(empty_swagger_spec, response_spec):
     )
 
     with patch('bravado_core.response.validate_schema_object') as val_schem:
-        with patch('bravado_core.response.get_response_spec') as get_resp:
-            get_resp.return_value = response_spec
+        with patch('bravado_core.response.get_resolved_response') as get_resp:
+            get_resp.return_value = _resolved_response(response_spec)
             op = Mock(swagger_spec=empty_swagger_spec)
             unmarshal_response(response, op)
             assert val_schem.call_count == 0
@@ -107,13 +112,32 @@ def test_performs_validation(empty_swagger_spec, response_spec):
     )
 
     with patch('bravado_core.response.validate_schema_object') as val_schem:
-        with patch('bravado_core.response.get_response_spec') as get_resp:
-            get_resp.return_value = response_spec
+        with patch('bravado_core.response.get_resolved_response') as get_resp:
+            get_resp.return_value = _resolved_response(response_spec)
             op = Mock(swagger_spec=empty_swagger_spec)
             unmarshal_response(response, op)
             assert val_schem.call_count == 1
 
 
+def test_performs_validation_while_unmarshaling(empty_swagger_spec, response_spec):
+    empty_swagger_spec.config['validate_responses'] = True
+    empty_swagger_spec.config['validate_while_unmarshaling'] = True
+    response = Mock(
+        spec=IncomingResponse,
+        status_code=200,
+        headers={'content-type': APP_JSON},
+        json=Mock(return_value=1),
+    )
+
+    with patch('bravado_core.response.validate_schema_object') as val_schem:
+        with patch('bravado_core.response.get_resolved_response') as get_resp:
+            get_resp.return_value = _resolved_response(response_spec)
+            op = Mock(swagger_spec=empty_swagger_spec)
+            with pytest.raises(ValidationError):
+                unmarshal_response(response, op)
+            assert val_schem.call_count == 0
+
+
 def test_unmarshal_model_polymorphic_specs(polymorphic_spec):
     pet_list_dicts = [
         {
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import pytest
 from jsonschema.exceptions import ValidationError
+from mock import call
 from mock import Mock
+from mock import patch
 
 from bravado_core.operation import Operation
 from bravado_core.response import OutgoingResponse
@@ -63,3 +65,18 @@ def test_invalid_headers(op):
         validate_response_headers(op, response_spec, response)
     assert "is not of type 'integer'" in str(excinfo.value)
     assert "X-Foo" in str(excinfo.value)
+
+
+def test_headers_of_operation_responses_are_not_dereferenced_again(minimal_swagger_spec):
+    op = Operation(
+        minimal_swagger_spec,
+        '/foo',
+        'get',
+        op_spec={'responses': {'200': {'description': 'OK', 'headers': {'X-Foo': {'type': 'integer'}}}}},
+    )
+    response_spec = op.resolved_responses[200].response_spec
+    response = Mock(spec=OutgoingResponse, headers={'X-Foo': 'bar'})
+    with patch.object(minimal_swagger_spec, 'deref', wraps=minimal_swagger_spec.deref) as mock_deref:
+        with pytest.raises(ValidationError):
+            validate_response_headers(op, response_spec, response)
+    assert call(response_spec['headers']) not in mock_deref.call_args_list
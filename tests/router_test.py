@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import pytest
+from mock import Mock
+
+from bravado_core.operation import Operation
+from bravado_core.router import Router
+
+
+def _operation(http_method, operation_id):
+    return Mock(spec=Operation, http_method=http_method, operation_id=operation_id)
+
+
+@pytest.fixture
+def router():
+    router = Router()
+    for http_method, path_template, operation_id in (
+        ('get', '/pet', 'listPets'),
+        ('get', '/pet/findByStatus', 'findPetsByStatus'),
+        ('get', '/pet/{petId}', 'getPetById'),
+        ('post', '/pet/{petId}', 'updatePetWithForm'),
+        ('get', '/pet/{id}/photos/{photoId}', 'getPhoto'),
+        ('get', '/files/{name}.{extension}', 'getFile'),
+        ('get', '/files/{name}', 'getFileWithoutExtension'),
+    ):
+        router.add_operation(path_template, _operation(http_method, operation_id))
+    return router
+
+
+@pytest.mark.parametrize(
+    'http_method, path, expected_operation_id, expected_path_params',
+    [
+        ('GET', '/pet', 'listPets', {}),
+        ('GET', '/pet/findByStatus', 'findPetsByStatus', {}),
+        ('get', '/pet/42', 'getPetById', {'petId': '42'}),
+        ('POST', '/pet/findByStatus', 'updatePetWithForm', {'petId': 'findByStatus'}),
+        ('GET', '/pet/a%20name', 'getPetById', {'petId': 'a name'}),
+        ('GET', '/pet/42/photos/1', 'getPhoto', {'id': '42', 'photoId': '1'}),
+        ('GET', '/files/report.tar.gz', 'getFile', {'name': 'report', 'extension': 'tar.gz'}),
+        ('GET', '/files/report', 'getFileWithoutExtension', {'name': 'report'}),
+    ],
+)
+def test_match(router, http_method, path, expected_operation_id, expected_path_params):
+    operation, path_params = router.match(http_method, path)
+    assert operation.operation_id == expected_operation_id
+    assert path_params == expected_path_params
+
+
+@pytest.mark.parametrize(
+    'http_method, path',
+    [
+        ('DELETE', '/pet/42'),
+        ('GET', '/pet/'),
+        ('GET', '/pet/42/photos'),
+        ('GET', '/pet/42/photos/1/unknown'),
+        ('GET', '/unknown'),
+    ],
+)
+def test_no_match(router, http_method, path):
+    assert router.match(http_method, path) is None
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import copy
+import gc
+import weakref
+
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import _get_unmarshaling_method
+from bravado_core.unmarshal import unmarshal_schema_object
+from bravado_core.util import CacheInfo
+
+
+def test_memoized_values_are_cached_per_spec(minimal_swagger_dict):
+    schema = {'type': 'array', 'items': {'type': 'string'}}
+    spec_1 = Spec.from_dict(minimal_swagger_dict)
+    spec_2 = Spec.from_dict(minimal_swagger_dict)
+
+    unmarshal_schema_object(spec_1, schema, ['a'])
+
+    assert _get_unmarshaling_method.cache_info(spec_1).currsize == 2  # array and items schemas
+    assert _get_unmarshaling_method.cache_info(spec_2).currsize == 0
+    assert len(_get_unmarshaling_method.cache) == 0
+
+
+def test_memoized_values_are_released_with_the_spec(minimal_swagger_dict):
+    spec = Spec.from_dict(minimal_swagger_dict)
+    unmarshal_schema_object(spec, {'type': 'array', 'items': {'type': 'string'}}, ['a'])
+
+    spec_reference = weakref.ref(spec)
+    del spec
+    gc.collect()
+    assert spec_reference() is None
+
+
+def test_memoize_cache_maxsize(minimal_swagger_dict):
+    spec = Spec.from_dict(minimal_swagger_dict, config={'memoize_cache_maxsize': 1})
+    unmarshal_schema_object(spec, {'type': 'array', 'items': {'type': 'string'}}, ['a'])
+    assert _get_unmarshaling_method.cache_info(spec).currsize == 1
+
+
+def test_deepcopy_does_not_copy_memoized_values(minimal_swagger_dict):
+    spec = Spec.from_dict(minimal_swagger_dict, config={'memoize_cache_maxsize': 10})
+    unmarshal_schema_object(spec, {'type': 'string'}, 'a')
+
+    copied_spec = copy.deepcopy(spec)
+
+    assert copied_spec.compiled == {}
+    assert copied_spec.compiled.maxsize == 10
+
+
+def test_compiled_info(minimal_swagger_dict):
+    spec = Spec.from_dict(minimal_swagger_dict)
+    schema = {'type': 'string'}
+    unmarshal_schema_object(spec, schema, 'a')
+    unmarshal_schema_object(spec, schema, 'a')
+
+    info = spec.compiled.info()
+    assert info['bravado_core.unmarshal._get_unmarshaling_method'] == CacheInfo(hits=1, misses=1, maxsize=None, currsize=1)
+    assert info['bravado_core._decorators.handle_null_value'].currsize == 1
+
+
+def test_compiled_clear(minimal_swagger_dict):
+    spec = Spec.from_dict(minimal_swagger_dict)
+    schema = {'type': 'string', 'format': 'date'}
+    unmarshal_schema_object(spec, schema, '2019-01-01')
+    unmarshaling_method = _get_unmarshaling_method(spec, schema)
+
+    spec.compiled.clear()
+
+    assert spec.compiled.info() == {}
+    assert _get_unmarshaling_method(spec, schema) is not unmarshaling_method
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import mock
 import pytest
 from jsonschema.exceptions import RefResolutionError
 
@@ -31,3 +32,40 @@ def test_ref_not_found(minimal_swagger_dict):
     with pytest.raises(RefResolutionError) as excinfo:
         swagger_spec.deref({'$ref': '#/definitions/Foo'})
     assert 'Unresolvable JSON pointer' in str(excinfo.value)
+
+
+@pytest.fixture
+def foo_swagger_spec(minimal_swagger_dict):
+    minimal_swagger_dict['definitions']['Foo'] = {'type': 'object'}
+    return Spec.from_dict(minimal_swagger_dict)
+
+
+def test_ref_resolution_is_cached(foo_swagger_spec):
+    ref_dict = {'$ref': '#/definitions/Foo', 'x-scope': ['']}
+    with mock.patch.object(foo_swagger_spec.resolver, 'resolve', wraps=foo_swagger_spec.resolver.resolve) as mock_resolve:
+        targets = [foo_swagger_spec.deref(ref_dict) for _ in range(3)]
+
+    assert all(target is foo_swagger_spec.spec_dict['definitions']['Foo'] for target in targets)
+    assert mock_resolve.call_count == 1
+    assert foo_swagger_spec.compiled.info()['bravado_core.spec._resolve_ref'].hits == 2
+
+
+def test_ref_resolution_cache_depends_on_the_ref_scope(foo_swagger_spec):
+    ref_dict = {'$ref': '#/definitions/Foo'}
+    with mock.patch.object(foo_swagger_spec.resolver, 'resolve', wraps=foo_swagger_spec.resolver.resolve) as mock_resolve:
+        foo_swagger_spec.deref(ref_dict)
+        # Attaching a scope to the $ref could change the resolution result
+        ref_dict['x-scope'] = ['']
+        foo_swagger_spec.deref(ref_dict)
+        foo_swagger_spec.deref(ref_dict)
+
+    assert mock_resolve.call_count == 2
+
+
+def test_ref_resolution_cache_is_released_with_compiled(foo_swagger_spec):
+    ref_dict = {'$ref': '#/definitions/Foo'}
+    foo_swagger_spec.deref(ref_dict)
+    foo_swagger_spec.compiled.clear()
+    with mock.patch.object(foo_swagger_spec.resolver, 'resolve', wraps=foo_swagger_spec.resolver.resolve) as mock_resolve:
+        foo_swagger_spec.deref(ref_dict)
+    assert mock_resolve.call_count == 1
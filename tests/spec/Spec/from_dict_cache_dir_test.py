@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+
+import mock
+import pytest
+import simplejson as json
+
+from bravado_core.formatter import SwaggerFormat
+from bravado_core.spec import Spec
+from tests.conftest import get_url
+
+
+@pytest.fixture
+def multi_file_spec_abspath(tmpdir, multi_file_recursive_abspath):
+    spec_dir = str(tmpdir.join('spec'))
+    shutil.copytree(os.path.dirname(multi_file_recursive_abspath), spec_dir)
+    return os.path.join(spec_dir, 'swagger.json')
+
+
+@pytest.fixture
+def cache_dir(tmpdir):
+    return str(tmpdir.join('cache'))
+
+
+def _from_dict(spec_abspath, cache_dir, **kwargs):
+    with open(spec_abspath) as f:
+        spec_dict = json.load(f)
+    return Spec.from_dict(spec_dict, origin_url=get_url(spec_abspath), cache_dir=cache_dir, **kwargs)
+
+
+def test_spec_is_built_once(multi_file_spec_abspath, cache_dir):
+    spec = _from_dict(multi_file_spec_abspath, cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    with mock.patch.object(Spec, 'build', autospec=True) as mock_build:
+        cached_spec = _from_dict(multi_file_spec_abspath, cache_dir)
+
+    assert not mock_build.called
+    assert cached_spec.is_equal(spec)
+
+
+def test_spec_is_loaded_with_the_provided_http_client(multi_file_spec_abspath, cache_dir):
+    _from_dict(multi_file_spec_abspath, cache_dir, http_client=mock.sentinel.http_client)
+    cached_spec = _from_dict(multi_file_spec_abspath, cache_dir, http_client=mock.sentinel.other_http_client)
+    assert cached_spec.http_client is mock.sentinel.other_http_client
+
+
+def test_config_changes_the_snapshot(multi_file_spec_abspath, cache_dir):
+    _from_dict(multi_file_spec_abspath, cache_dir)
+    spec = _from_dict(multi_file_spec_abspath, cache_dir, config={'use_models': False})
+    assert spec.config['use_models'] is False
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_snapshot_is_invalidated_if_a_referenced_file_changes(multi_file_spec_abspath, cache_dir):
+    _from_dict(multi_file_spec_abspath, cache_dir)
+
+    aux_abspath = os.path.join(os.path.dirname(multi_file_spec_abspath), 'aux_2.json')
+    with open(aux_abspath) as f:
+        aux_dict = json.load(f)
+    aux_dict['definitions']['new_definition'] = {'type': 'string'}
+    with open(aux_abspath, 'w') as f:
+        json.dump(aux_dict, f)
+
+    with mock.patch.object(Spec, 'build', autospec=True) as mock_build:
+        _from_dict(multi_file_spec_abspath, cache_dir)
+
+    assert mock_build.called
+
+
+def test_corrupted_snapshot_is_ignored(multi_file_spec_abspath, cache_dir):
+    spec = _from_dict(multi_file_spec_abspath, cache_dir)
+    snapshot_path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    with open(snapshot_path, 'wb') as f:
+        f.write(b'not a snapshot')
+
+    assert _from_dict(multi_file_spec_abspath, cache_dir).is_equal(spec)
+
+
+def test_unpickleable_spec_is_not_stored(minimal_swagger_dict, cache_dir):
+    lambda_format = SwaggerFormat(
+        format='lambda',
+        to_wire=lambda value: value,
+        to_python=lambda value: value,
+        validate=lambda value: None,
+        description='not pickleable',
+    )
+    spec = Spec.from_dict(minimal_swagger_dict, config={'formats': [lambda_format]}, cache_dir=cache_dir)
+    assert spec.get_format('lambda') == lambda_format
+    assert os.listdir(cache_dir) == []
+
+
+def test_spec_loaded_from_snapshot_is_warmed_up_if_configured(multi_file_spec_abspath, cache_dir):
+    _from_dict(multi_file_spec_abspath, cache_dir, config={'warm_up': True})
+
+    with mock.patch.object(Spec, 'prebuild', autospec=True) as mock_prebuild:
+        cached_spec = _from_dict(multi_file_spec_abspath, cache_dir, config={'warm_up': True})
+
+    mock_prebuild.assert_called_once_with(cached_spec)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import os
+
+import mock
+import simplejson
+
+from bravado_core.spec import Spec
+from tests.conftest import get_url
+
+
+def _get_path(my_dir, *path_segments):
+    return os.path.join(os.path.dirname(my_dir), 'test-data', '2.0', *path_segments)
+
+
+def test_from_file_yaml(my_dir):
+    spec = Spec.from_file(_get_path(my_dir, 'yaml', 'swagger.yml'))
+    assert spec.origin_url == get_url(_get_path(my_dir, 'yaml', 'swagger.yml'))
+    assert 'Pet' in spec.definitions
+
+
+def test_from_file_multi_file_json(my_dir, multi_file_recursive_dict):
+    path = _get_path(my_dir, 'multi-file-recursive', 'swagger.json')
+    spec = Spec.from_file(path)
+    expected_spec = Spec.from_dict(multi_file_recursive_dict, origin_url=get_url(path))
+    assert set(spec.definitions) == set(expected_spec.definitions)
+    assert spec.flattened_spec == expected_spec.flattened_spec
+
+
+def test_from_url_with_custom_json_loads(my_dir):
+    mock_json_loads = mock.Mock(side_effect=simplejson.loads)
+    spec = Spec.from_url(
+        get_url(_get_path(my_dir, 'multi-file-recursive', 'swagger.json')),
+        config={'json_loads': mock_json_loads},
+    )
+    assert spec.config['json_loads'] is mock_json_loads
+    # Both the spec and the referenced files are parsed by json_loads
+    loaded_contents = [call[0][0] for call in mock_json_loads.call_args_list]
+    assert len(loaded_contents) == 3
+    assert all(isinstance(content, bytes) for content in loaded_contents)
+
+
+def test_from_url_with_http_client(minimal_swagger_dict):
+    mock_http_client = mock.Mock()
+    response = mock_http_client.request.return_value.result.return_value
+    response.headers = {'content-type': 'application/json'}
+    response.raw_bytes = simplejson.dumps(minimal_swagger_dict).encode('utf-8')
+
+    spec = Spec.from_url('http://localhost/swagger.json', http_client=mock_http_client)
+
+    assert spec.origin_url == 'http://localhost/swagger.json'
+    assert spec.http_client is mock_http_client
+    assert spec.spec_dict == minimal_swagger_dict
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from bravado_core.resource import build_resources
+from bravado_core.spec import Spec
+
+
+def test_match_request_with_basepath(petstore_spec, getPetByIdPetstoreOperation):
+    assert petstore_spec.match_request('GET', '/v2/pet/42') == (getPetByIdPetstoreOperation, {'petId': '42'})
+
+
+def test_match_request_with_no_basepath(petstore_dict):
+    del petstore_dict['basePath']
+    petstore_spec = Spec.from_dict(petstore_dict)
+    assert petstore_spec.match_request('GET', '/pet/42') == (
+        petstore_spec.resources['pet'].operations['getPetById'], {'petId': '42'},
+    )
+
+
+@pytest.mark.parametrize('path', ['/pet/42', '/v2/foo/42'])
+def test_match_request_not_found(petstore_spec, path):
+    assert petstore_spec.match_request('GET', path) is None
+
+
+def test_match_request_of_static_path(petstore_spec):
+    assert petstore_spec.match_request('GET', '/v2/pet/findByStatus') == (
+        petstore_spec.resources['pet'].operations['findPetsByStatus'], {},
+    )
+
+
+def test_match_request_of_not_built_spec(petstore_dict):
+    petstore_spec = Spec(petstore_dict)
+    assert petstore_spec.match_request('GET', '/v2/pet/42') is None
+
+
+def test_match_request_builds_the_router_on_demand(petstore_dict):
+    petstore_spec = Spec(petstore_dict)
+    petstore_spec.resources = build_resources(petstore_spec)
+    assert petstore_spec.match_request('GET', '/v2/pet/42') == (
+        petstore_spec.resources['pet'].operations['getPetById'], {'petId': '42'},
+    )
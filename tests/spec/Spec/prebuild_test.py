@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import mock
+import pytest
+
+from bravado_core.marshal import _get_marshaling_method
+from bravado_core.param import unmarshal_param
+from bravado_core.request import _get_request_unmarshaler
+from bravado_core.request import IncomingRequest
+from bravado_core.request import unmarshal_request
+from bravado_core.response import IncomingResponse
+from bravado_core.response import unmarshal_response
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import _get_unmarshaling_method
+from bravado_core.unmarshal import _get_validating_unmarshaling_method
+from bravado_core.validate import _get_validation_closure
+from bravado_core.validate import _get_validator
+from tests.conftest import get_url
+
+
+MEMOIZED_FUNCTIONS = (
+    _get_marshaling_method,
+    _get_request_unmarshaler,
+    _get_unmarshaling_method,
+    _get_validating_unmarshaling_method,
+    _get_validation_closure,
+    _get_validator,
+)
+
+
+def _cache_sizes(swagger_spec):
+    return [memoized_function.cache_info(swagger_spec).currsize for memoized_function in MEMOIZED_FUNCTIONS]
+
+
+@pytest.fixture(
+    params=[
+        {},
+        {'internally_dereference_refs': True},
+        {'validate_backend': 'compiled', 'validate_while_unmarshaling': True},
+    ],
+)
+def petstore_spec(request, petstore_dict, petstore_abspath):
+    return Spec.from_dict(petstore_dict, origin_url=get_url(petstore_abspath), config=request.param)
+
+
+def test_prebuild_builds_lazy_structures(petstore_spec):
+    petstore_spec.prebuild()
+
+    assert petstore_spec._request_to_op_map is not None
+    assert '_security_definitions' in petstore_spec.__dict__
+    for model_type in petstore_spec.definitions.values():
+        assert '_properties' in model_type.__dict__
+        assert '_inherits_from' in model_type.__dict__
+    op = petstore_spec.resources['pet'].operations['getPetById']
+    assert {'operation_id', 'consumes', 'produces', 'security_requirements', 'resolved_responses'}.issubset(op.__dict__)
+
+
+def test_prebuild_builds_the_methods_used_by_requests_and_responses(petstore_spec):
+    petstore_spec.prebuild()
+    cache_sizes = _cache_sizes(petstore_spec)
+
+    op = petstore_spec.resources['pet'].operations['getPetById']
+    request = mock.Mock(spec=IncomingRequest, path={'petId': '42'}, headers={'api-key': 'key1'})
+    assert unmarshal_param(op.params['petId'], request) == 42
+    assert unmarshal_request(request, op)['petId'] == 42
+    response = mock.Mock(
+        spec=IncomingResponse,
+        status_code=200,
+        headers={'content-type': 'application/json'},
+        json=mock.Mock(return_value={'id': 42, 'name': 'Lassie', 'photoUrls': []}),
+    )
+    assert unmarshal_response(response, op).name == 'Lassie'
+
+    assert _cache_sizes(petstore_spec) == cache_sizes
+
+
+def test_prebuild_is_idempotent(petstore_spec):
+    petstore_spec.prebuild()
+    cache_sizes = _cache_sizes(petstore_spec)
+    petstore_spec.prebuild()
+    assert _cache_sizes(petstore_spec) == cache_sizes
+
+
+@pytest.mark.parametrize('freeze', [True, False])
+def test_prebuild_freeze(minimal_swagger_spec, freeze):
+    with mock.patch('bravado_core.spec.gc', autospec=True) as mock_gc:
+        minimal_swagger_spec.prebuild(freeze=freeze)
+    assert mock_gc.freeze.called is freeze
+
+
+def test_prebuild_returns_the_timing_of_each_operation(petstore_spec):
+    timings = petstore_spec.prebuild()
+    assert set(timings) == {
+        op
+        for resource in petstore_spec.resources.values()
+        for op in resource.operations.values()
+    }
+    assert all(timing >= 0 for timing in timings.values())
+
+
+@pytest.mark.parametrize('warm_up', [True, False])
+def test_build_warms_up_the_spec_if_configured(minimal_swagger_dict, warm_up):
+    with mock.patch.object(Spec, 'prebuild', autospec=True) as mock_prebuild:
+        Spec.from_dict(minimal_swagger_dict, config={'warm_up': warm_up})
+    assert mock_prebuild.called is warm_up
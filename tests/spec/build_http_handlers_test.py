@@ -81,3 +81,19 @@ def test_not_yaml_file_name(protocol):
     result = http_handler('%s://test.test/json/test.json' % protocol)
 
     assert result == test_dict
+
+
+@pytest.mark.parametrize('protocol', ['http', 'https'])
+def test_http_handler_with_json_loads(protocol):
+    test_dict = {'hello': 'world'}
+    mock_http_client = mock.Mock()
+    response = mock_http_client.request.return_value.result.return_value
+    response.headers = {'content-type': 'application/json'}
+    response.content = json.dumps(test_dict)
+    mock_json_loads = mock.Mock(return_value=test_dict)
+
+    result = build_http_handlers(mock_http_client, json_loads=mock_json_loads)[protocol]('%s://test.test/test' % protocol)
+
+    assert result == test_dict
+    mock_json_loads.assert_called_once_with(response.content)
+    assert not response.json.called
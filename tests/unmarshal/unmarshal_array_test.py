@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
+import array
 import copy
 import datetime
 
+import mock
 import pytest
 
 from bravado_core.exception import SwaggerMappingError
+from bravado_core.formatter import SwaggerFormat
 from bravado_core.spec import Spec
+from bravado_core.unmarshal import _unmarshal_object_array
 from bravado_core.unmarshal import unmarshal_array
+from bravado_core.unmarshal import unmarshal_schema_object
 
 
 @pytest.fixture
@@ -168,3 +173,166 @@ def test_array_of_models(petstore_dict):
     assert isinstance(fido, Pet)
     assert isinstance(fido.category, Category)
     assert isinstance(fido.tags[0], Tag)
+
+
+@pytest.fixture
+def array_of_owners_dict(minimal_swagger_dict):
+    minimal_swagger_dict['definitions']['Owner'] = {
+        'type': 'object',
+        'required': ['name'],
+        'properties': {
+            'name': {'type': 'string'},
+            'since': {'type': 'string', 'format': 'date'},
+            'pets': {'type': 'integer', 'default': 0},
+        },
+        'additionalProperties': {'type': 'string', 'format': 'date'},
+    }
+    return minimal_swagger_dict
+
+
+@pytest.fixture
+def owner_values():
+    return [
+        {'name': 'Joe', 'since': '2019-05-22', 'pets': 2},
+        {'name': 'Jane', 'birthday': '1990-01-02'},
+        {'since': '2019-05-23', 'name': 'Jim', 'pets': None},
+    ]
+
+
+@pytest.mark.parametrize('use_models', [True, False])
+@pytest.mark.parametrize('include_missing_properties', [True, False])
+def test_array_of_objects_column_by_column(
+    array_of_owners_dict, owner_values, use_models, include_missing_properties,
+):
+    swagger_spec = Spec.from_dict(
+        array_of_owners_dict,
+        config={'use_models': use_models, 'include_missing_properties': include_missing_properties},
+    )
+    owner_schema = swagger_spec.spec_dict['definitions']['Owner']
+    array_of_owners_spec = {'type': 'array', 'items': owner_schema}
+    # Objects unmarshaled one at a time
+    expected_owners = [unmarshal_schema_object(swagger_spec, owner_schema, value) for value in owner_values]
+
+    with mock.patch(
+        'bravado_core.unmarshal._unmarshal_object_array', wraps=_unmarshal_object_array,
+    ) as mock_unmarshal_object_array:
+        owners = unmarshal_array(swagger_spec, array_of_owners_spec, owner_values)
+
+    assert mock_unmarshal_object_array.call_count == 1
+    assert owners == expected_owners
+    assert (owners[0].since if use_models else owners[0]['since']) == datetime.date(2019, 5, 22)
+    assert (owners[1].birthday if use_models else owners[1]['birthday']) == datetime.date(1990, 1, 2)
+
+
+def test_array_of_objects_column_by_column_with_not_dict_items(array_of_owners_dict, owner_values):
+    swagger_spec = Spec.from_dict(array_of_owners_dict)
+    array_of_owners_spec = {
+        'type': 'array',
+        'items': {'x-nullable': True, '$ref': '#/definitions/Owner'},
+    }
+
+    owners = unmarshal_array(swagger_spec, array_of_owners_spec, owner_values + [None])
+
+    assert [owner.name for owner in owners[:-1]] == ['Joe', 'Jane', 'Jim']
+    assert owners[-1] is None
+    with pytest.raises(SwaggerMappingError):
+        unmarshal_array(swagger_spec, array_of_owners_spec, owner_values + ['Jack'])
+
+
+@pytest.mark.parametrize(
+    'config',
+    [
+        {'unmarshal_backend': 'codegen'},
+        {'slotted_models': True},
+        {'lazy_models': True},
+    ],
+)
+def test_array_of_objects_not_column_by_column(array_of_owners_dict, owner_values, config):
+    swagger_spec = Spec.from_dict(array_of_owners_dict, config=config)
+    array_of_owners_spec = {'type': 'array', 'items': swagger_spec.spec_dict['definitions']['Owner']}
+
+    with mock.patch('bravado_core.unmarshal._unmarshal_object_array') as mock_unmarshal_object_array:
+        owners = unmarshal_array(swagger_spec, array_of_owners_spec, owner_values)
+
+    assert mock_unmarshal_object_array.call_count == 0
+    assert [owner.name for owner in owners] == ['Joe', 'Jane', 'Jim']
+
+
+@pytest.mark.parametrize(
+    'items_spec, value, expected',
+    [
+        ({'type': 'number', 'format': 'double'}, [1, 2.5], array.array('d', [1.0, 2.5])),
+        ({'type': 'number', 'format': 'float'}, [1.5], array.array('d', [1.5])),
+        ({'type': 'number'}, [1, 2.5], array.array('d', [1.0, 2.5])),
+        ({'type': 'integer', 'format': 'int64'}, [2 ** 40], array.array('q', [2 ** 40])),
+        ({'type': 'integer', 'format': 'int32'}, [1, -2], array.array('i', [1, -2])),
+        ({'type': 'integer'}, [], array.array('q')),
+        # Arrays that could not be converted at once are unmarshaled item by item
+        ({'type': 'number', 'format': 'double'}, [1, None], [1.0, None]),
+        ({'type': 'integer', 'format': 'int32'}, [2 ** 40], [2 ** 40]),
+    ],
+)
+@pytest.mark.parametrize('unmarshal_backend', ['partial', 'codegen'])
+def test_numeric_array_type(minimal_swagger_dict, items_spec, value, expected, unmarshal_backend):
+    minimal_swagger_dict['definitions']['Metrics'] = {
+        'type': 'object',
+        'properties': {'values': {'type': 'array', 'items': items_spec}},
+    }
+    swagger_spec = Spec.from_dict(
+        minimal_swagger_dict,
+        config={'numeric_array_type': 'array', 'unmarshal_backend': unmarshal_backend},
+    )
+
+    metrics = unmarshal_schema_object(swagger_spec, swagger_spec.spec_dict['definitions']['Metrics'], {'values': value})
+
+    assert type(metrics.values) is type(expected)
+    assert metrics.values == expected
+
+
+@pytest.mark.parametrize(
+    'items_spec, value, expected',
+    [
+        ({'type': 'number', 'format': 'double'}, [1, 2.5], [1.0, 2.5]),
+        ({'type': 'integer', 'format': 'int64'}, [1, 2], [1, 2]),
+        ({'type': 'integer'}, [1, 2.5], [1, 2.5]),
+        ({'type': 'number', 'format': 'double'}, [1, None], [1.0, None]),
+    ],
+)
+def test_numeric_array_type_list(empty_swagger_spec, items_spec, value, expected):
+    empty_swagger_spec.config['numeric_array_type'] = 'list'
+    result = unmarshal_array(empty_swagger_spec, {'type': 'array', 'items': items_spec}, value)
+    assert result == expected
+    assert [type(item) for item in result] == [type(item) for item in expected]
+
+
+def test_numeric_array_type_numpy(empty_swagger_spec):
+    numpy = pytest.importorskip('numpy')
+    empty_swagger_spec.config['numeric_array_type'] = 'numpy'
+
+    result = unmarshal_array(empty_swagger_spec, {'type': 'array', 'items': {'type': 'number'}}, [1, 2.5])
+
+    assert isinstance(result, numpy.ndarray)
+    assert result.dtype == numpy.float64
+    assert result.tolist() == [1.0, 2.5]
+
+
+def test_numeric_array_type_with_user_defined_format(minimal_swagger_dict):
+    double_format = SwaggerFormat(
+        format='double', to_wire=str, to_python=lambda value: value * 2, validate=lambda value: True, description='',
+    )
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'numeric_array_type': 'array', 'formats': [double_format]})
+
+    result = unmarshal_array(swagger_spec, {'type': 'array', 'items': {'type': 'number', 'format': 'double'}}, [1, 2])
+
+    assert result == [2, 4]
+
+
+def test_array_of_unknown_models(array_of_owners_dict, owner_values):
+    swagger_spec = Spec.from_dict(array_of_owners_dict)
+    owner_schema = dict(swagger_spec.spec_dict['definitions']['Owner'], **{'x-model': 'Unknown'})
+    array_of_owners_spec = {'type': 'array', 'items': owner_schema}
+
+    assert unmarshal_array(swagger_spec, array_of_owners_spec, []) == []
+    with pytest.raises(SwaggerMappingError) as excinfo:
+        unmarshal_array(swagger_spec, array_of_owners_spec, owner_values)
+    assert str(excinfo.value) == 'Unknown model Unknown when trying to unmarshal {0}'.format(owner_values[0])
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import pytest
+
+from bravado_core.exception import SwaggerMappingError
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import _get_unmarshaling_method
+from bravado_core.unmarshal import unmarshal_schema_object
+from tests.conftest import get_url
+
+
+@pytest.fixture
+def object_spec():
+    return {
+        'type': 'object',
+        'required': ['id', 'created'],
+        'properties': {
+            'id': {'type': 'integer', 'format': 'int64'},
+            'created': {'type': 'string', 'format': 'date'},
+            'name': {'type': 'string', 'default': 'unnamed'},
+            'nickname': {'type': 'string', 'x-nullable': True},
+            'dates': {'type': 'array', 'items': {'type': 'string', 'format': 'date'}},
+            'labels': {'type': 'array', 'items': {'type': 'string'}},
+            'anything': {},
+        },
+        'additionalProperties': {'type': 'string', 'format': 'date'},
+    }
+
+
+@pytest.fixture(params=['partial', 'codegen'])
+def swagger_spec(request, minimal_swagger_dict):
+    return Spec.from_dict(minimal_swagger_dict, config={'unmarshal_backend': request.param})
+
+
+def test_codegen_generates_a_function(minimal_swagger_dict, object_spec):
+    swagger_spec = Spec.from_dict(minimal_swagger_dict, config={'unmarshal_backend': 'codegen'})
+    unmarshaling_method = _get_unmarshaling_method(swagger_spec=swagger_spec, object_schema=object_spec)
+    assert unmarshaling_method.__name__ == 'unmarshal'
+    assert unmarshaling_method.__source__.startswith('def unmarshal(value):')
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        (
+            {'id': 1, 'created': '2020-01-02'},
+            {
+                'id': 1, 'created': datetime.date(2020, 1, 2), 'name': 'unnamed', 'nickname': None,
+                'dates': None, 'labels': None, 'anything': None,
+            },
+        ),
+        (
+            {
+                'id': 1, 'created': '2020-01-02', 'name': None, 'nickname': None,
+                'dates': ['2020-01-03', None], 'labels': ('a', 'b'), 'anything': {'a': 1},
+                'additional': '2020-01-04',
+            },
+            {
+                'id': 1, 'created': datetime.date(2020, 1, 2), 'name': 'unnamed', 'nickname': None,
+                'dates': [datetime.date(2020, 1, 3), None], 'labels': ['a', 'b'], 'anything': {'a': 1},
+                'additional': datetime.date(2020, 1, 4),
+            },
+        ),
+    ],
+)
+def test_unmarshal_object(swagger_spec, object_spec, value, expected):
+    assert unmarshal_schema_object(swagger_spec, object_spec, value) == expected
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        {'id': None, 'created': '2020-01-02'},
+        {'id': 1, 'created': '2020-01-02', 'dates': 'not-a-list'},
+        {'id': 1, 'created': '2020-01-02', 'additional': None},
+        'not-a-dict',
+    ],
+)
+def test_unmarshal_object_raises_on_invalid_values(swagger_spec, object_spec, value):
+    with pytest.raises(SwaggerMappingError):
+        unmarshal_schema_object(swagger_spec, object_spec, value)
+
+
+def test_unmarshal_object_do_not_include_missing_properties(swagger_spec, object_spec):
+    swagger_spec.config['include_missing_properties'] = False
+    assert unmarshal_schema_object(swagger_spec, object_spec, {'id': 1, 'created': '2020-01-02'}) == {
+        'id': 1, 'created': datetime.date(2020, 1, 2),
+    }
+
+
+@pytest.mark.parametrize('internally_dereference_refs', [True, False])
+def test_unmarshal_models_is_equivalent_to_partial_backend(petstore_dict, petstore_abspath, internally_dereference_refs):
+    value = {
+        'id': 1,
+        'name': 'Fido',
+        'photoUrls': ['wagtail.png'],
+        'category': {'id': 200, 'name': 'friendly'},
+        'tags': [{'id': 99, 'name': 'mini'}],
+        'additional': 'property',
+    }
+
+    results = []
+    for unmarshal_backend in ('partial', 'codegen'):
+        petstore_spec = Spec.from_dict(
+            petstore_dict,
+            origin_url=get_url(petstore_abspath),
+            config={
+                'unmarshal_backend': unmarshal_backend,
+                'internally_dereference_refs': internally_dereference_refs,
+            },
+        )
+        pet = unmarshal_schema_object(petstore_spec, petstore_spec._internal_spec_dict['definitions']['Pet'], value)
+        assert isinstance(pet, petstore_spec.definitions['Pet'])
+        assert isinstance(pet.category, petstore_spec.definitions['Category'])
+        results.append(pet._as_dict())
+
+    assert results[0] == results[1]
+
+
+def test_polymorphic_schemas_are_not_compiled(polymorphic_dict):
+    polymorphic_spec = Spec.from_dict(polymorphic_dict, config={'unmarshal_backend': 'codegen'})
+    unmarshaling_method = _get_unmarshaling_method(
+        swagger_spec=polymorphic_spec,
+        object_schema=polymorphic_spec.spec_dict['definitions']['GenericPet'],
+    )
+    assert not hasattr(unmarshaling_method, '__source__')
+
+    dog = unmarshal_schema_object(
+        polymorphic_spec,
+        polymorphic_spec.spec_dict['definitions']['GenericPet'],
+        {'name': 'Fido', 'type': 'Dog', 'birth_date': '2017-03-09'},
+    )
+    assert isinstance(dog, polymorphic_spec.definitions['Dog'])
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from bravado_core.exception import SwaggerMappingError
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
+from bravado_core.unmarshal import validate_and_unmarshal_schema_object
+from bravado_core.validate import validate_schema_object
+
+
+@pytest.fixture
+def object_spec():
+    return {
+        'type': 'object',
+        'required': ['id'],
+        'properties': {
+            'id': {'type': 'integer', 'minimum': 1},
+            'created': {'type': 'string', 'format': 'date'},
+            'nickname': {'type': 'string', 'x-nullable': True},
+            'dates': {'type': 'array', 'items': {'type': 'string', 'format': 'date'}, 'maxItems': 2},
+            'node': {'$ref': '#/definitions/Node'},
+            'untyped': {'properties': {'a': {'type': 'string'}}},
+        },
+        'additionalProperties': {'type': 'integer'},
+    }
+
+
+@pytest.fixture
+def swagger_spec(minimal_swagger_dict, node_spec):
+    minimal_swagger_dict['definitions']['Node'] = node_spec
+    return Spec.from_dict(minimal_swagger_dict, config={'use_models': False})
+
+
+def _validate_then_unmarshal(swagger_spec, schema, value):
+    try:
+        validate_schema_object(swagger_spec, schema, value)
+        return unmarshal_schema_object(swagger_spec, schema, value)
+    except (ValidationError, SwaggerMappingError) as e:
+        return type(e), str(e)
+
+
+def _validate_and_unmarshal(swagger_spec, schema, value):
+    try:
+        return validate_and_unmarshal_schema_object(swagger_spec, schema, value)
+    except (ValidationError, SwaggerMappingError) as e:
+        return type(e), str(e)
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        {'id': 1},
+        {'id': 1, 'created': '2020-01-02', 'nickname': None, 'dates': ['2020-01-03'], 'extra': 1},
+        {'id': 1, 'node': {'name': 'a', 'child': {'name': 'b', 'date': '2020-01-02'}}},
+        {'id': 1, 'untyped': {'a': 'b'}},
+        {},
+        {'id': 0},
+        {'id': 1, 'created': 'not-a-date'},
+        {'id': 1, 'created': None},
+        {'id': 1, 'dates': ['2020-01-03', 'not-a-date']},
+        {'id': 1, 'dates': ['2020-01-03', '2020-01-04', '2020-01-05']},
+        {'id': 1, 'node': {'name': 'a', 'child': {'date': '2020-01-02'}}},
+        {'id': 1, 'untyped': {'a': 1}},
+        {'id': 1, 'extra': 'not-an-integer'},
+        'not-an-object',
+        None,
+    ],
+)
+def test_validate_and_unmarshal_is_equivalent_to_validate_then_unmarshal(swagger_spec, object_spec, value):
+    assert _validate_and_unmarshal(swagger_spec, object_spec, value) == \
+        _validate_then_unmarshal(swagger_spec, object_spec, value)
+
+
+def test_validation_errors_have_precedence_over_unmarshaling_errors(swagger_spec):
+    swagger_spec.config['default_type_to_object'] = True
+    array_spec = {'type': 'array', 'items': {'properties': {'id': {'type': 'integer'}}}}
+    value = ['not-an-object', {'id': 'not-an-integer'}]
+
+    # Items without type are unmarshaled as objects, but jsonschema does not validate their type
+    with pytest.raises(SwaggerMappingError):
+        unmarshal_schema_object(swagger_spec, array_spec, value)
+    with pytest.raises(ValidationError) as excinfo:
+        validate_and_unmarshal_schema_object(swagger_spec, array_spec, value)
+    assert list(excinfo.value.path) == [1, 'id']
+
+
+def test_validate_and_unmarshal_models(petstore_spec):
+    pet_spec = petstore_spec.spec_dict['definitions']['Pet']
+    pet = validate_and_unmarshal_schema_object(
+        petstore_spec,
+        pet_spec,
+        {'id': 1, 'name': 'Fido', 'photoUrls': [], 'category': {'id': 200, 'name': 'friendly'}},
+    )
+    assert isinstance(pet, petstore_spec.definitions['Pet'])
+    assert isinstance(pet.category, petstore_spec.definitions['Category'])
+
+    with pytest.raises(ValidationError):
+        validate_and_unmarshal_schema_object(petstore_spec, pet_spec, {'id': 1, 'photoUrls': []})
+
+
+def test_validate_and_unmarshal_polymorphic_models(polymorphic_spec):
+    pet_list_spec = polymorphic_spec.spec_dict['definitions']['PetList']
+    pet_list = validate_and_unmarshal_schema_object(
+        polymorphic_spec,
+        pet_list_spec,
+        {'number_of_pets': 1, 'list': [{'name': 'a dog name', 'type': 'Dog', 'birth_date': '2017-03-09'}]},
+    )
+    assert isinstance(pet_list.list[0], polymorphic_spec.definitions['Dog'])
+    assert pet_list.list[0].birth_date == datetime.date(2017, 3, 9)
+
+    with pytest.raises(ValidationError) as excinfo:
+        validate_and_unmarshal_schema_object(
+            polymorphic_spec,
+            pet_list_spec,
+            {'number_of_pets': 1, 'list': [{'name': 'a dog name', 'type': 'Dog'}]},
+        )
+    assert excinfo.value.message == '\'birth_date\' is a required property'
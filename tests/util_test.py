@@ -1,14 +1,23 @@
 # -*- coding: utf-8 -*-
+import gc
+import threading
+import weakref
 from inspect import getcallargs
 
 import mock
 import pytest
 
+from bravado_core.marshal import marshal_schema_object
+from bravado_core.spec import Spec
+from bravado_core.unmarshal import unmarshal_schema_object
 from bravado_core.util import AliasKeyDict
 from bravado_core.util import cached_property
+from bravado_core.util import CacheInfo
 from bravado_core.util import determine_object_type
 from bravado_core.util import lazy_class_attribute
 from bravado_core.util import memoize_by_id
+from bravado_core.util import MemoizeCache
+from bravado_core.util import MemoizeCacheRegistry
 from bravado_core.util import ObjectType
 from bravado_core.util import RecursiveCallException
 from bravado_core.util import sanitize_name
@@ -76,6 +85,22 @@ def test_memoize_by_id_decorator_recursive_call():
     assert calls == [mock.sentinel.A]
 
 
+def test_memoize_by_id_decorator_does_not_cache_exceptions():
+    calls = []
+
+    @memoize_by_id
+    def function(a):
+        calls.append(a)
+        raise ValueError()
+
+    for _ in range(2):
+        # The second call is expected to raise ValueError and not RecursiveCallException
+        with pytest.raises(ValueError):
+            function(mock.sentinel.A)
+    assert calls == [mock.sentinel.A, mock.sentinel.A]
+    assert function.cache == {}
+
+
 def test_memoize_by_id_decorator():
     calls = []
 
@@ -86,22 +111,22 @@ def test_memoize_by_id_decorator():
 
     assert decorated_function(1) == id(1) + id(None)
     assert decorated_function.cache == {
-        (('a', id(1)), ('b', id(None))): id(1) + id(None),
+        (id(1), id(None)): id(1) + id(None),
     }
     assert calls == [[1, None]]
 
     assert decorated_function(2, 3) == id(2) + id(3)
     assert decorated_function.cache == {
-        (('a', id(1)), ('b', id(None))): id(1) + id(None),
-        (('a', id(2)), ('b', id(3))): id(2) + id(3),
+        (id(1), id(None)): id(1) + id(None),
+        (id(2), id(3)): id(2) + id(3),
     }
     assert calls == [[1, None], [2, 3]]
 
     # Calling the decorated method with known arguments will not call the inner method
     assert decorated_function(1) == id(1) + id(None)
     assert decorated_function.cache == {
-        (('a', id(1)), ('b', id(None))): id(1) + id(None),
-        (('a', id(2)), ('b', id(3))): id(2) + id(3),
+        (id(1), id(None)): id(1) + id(None),
+        (id(2), id(3)): id(2) + id(3),
     }
     assert calls == [[1, None], [2, 3]]
 
@@ -109,13 +134,13 @@ def test_memoize_by_id_decorator():
 
     assert decorated_function(1) == id(1) + id(None)
     assert decorated_function.cache == {
-        (('a', id(1)), ('b', id(None))): id(1) + id(None),
+        (id(1), id(None)): id(1) + id(None),
     }
     assert calls == [[1, None], [2, 3], [1, None]]
 
 
 @mock.patch('bravado_core.util.inspect.getcallargs', wraps=getcallargs)
-def test_memoize_by_id_do_not_use_inspect_if_only_kwargs_are_provided(mock_getcallargs):
+def test_memoize_by_id_do_not_use_inspect_for_valid_calls(mock_getcallargs):
     calls = []
 
     def function(a, b=None):
@@ -125,18 +150,220 @@ def test_memoize_by_id_do_not_use_inspect_if_only_kwargs_are_provided(mock_getca
     decorated_function = memoize_by_id(function)
 
     assert decorated_function(1) == id(1) + id(None)
-    mock_getcallargs.assert_called_once_with(function, 1)
+    assert decorated_function(a=1) == id(1) + id(None)
+    assert decorated_function(1, b=None) == id(1) + id(None)
+    assert decorated_function(b=None, a=1) == id(1) + id(None)
+    assert not mock_getcallargs.called
     assert calls == [[1, None]]
     assert decorated_function.cache == {
-        (('a', id(1)), ('b', id(None))): id(1) + id(None),
+        (id(1), id(None)): id(1) + id(None),
     }
-    mock_getcallargs.reset_mock()
 
-    assert decorated_function(a=1) == id(1) + id(None)
-    assert not mock_getcallargs.called
+
+@pytest.mark.parametrize(
+    'args, kwargs',
+    [
+        ((), {}),
+        ((1, 2, 3), {}),
+        ((1,), {'a': 1}),
+        ((), {'b': 1}),
+        ((1,), {'c': 1}),
+    ],
+)
+def test_memoize_by_id_raises_type_error_on_invalid_calls(args, kwargs):
+    @memoize_by_id
+    def function(a, b=None):
+        return a  # pragma: no cover
+
+    with pytest.raises(TypeError):
+        function(*args, **kwargs)
+
+
+def test_memoize_by_id_with_variadic_arguments():
+    calls = []
+
+    def function(a, *args):
+        calls.append([a, args])
+        return a
+
+    decorated_function = memoize_by_id(function)
+
+    assert decorated_function(1) == 1
+    assert decorated_function(1) == 1
+    assert calls == [[1, ()]]
     assert decorated_function.cache == {
-        (('a', id(1)), ('b', id(None))): id(1) + id(None),
+        (('a', id(1)), ('args', id(()))): 1,
+    }
+
+
+def test_memoize_by_id_cache_info():
+    @memoize_by_id
+    def function(a):
+        return a
+
+    function(1)
+    function(1)
+    function(2)
+    assert function.cache_info() == CacheInfo(hits=1, misses=2, maxsize=None, currsize=2)
+
+    function.cache_clear()
+    assert function.cache_info() == CacheInfo(hits=0, misses=0, maxsize=None, currsize=0)
+
+
+def test_memoize_by_id_with_maxsize_evicts_least_recently_used_values():
+    calls = []
+
+    @memoize_by_id(maxsize=2)
+    def function(a):
+        calls.append(a)
+        return a
+
+    a, b, c = object(), object(), object()
+    function(a)
+    function(b)
+    function(a)
+    function(c)  # b is the least recently used value
+    assert function.cache == {(id(a),): a, (id(c),): c}
+
+    function(b)
+    assert calls == [a, b, c, b]
+    assert function.cache_info() == CacheInfo(hits=1, misses=4, maxsize=2, currsize=2)
+
+
+def test_memoize_by_id_references_the_arguments_of_cached_values():
+    @memoize_by_id(maxsize=10)
+    def function(a):
+        return id(a)
+
+    function([])
+    # The argument is referenced by the cache, so its id cannot be reused by other objects
+    assert function([]) != list(function.cache.values())[0]
+
+
+def test_memoize_by_id_unbounded_function_cache_does_not_reference_the_arguments():
+    @memoize_by_id
+    def function(a):
+        return a.value
+
+    argument = _Argument()
+    argument_ref = weakref.ref(argument)
+    function(argument)
+    del argument
+    gc.collect()
+    assert argument_ref() is None
+
+
+def test_memoize_by_id_scoped_caches_are_released_with_the_scope():
+    @memoize_by_id
+    def function(swagger_spec, a):
+        return a
+
+    scope = _Scope()
+    scope_ref = weakref.ref(scope)
+    argument = _Argument()
+    argument_ref = weakref.ref(argument)
+    function(scope, argument)
+    del scope, argument
+    gc.collect()
+    assert scope_ref() is None
+    assert argument_ref() is None
+
+
+def test_discarded_spec_is_garbage_collected(minimal_swagger_dict):
+    minimal_swagger_dict['definitions'] = {
+        'Pet': {'type': 'object', 'properties': {'name': {'type': 'string'}}},
     }
+    swagger_spec = Spec.from_dict(minimal_swagger_dict)
+    pet_spec = swagger_spec.spec_dict['definitions']['Pet']
+    unmarshal_schema_object(swagger_spec, pet_spec, {'name': 'Lassie'})
+    marshal_schema_object(swagger_spec, pet_spec, {'name': 'Lassie'})
+    spec_ref = weakref.ref(swagger_spec)
+    del swagger_spec, pet_spec
+    gc.collect()
+    assert spec_ref() is None
+
+
+class _Argument(object):
+    value = 1
+
+
+class _Scope(object):
+    def __init__(self, maxsize=None):
+        self.compiled = MemoizeCacheRegistry(maxsize=maxsize)
+
+
+def test_memoize_by_id_caches_values_in_the_swagger_spec_registry():
+    @memoize_by_id
+    def function(swagger_spec, a):
+        return a
+
+    scope = _Scope(maxsize=10)
+    function(scope, 1)
+    function(swagger_spec=scope, a=1)
+
+    assert function.cache == {}
+    assert isinstance(scope.compiled[function], MemoizeCache)
+    assert scope.compiled[function] == {(id(scope), id(1)): 1}
+    assert function.cache_info(scope) == CacheInfo(hits=1, misses=1, maxsize=10, currsize=1)
+
+    # Without registry the function cache is used
+    function(mock.sentinel.scope, 1)
+    assert function.cache == {(id(mock.sentinel.scope), id(1)): 1}
+
+    function.cache_clear(scope)
+    assert scope.compiled[function] == {}
+
+
+def test_memoize_by_id_bounded_cache_is_thread_safe():
+    @memoize_by_id
+    def function(swagger_spec, a):
+        return a
+
+    scope = _Scope(maxsize=2)
+    arguments = list(range(10))
+    errors = []
+
+    def run():
+        try:
+            for _ in range(2000):
+                for a in arguments:
+                    assert function(scope, a) == a
+        except Exception as e:  # pragma: no cover  # only on failures
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(scope.compiled[function]) == 2
+
+
+def test_memoize_by_id_concurrent_calls_are_not_recursive():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @memoize_by_id
+    def function(a):
+        calls.append(a)
+        if len(calls) == 1:
+            started.set()
+            release.wait(10)
+        return a
+
+    thread = threading.Thread(target=function, args=(1,))
+    thread.start()
+    started.wait(10)
+    try:
+        # The same call is in progress in the other thread, but this is not a recursive call
+        assert function(1) == 1
+    finally:
+        release.set()
+        thread.join()
+    assert calls == [1, 1]
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from bravado_core.spec import Spec
+from bravado_core.validate import _get_validation_closure
+from bravado_core.validate import _get_validator
+from bravado_core.validate import validate_object
+from bravado_core.validate import validate_primitive
+from bravado_core.validate import validate_schema_object
+
+
+@pytest.fixture
+def object_spec():
+    return {
+        'type': 'object',
+        'required': ['id'],
+        'properties': {
+            'id': {'type': 'integer', 'minimum': 1},
+            'name': {'type': 'string', 'minLength': 1},
+            'nickname': {'type': 'string', 'x-nullable': True},
+            'status': {'type': 'string', 'enum': ['available', 'sold']},
+            'created': {'type': 'string', 'format': 'date'},
+            'tags': {'type': 'array', 'items': {'type': 'string'}, 'uniqueItems': True},
+            'node': {'$ref': '#/definitions/Node'},
+        },
+        'additionalProperties': False,
+    }
+
+
+@pytest.fixture
+def swagger_spec(minimal_swagger_dict, node_spec):
+    minimal_swagger_dict['definitions']['Node'] = node_spec
+    return Spec.from_dict(minimal_swagger_dict, config={'validate_backend': 'compiled'})
+
+
+def _validation_error_message(swagger_spec, schema, value, validate_backend):
+    swagger_spec.config['validate_backend'] = validate_backend
+    try:
+        validate_schema_object(swagger_spec, schema, value)
+    except ValidationError as e:
+        return e.message
+    return None
+
+
+@pytest.mark.parametrize(
+    'value, is_valid',
+    [
+        ({'id': 1}, True),
+        ({'id': 1, 'name': 'a', 'nickname': None, 'status': 'sold', 'created': '2020-01-02', 'tags': ['a']}, True),
+        ({'id': 1, 'node': {'name': 'a', 'child': {'name': 'b', 'date': '2020-01-02'}}}, True),
+        ({}, False),
+        ({'id': True}, False),
+        ({'id': 0}, False),
+        ({'id': 1, 'name': ''}, False),
+        ({'id': 1, 'name': None}, False),
+        ({'id': 1, 'status': 'unknown'}, False),
+        ({'id': 1, 'created': 'not-a-date'}, False),
+        ({'id': 1, 'tags': ['a', 'a']}, False),
+        ({'id': 1, 'tags': [1]}, False),
+        ({'id': 1, 'node': {'name': 'a', 'child': {'date': '2020-01-02'}}}, False),
+        ({'id': 1, 'additional': 'property'}, False),
+        ('not-an-object', False),
+    ],
+)
+def test_compiled_backend_is_equivalent_to_jsonschema(swagger_spec, object_spec, value, is_valid):
+    assert _get_validation_closure(swagger_spec, object_spec)(value) is is_valid
+    assert _validation_error_message(swagger_spec, object_spec, value, 'compiled') == \
+        _validation_error_message(swagger_spec, object_spec, value, 'jsonschema')
+
+
+@pytest.mark.parametrize(
+    'param_spec, value, is_valid',
+    [
+        ({'name': 'p', 'in': 'query', 'type': 'integer', 'required': False}, None, True),
+        ({'name': 'p', 'in': 'query', 'type': 'integer', 'required': True}, None, False),
+        ({'name': 'p', 'in': 'query', 'type': 'string', 'format': 'date', 'required': False}, None, True),
+        ({'name': 'p', 'in': 'query', 'type': 'string', 'enum': ['a'], 'required': False}, None, True),
+        ({'name': 'p', 'in': 'query', 'type': 'string', 'enum': ['a'], 'required': True}, 'b', False),
+    ],
+)
+def test_compiled_backend_honors_parameter_semantics(swagger_spec, param_spec, value, is_valid):
+    assert _get_validation_closure(swagger_spec, param_spec)(value) is is_valid
+    if is_valid:
+        validate_primitive(swagger_spec, param_spec, value)
+    else:
+        with pytest.raises(ValidationError) as excinfo:
+            validate_primitive(swagger_spec, param_spec, value)
+        assert excinfo.value.message == _validation_error_message(swagger_spec, param_spec, value, 'jsonschema')
+
+
+@pytest.mark.parametrize(
+    'value, expected_message',
+    [
+        ({'name': 'a dog name', 'type': 'Dog', 'birth_date': '2017-03-09'}, None),
+        ({'name': 'a dog name', 'type': 'Dog'}, '\'birth_date\' is a required property'),
+        ({'name': 'a bird name', 'type': 'Bird'}, 'discriminated schema \'Bird\' must inherit from \'GenericPet\''),
+    ],
+)
+def test_compiled_backend_honors_discriminator(polymorphic_dict, value, expected_message):
+    polymorphic_spec = Spec.from_dict(polymorphic_dict, config={'validate_backend': 'compiled'})
+    generic_pet_spec = polymorphic_spec.spec_dict['definitions']['GenericPet']
+    assert _validation_error_message(polymorphic_spec, generic_pet_spec, value, 'compiled') == expected_message
+
+
+def test_validators_are_reused(swagger_spec, object_spec):
+    for validate_backend in ('jsonschema', 'compiled'):
+        swagger_spec.config['validate_backend'] = validate_backend
+        with pytest.raises(ValidationError):
+            validate_object(swagger_spec, object_spec, {})
+    assert _get_validator(swagger_spec, object_spec) is _get_validator(swagger_spec, object_spec)
+    assert len([key for key in swagger_spec.compiled[_get_validator] if key[1] == id(object_spec)]) == 1
+
+
+@pytest.mark.parametrize(
+    'items_spec',
+    [
+        {'type': 'number', 'minimum': 0, 'maximum': 10},
+        {'type': 'integer', 'format': 'int64', 'minimum': 0, 'exclusiveMinimum': True},
+        {'type': 'number', 'format': 'double', 'maximum': 10, 'exclusiveMaximum': True, 'x-nullable': True},
+        {'type': 'integer', 'multipleOf': 2},
+    ],
+)
+@pytest.mark.parametrize(
+    'value',
+    [
+        [],
+        [1, 2, 3],
+        [0.5, 9.5],
+        [0, 10],
+        [-1, 5],
+        [5, 11],
+        [1, None],
+        [1, True],
+        [1, '2'],
+        [float('nan'), 200],
+        [float('nan'), -1],
+        [5, float('nan')],
+    ],
+)
+def test_compiled_backend_numeric_items(swagger_spec, items_spec, value):
+    array_spec = {'type': 'array', 'items': items_spec}
+    assert _validation_error_message(swagger_spec, array_spec, value, 'compiled') == \
+        _validation_error_message(swagger_spec, array_spec, value, 'jsonschema')